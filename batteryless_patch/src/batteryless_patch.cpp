@@ -79,17 +79,21 @@ private:
             return false;
         }
 
+        // Only the bytes of the file are read, the padding of a misaligned ROM is already 0xFF.
+        rom_data.resize(MAX_ROM_SIZE, 0xFF);
+        file.seekg(0);
+        file.read(reinterpret_cast<char*>(rom_data.data()), rom_size);
+        if (file.fail()) {
+            return false;
+        }
+
         if (rom_size & 0x3ffff) {
             std::cout << "ROM has been trimmed and is misaligned. Padding to 256KB alignment" << std::endl;
             rom_size &= ~0x3ffff;
             rom_size += 0x40000;
         }
 
-        rom_data.resize(MAX_ROM_SIZE, 0xFF);
-        file.seekg(0);
-        file.read(reinterpret_cast<char*>(rom_data.data()), rom_size);
-
-        return !file.fail();
+        return true;
     }
 
     bool save_rom(const std::string& out_path) {
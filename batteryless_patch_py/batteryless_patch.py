@@ -1,6 +1,7 @@
 import os
 import struct
 from .payload_bin import payload_bin
+from utils import BufferPool, PatchPlan
 
 ORIGINAL_ENTRYPOINT_ADDR = 0
 FLUSH_MODE = 1
@@ -12,6 +13,7 @@ WRITE_FLASH_PATCHED = 6
 WRITE_EEPROM_V111_POSTHOOK = 7
 
 signature = b"<3 from Maniac"
+max_rom_size = 0x02000000
 
 thumb_branch_thunk = bytes([0x00, 0x4B, 0x18, 0x47])
 arm_branch_thunk = bytes([0x00, 0x30, 0x9F, 0xE5, 0x13, 0xFF, 0x2F, 0xE1])
@@ -183,79 +185,110 @@ write_eepromv111_signature = bytes(
 )
 
 
-def memfind(haystack, needle, stride=4):
-    """find needle byte array in haystack"""
-    needle_len = len(needle)
-    for i in range(0, len(haystack) - needle_len + 1, stride):
-        if haystack[i : i + needle_len] == needle:
-            return i
-    return None
+# Every write function the patch hooks, the patch plan records their offsets.
+write_signatures = (
+    write_sram_signature,
+    write_sram2_signature,
+    write_sram_ram_signature,
+    write_eeprom_signature,
+    write_flash_signature,
+    write_flash2_signature,
+    write_flash3_signature,
+    write_eepromv111_signature,
+)
 
 
-def patch(rom_path: str, out_path: str, auto_mode: bool):
-    """Main patch function"""
+def _check_rom(rom_path: str) -> bool:
     if not rom_path.lower().endswith(".gba"):
         print("File does not have .gba extension.")
-        return 1
+        return False
 
-        # Read ROM file
     try:
-        with open(rom_path, "rb") as f:
-            rom = bytearray(f.read())
-    except IOError as e:
+        # Check ROM size
+        if os.path.getsize(rom_path) > max_rom_size:
+            print("ROM too large - not a GBA ROM?")
+            return False
+    except OSError as e:
         print(f"Could not open input file: {e}")
+        return False
+    return True
+
+
+def analyse(rom_path: str) -> PatchPlan.PatchPlan | None:
+    """The patch plan of the ROM for apply_plan, None if it can't be patched."""
+    if not _check_rom(rom_path):
+        return None
+    with BufferPool.pool.acquire() as buffer:
+        try:
+            return PatchPlan.load(buffer, rom_path, write_signatures)
+        except IOError as e:
+            print(f"Could not open input file: {e}")
+            return None
+
+
+def apply_plan(plan: PatchPlan.PatchPlan, rom_path: str, out_path: str, auto_mode: bool):
+    """Patches the ROM of the plan without searching it again, the same as patch."""
+    if not _check_rom(rom_path):
         return 1
+    with BufferPool.pool.acquire() as buffer:
+        try:
+            _, digest = PatchPlan.read(buffer, rom_path)
+        except IOError as e:
+            print(f"Could not open input file: {e}")
+            return 1
+        if digest != plan.digest:
+            print("The ROM has changed since it was analysed.")
+            return 1
+        return _apply(buffer, plan, out_path, auto_mode)
 
-    romsize = len(rom)
-    max_rom_size = 0x02000000
 
-    # Check ROM size
-    if romsize > max_rom_size:
-        print("ROM too large - not a GBA ROM?")
+def patch(rom_path: str, out_path: str, auto_mode: bool):
+    """Main patch function"""
+    if not _check_rom(rom_path):
         return 1
 
-    # Handle alignment
-    if romsize & 0x3FFFF:
+    # The ROM is patched in place in a pooled buffer, rom[romsize:] is not part of it.
+    with BufferPool.pool.acquire() as buffer:
+        try:
+            plan = PatchPlan.load(buffer, rom_path, write_signatures)
+        except IOError as e:
+            print(f"Could not open input file: {e}")
+            return 1
+        return _apply(buffer, plan, out_path, auto_mode)
+
+
+def _apply(buffer: BufferPool.RomBuffer, plan: PatchPlan.PatchPlan, out_path: str, auto_mode: bool):
+    # The buffer holds the ROM of the plan, padded to 256 KiB.
+    rom = buffer.arena
+    romsize = buffer.size
+
+    if plan.size & 0x3FFFF:
         print("ROM has been trimmed and is misaligned. Padding to 256KB alignment")
-        romsize = (romsize & ~0x3FFFF) + 0x40000
-        rom.extend(b"\xff" * (romsize - len(rom)))
 
     # Check if already patched
-    if memfind(rom, signature) is not None:
+    if plan.patched:
         print("Signature found. ROM already patched!")
         return 1
 
     # Patch IRQ handler references
-    old_irq_addr = bytes([0xFC, 0x7F, 0x00, 0x03])
     new_irq_addr = bytes([0xF4, 0x7F, 0x00, 0x03])
 
-    found_irq = 0
-    pos = 0
-    while True:
-        idx = memfind(rom[pos:], old_irq_addr)
-        if idx is None:
-            break
-        idx += pos
-        found_irq += 1
+    for idx in plan.irq_references:
         print(f"Found a reference to the IRQ handler address at {hex(idx)}, patching")
         rom[idx : idx + 4] = new_irq_addr
-        pos = idx + 4
 
-    if not found_irq:
+    if not plan.irq_references:
         print(
             "Could not find any reference to the IRQ handler. Has the ROM already been patched?"
         )
         return 1
 
     # Find payload location
-    payload_base = None
-    for base in range(romsize - 0x40000 - len(payload_bin), -1, -0x40000):
-        region = rom[base : base + 0x40000 + len(payload_bin)]
-        if all(b == 0 for b in region) or all(b == 0xFF for b in region):
-            payload_base = base
-            break
-
-    if payload_base is None:
+    payload_base = plan.free_space_index().find_last_blank(
+        0x40000 + len(payload_bin), 0x40000, romsize - 0x40000 - len(payload_bin)
+    )
+
+    if payload_base == -1:
         print("ROM too small to install payload.")
         if romsize + 0x80000 > max_rom_size:
             print("ROM already max size. Cannot expand. Cannot install payload")
@@ -263,7 +296,7 @@ def patch(rom_path: str, out_path: str, auto_mode: bool):
         else:
             print("Expanding ROM")
             romsize += 0x80000
-            rom.extend(b"\xff" * 0x80000)
+            buffer.resize(romsize)
             payload_base = romsize - 0x40000 - len(payload_bin)
 
     print(
@@ -350,11 +383,10 @@ def patch(rom_path: str, out_path: str, auto_mode: bool):
     # Process all signatures
     for sig, handler, offset, size in signatures:
         pos = 0
-        while True:
-            idx = memfind(rom[pos:], sig)
-            if idx is None:
-                break
-            idx += pos
+        for idx in plan.write_function_offsets(sig, 4):
+            # Skip overlapping matches and those overwritten by an earlier hook.
+            if idx < pos or not rom.startswith(sig, idx):
+                continue
             found_write_location = True
             print(f"Found write function at offset {hex(idx)}, patching")
 
@@ -366,11 +398,9 @@ def patch(rom_path: str, out_path: str, auto_mode: bool):
 
     # Special handling for EEPROM V111
     pos = 0
-    while True:
-        idx = memfind(rom[pos:], write_eepromv111_signature)
-        if idx is None:
-            break
-        idx += pos
+    for idx in plan.write_function_offsets(write_eepromv111_signature, 4):
+        if idx < pos or not rom.startswith(write_eepromv111_signature, idx):
+            continue
         found_write_location = True
         print(f"Found EEPROM V111 function at offset {hex(idx)}, patching")
 
@@ -395,8 +425,7 @@ def patch(rom_path: str, out_path: str, auto_mode: bool):
 
     # Write output file
     try:
-        with open(out_path, "wb") as f:
-            f.write(rom)
+        buffer.write(out_path)
         print(f"Patched successfully. Changes written to {out_path}")
     except IOError as e:
         print(f"Could not open output file: {e}")
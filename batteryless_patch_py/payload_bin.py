@@ -1,2164 +1,20 @@
-payload_bin = bytes(
-    [
-        0xC0,
-        0x00,
-        0x00,
-        0x08,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x02,
-        0x00,
-        0x54,
-        0x00,
-        0x00,
-        0x00,
-        0xCD,
-        0x00,
-        0x00,
-        0x00,
-        0x1D,
-        0x01,
-        0x00,
-        0x00,
-        0xB9,
-        0x00,
-        0x00,
-        0x00,
-        0x47,
-        0x01,
-        0x00,
-        0x00,
-        0x1F,
-        0xB4,
-        0x00,
-        0xB5,
-        0x0A,
-        0x4C,
-        0x20,
-        0x88,
-        0x01,
-        0xB4,
-        0x00,
-        0x20,
-        0x20,
-        0x80,
-        0x73,
-        0xA0,
-        0xFE,
-        0x46,
-        0x00,
-        0x47,
-        0x01,
-        0xBC,
-        0x20,
-        0x80,
-        0x01,
-        0xBC,
-        0x86,
-        0x46,
-        0x1F,
-        0xBC,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x70,
-        0x47,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x08,
-        0x02,
-        0x00,
-        0x04,
-        0x01,
-        0x03,
-        0xA0,
-        0xE3,
-        0x5C,
-        0x10,
-        0x1F,
-        0xE5,
-        0x00,
-        0x00,
-        0x51,
-        0xE3,
-        0x19,
-        0x1E,
-        0x8F,
-        0xE2,
-        0xF8,
-        0x10,
-        0x8F,
-        0x12,
-        0x04,
-        0x10,
-        0x00,
-        0xE5,
-        0xFC,
-        0x00,
-        0x8F,
-        0xE2,
-        0x07,
-        0x0C,
-        0x80,
-        0xE2,
-        0x0E,
-        0x14,
-        0xA0,
-        0xE3,
-        0x78,
-        0x20,
-        0x1F,
-        0xE5,
-        0x01,
-        0x20,
-        0x82,
-        0xE0,
-        0x09,
-        0x34,
-        0xA0,
-        0xE3,
-        0x80,
-        0x40,
-        0xA0,
-        0xE3,
-        0x03,
-        0x40,
-        0xC1,
-        0xE5,
-        0x21,
-        0x48,
-        0xA0,
-        0xE1,
-        0x01,
-        0x40,
-        0x04,
-        0xE2,
-        0xB0,
-        0x40,
-        0xC3,
-        0xE1,
-        0x00,
-        0x00,
-        0xA0,
-        0xE1,
-        0x01,
-        0x40,
-        0xD0,
-        0xE4,
-        0x01,
-        0x40,
-        0xC1,
-        0xE4,
-        0x02,
-        0x00,
-        0x51,
-        0xE1,
-        0xF7,
-        0xFF,
-        0xFF,
-        0x3A,
-        0x00,
-        0x40,
-        0xA0,
-        0xE3,
-        0xB0,
-        0x40,
-        0xC3,
-        0xE1,
-        0xBC,
-        0xF0,
-        0x1F,
-        0xE5,
-        0x00,
-        0x03,
-        0x0E,
-        0x22,
-        0x12,
-        0x06,
-        0x10,
-        0x43,
-        0x01,
-        0x22,
-        0x12,
-        0x03,
-        0x03,
-        0x1C,
-        0x08,
-        0x1C,
-        0x19,
-        0x1C,
-        0xFF,
-        0xE7,
-        0x00,
-        0xB5,
-        0xF0,
-        0xB4,
-        0x11,
-        0x4E,
-        0x37,
-        0x88,
-        0x00,
-        0x23,
-        0x33,
-        0x80,
-        0x09,
-        0x24,
-        0x24,
-        0x06,
-        0x0D,
-        0x0C,
-        0x01,
-        0x23,
-        0x1D,
-        0x40,
-        0x25,
-        0x80,
-        0x12,
-        0x18,
-        0x04,
-        0x78,
-        0x0D,
-        0x78,
-        0xAC,
-        0x42,
-        0x01,
-        0xD0,
-        0x01,
-        0x23,
-        0x0C,
-        0x70,
-        0x01,
-        0x30,
-        0x01,
-        0x31,
-        0x90,
-        0x42,
-        0xF5,
-        0xD3,
-        0x00,
-        0x2B,
-        0x06,
-        0xD0,
-        0x78,
-        0x46,
-        0xFE,
-        0x38,
-        0x00,
-        0x88,
-        0x00,
-        0x28,
-        0x01,
-        0xD1,
-        0x00,
-        0xF0,
-        0x22,
-        0xF8,
-        0x37,
-        0x80,
-        0x00,
-        0x20,
-        0xF0,
-        0xBC,
-        0x02,
-        0xBC,
-        0x08,
-        0x47,
-        0x00,
-        0x00,
-        0x08,
-        0x02,
-        0x00,
-        0x04,
-        0x10,
-        0xB5,
-        0x0A,
-        0x1C,
-        0x08,
-        0x32,
-        0x6B,
-        0x46,
-        0x0C,
-        0x78,
-        0x01,
-        0x31,
-        0x01,
-        0x3B,
-        0x1C,
-        0x70,
-        0x91,
-        0x42,
-        0xF9,
-        0xD1,
-        0x0E,
-        0x21,
-        0x09,
-        0x06,
-        0xC0,
-        0x00,
-        0x09,
-        0x18,
-        0x08,
-        0x22,
-        0x18,
-        0x1C,
-        0x9D,
-        0x46,
-        0xFF,
-        0xF7,
-        0xC5,
-        0xFF,
-        0x02,
-        0xB0,
-        0x10,
-        0xBD,
-        0x01,
-        0xB4,
-        0x00,
-        0xF0,
-        0x02,
-        0xF8,
-        0x01,
-        0xBC,
-        0x00,
-        0x47,
-        0x16,
-        0xA0,
-        0x04,
-        0x21,
-        0x09,
-        0x06,
-        0x10,
-        0x39,
-        0x66,
-        0x22,
-        0x4A,
-        0x81,
-        0xC8,
-        0x60,
-        0x4A,
-        0x82,
-        0x70,
-        0x47,
-        0x00,
-        0x00,
-        0x30,
-        0x31,
-        0x90,
-        0xE5,
-        0xF3,
-        0x00,
-        0x33,
-        0xE3,
-        0x0C,
-        0xF0,
-        0x10,
-        0x15,
-        0x01,
-        0x10,
-        0xA0,
-        0xE3,
-        0xB2,
-        0x10,
-        0xC0,
-        0xE1,
-        0x9F,
-        0x30,
-        0xA0,
-        0xE3,
-        0x03,
-        0xF0,
-        0x29,
-        0xE1,
-        0x04,
-        0xE0,
-        0x2D,
-        0xE5,
-        0x1C,
-        0x00,
-        0x00,
-        0xEB,
-        0x04,
-        0xE0,
-        0x9D,
-        0xE4,
-        0x92,
-        0x30,
-        0xA0,
-        0xE3,
-        0x03,
-        0xF0,
-        0x29,
-        0xE1,
-        0x01,
-        0x03,
-        0xA0,
-        0xE3,
-        0xB2,
-        0x00,
-        0xC0,
-        0xE1,
-        0x30,
-        0x31,
-        0x90,
-        0xE5,
-        0xF3,
-        0x00,
-        0x33,
-        0xE3,
-        0xFC,
-        0xFF,
-        0xFF,
-        0x0A,
-        0x0C,
-        0xF0,
-        0x10,
-        0xE5,
-        0x00,
-        0x12,
-        0x90,
-        0xE5,
-        0x01,
-        0x08,
-        0x11,
-        0xE3,
-        0x0C,
-        0xF0,
-        0x10,
-        0x05,
-        0xB6,
-        0x10,
-        0x50,
-        0xE1,
-        0x01,
-        0x10,
-        0x51,
-        0xE2,
-        0xB6,
-        0x10,
-        0x40,
-        0xE1,
-        0x0C,
-        0xF0,
-        0x10,
-        0x15,
-        0x9F,
-        0x30,
-        0xA0,
-        0xE3,
-        0x03,
-        0xF0,
-        0x29,
-        0xE1,
-        0x04,
-        0xE0,
-        0x2D,
-        0xE5,
-        0x08,
-        0x00,
-        0x00,
-        0xEB,
-        0x04,
-        0xE0,
-        0x9D,
-        0xE4,
-        0x92,
-        0x30,
-        0xA0,
-        0xE3,
-        0x03,
-        0xF0,
-        0x29,
-        0xE1,
-        0x01,
-        0x03,
-        0xA0,
-        0xE3,
-        0xB2,
-        0x00,
-        0xC0,
-        0xE1,
-        0x04,
-        0x10,
-        0x8F,
-        0xE2,
-        0x04,
-        0x10,
-        0x00,
-        0xE5,
-        0xFF,
-        0xFF,
-        0xFF,
-        0xEA,
-        0x0C,
-        0xF0,
-        0x10,
-        0xE5,
-        0x01,
-        0x03,
-        0xA0,
-        0xE3,
-        0xB0,
-        0x28,
-        0xD0,
-        0xE1,
-        0xB4,
-        0x38,
-        0xD0,
-        0xE1,
-        0x0C,
-        0x00,
-        0x2D,
-        0xE9,
-        0xB4,
-        0x08,
-        0xC0,
-        0xE1,
-        0xBA,
-        0x3B,
-        0xD0,
-        0xE1,
-        0x04,
-        0x30,
-        0x2D,
-        0xE5,
-        0xBA,
-        0x0B,
-        0xC0,
-        0xE1,
-        0xB6,
-        0x3C,
-        0xD0,
-        0xE1,
-        0x04,
-        0x30,
-        0x2D,
-        0xE5,
-        0xB6,
-        0x0C,
-        0xC0,
-        0xE1,
-        0xB2,
-        0x3D,
-        0xD0,
-        0xE1,
-        0x04,
-        0x30,
-        0x2D,
-        0xE5,
-        0xB2,
-        0x0D,
-        0xC0,
-        0xE1,
-        0xBE,
-        0x3D,
-        0xD0,
-        0xE1,
-        0x04,
-        0x30,
-        0x2D,
-        0xE5,
-        0xBE,
-        0x0D,
-        0xC0,
-        0xE1,
-        0x04,
-        0xE0,
-        0x2D,
-        0xE5,
-        0xF0,
-        0x00,
-        0x2D,
-        0xE9,
-        0x62,
-        0x4E,
-        0x8F,
-        0xE2,
-        0x00,
-        0x00,
-        0xA0,
-        0xE1,
-        0x02,
-        0x43,
-        0x44,
-        0xE2,
-        0x54,
-        0x52,
-        0x1F,
-        0xE5,
-        0x94,
-        0x60,
-        0x8F,
-        0xE2,
-        0x99,
-        0x7F,
-        0x4F,
-        0xE2,
-        0x0C,
-        0x00,
-        0xB6,
-        0xE8,
-        0x00,
-        0x00,
-        0x52,
-        0xE3,
-        0x12,
-        0x00,
-        0x00,
-        0x0A,
-        0x07,
-        0x20,
-        0x82,
-        0xE0,
-        0x07,
-        0x30,
-        0x83,
-        0xE0,
-        0x39,
-        0x00,
-        0x00,
-        0xEB,
-        0x00,
-        0x00,
-        0x50,
-        0xE3,
-        0x01,
-        0x00,
-        0x00,
-        0x1A,
-        0x10,
-        0x60,
-        0x86,
-        0xE2,
-        0xF5,
-        0xFF,
-        0xFF,
-        0xEA,
-        0x0C,
-        0x00,
-        0xB6,
-        0xE8,
-        0x04,
-        0x00,
-        0xA0,
-        0xE1,
-        0x05,
-        0x10,
-        0xA0,
-        0xE1,
-        0x07,
-        0x20,
-        0x82,
-        0xE0,
-        0x07,
-        0x30,
-        0x83,
-        0xE0,
-        0x2F,
-        0x00,
-        0x00,
-        0xEB,
-        0x0C,
-        0x00,
-        0xB6,
-        0xE8,
-        0x04,
-        0x00,
-        0xA0,
-        0xE1,
-        0x05,
-        0x10,
-        0xA0,
-        0xE1,
-        0x07,
-        0x20,
-        0x82,
-        0xE0,
-        0x07,
-        0x30,
-        0x83,
-        0xE0,
-        0x29,
-        0x00,
-        0x00,
-        0xEB,
-        0xF0,
-        0x00,
-        0xBD,
-        0xE8,
-        0x04,
-        0xE0,
-        0x9D,
-        0xE4,
-        0x01,
-        0x03,
-        0xA0,
-        0xE3,
-        0x04,
-        0x30,
-        0x9D,
-        0xE4,
-        0xBE,
-        0x3D,
-        0xC0,
-        0xE1,
-        0x04,
-        0x30,
-        0x9D,
-        0xE4,
-        0xB2,
-        0x3D,
-        0xC0,
-        0xE1,
-        0x04,
-        0x30,
-        0x9D,
-        0xE4,
-        0xB6,
-        0x3C,
-        0xC0,
-        0xE1,
-        0x04,
-        0x30,
-        0x9D,
-        0xE4,
-        0xBA,
-        0x3B,
-        0xC0,
-        0xE1,
-        0x0C,
-        0x00,
-        0xBD,
-        0xE8,
-        0xB4,
-        0x38,
-        0xC0,
-        0xE1,
-        0xB0,
-        0x28,
-        0xC0,
-        0xE1,
-        0x1E,
-        0xFF,
-        0x2F,
-        0xE1,
-        0x95,
-        0x03,
-        0x00,
-        0x00,
-        0xF8,
-        0x03,
-        0x00,
-        0x00,
-        0xF9,
-        0x03,
-        0x00,
-        0x00,
-        0x2C,
-        0x04,
-        0x00,
-        0x00,
-        0x2D,
-        0x04,
-        0x00,
-        0x00,
-        0x94,
-        0x04,
-        0x00,
-        0x00,
-        0xE5,
-        0x06,
-        0x00,
-        0x00,
-        0x48,
-        0x07,
-        0x00,
-        0x00,
-        0x49,
-        0x07,
-        0x00,
-        0x00,
-        0x9C,
-        0x07,
-        0x00,
-        0x00,
-        0x9D,
-        0x07,
-        0x00,
-        0x00,
-        0x60,
-        0x08,
-        0x00,
-        0x00,
-        0x95,
-        0x04,
-        0x00,
-        0x00,
-        0xD4,
-        0x04,
-        0x00,
-        0x00,
-        0xD5,
-        0x04,
-        0x00,
-        0x00,
-        0x2C,
-        0x05,
-        0x00,
-        0x00,
-        0x2D,
-        0x05,
-        0x00,
-        0x00,
-        0xBC,
-        0x05,
-        0x00,
-        0x00,
-        0xBD,
-        0x05,
-        0x00,
-        0x00,
-        0xFC,
-        0x05,
-        0x00,
-        0x00,
-        0xFD,
-        0x05,
-        0x00,
-        0x00,
-        0x54,
-        0x06,
-        0x00,
-        0x00,
-        0x55,
-        0x06,
-        0x00,
-        0x00,
-        0xE4,
-        0x06,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x30,
-        0x40,
-        0x2D,
-        0xE9,
-        0x0D,
-        0x40,
-        0xA0,
-        0xE1,
-        0x01,
-        0x20,
-        0xC2,
-        0xE3,
-        0x04,
-        0x50,
-        0x33,
-        0xE5,
-        0x04,
-        0x50,
-        0x2D,
-        0xE5,
-        0x03,
-        0x00,
-        0x52,
-        0xE1,
-        0xFB,
-        0xFF,
-        0xFF,
-        0x1A,
-        0x01,
-        0x20,
-        0x8D,
-        0xE2,
-        0x0F,
-        0xE0,
-        0xA0,
-        0xE1,
-        0x12,
-        0xFF,
-        0x2F,
-        0xE1,
-        0x04,
-        0xD0,
-        0xA0,
-        0xE1,
-        0x30,
-        0x40,
-        0xBD,
-        0xE8,
-        0x1E,
-        0xFF,
-        0x2F,
-        0xE1,
-        0x80,
-        0x23,
-        0xFF,
-        0x22,
-        0x1B,
-        0x05,
-        0x13,
-        0xB5,
-        0x18,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0x90,
-        0x21,
-        0x19,
-        0x80,
-        0xC0,
-        0x46,
-        0x19,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0x88,
-        0x42,
-        0x03,
-        0xD1,
-        0x00,
-        0x20,
-        0x16,
-        0xBC,
-        0x02,
-        0xBC,
-        0x08,
-        0x47,
-        0x42,
-        0x20,
-        0x0C,
-        0x49,
-        0x08,
-        0x80,
-        0xC0,
-        0x46,
-        0x0C,
-        0x48,
-        0x04,
-        0x78,
-        0x96,
-        0x20,
-        0x08,
-        0x80,
-        0xC0,
-        0x46,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0x95,
-        0x38,
-        0x96,
-        0x2C,
-        0xEE,
-        0xD0,
-        0x00,
-        0x23,
-        0x80,
-        0x22,
-        0x01,
-        0x93,
-        0xD2,
-        0x00,
-        0x01,
-        0x9B,
-        0x93,
-        0x42,
-        0xE6,
-        0xDA,
-        0xC0,
-        0x46,
-        0x01,
-        0x9B,
-        0x01,
-        0x33,
-        0x01,
-        0x93,
-        0xF7,
-        0xE7,
-        0xC0,
-        0x46,
-        0x58,
-        0x00,
-        0x00,
-        0x08,
-        0xB2,
-        0x00,
-        0x00,
-        0x08,
-        0x01,
-        0x23,
-        0x98,
-        0x43,
-        0x80,
-        0x23,
-        0x1B,
-        0x05,
-        0xC0,
-        0x18,
-        0xFF,
-        0x23,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x60,
-        0x22,
-        0x02,
-        0x80,
-        0xC0,
-        0x46,
-        0x70,
-        0x32,
-        0x02,
-        0x80,
-        0xC0,
-        0x46,
-        0x20,
-        0x21,
-        0x01,
-        0x80,
-        0xC0,
-        0x46,
-        0x02,
-        0x80,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x02,
-        0x88,
-        0x80,
-        0x2A,
-        0xFB,
-        0xD1,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x70,
-        0x47,
-        0xF7,
-        0xB5,
-        0x02,
-        0x00,
-        0x01,
-        0x91,
-        0x01,
-        0x21,
-        0x90,
-        0x27,
-        0x00,
-        0x23,
-        0x80,
-        0x26,
-        0x8A,
-        0x43,
-        0x94,
-        0x46,
-        0x3F,
-        0x05,
-        0x3B,
-        0x80,
-        0x36,
-        0x05,
-        0x01,
-        0x9A,
-        0x9A,
-        0x42,
-        0x06,
-        0xD8,
-        0xFF,
-        0x23,
-        0x88,
-        0x43,
-        0x83,
-        0x53,
-        0xC0,
-        0x46,
-        0xF7,
-        0xBC,
-        0x01,
-        0xBC,
-        0x00,
-        0x47,
-        0x80,
-        0x22,
-        0x52,
-        0x02,
-        0x93,
-        0x42,
-        0x00,
-        0xD1,
-        0x39,
-        0x80,
-        0x80,
-        0x24,
-        0xC2,
-        0x18,
-        0x8A,
-        0x43,
-        0x24,
-        0x05,
-        0x12,
-        0x19,
-        0x40,
-        0x24,
-        0x14,
-        0x80,
-        0xC0,
-        0x46,
-        0x07,
-        0x4C,
-        0x1D,
-        0x5D,
-        0x01,
-        0x3C,
-        0x1C,
-        0x5D,
-        0x2D,
-        0x02,
-        0x2C,
-        0x43,
-        0x14,
-        0x80,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x62,
-        0x46,
-        0x92,
-        0x5B,
-        0x80,
-        0x2A,
-        0xFA,
-        0xD1,
-        0x02,
-        0x33,
-        0xD9,
-        0xE7,
-        0x01,
-        0x00,
-        0x00,
-        0x0E,
-        0x80,
-        0x23,
-        0xF0,
-        0x22,
-        0x1B,
-        0x05,
-        0x30,
-        0xB5,
-        0x18,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0xA9,
-        0x24,
-        0x09,
-        0x49,
-        0x0C,
-        0x80,
-        0xC0,
-        0x46,
-        0x56,
-        0x25,
-        0x08,
-        0x4C,
-        0x25,
-        0x80,
-        0xC0,
-        0x46,
-        0x90,
-        0x24,
-        0x0C,
-        0x80,
-        0xC0,
-        0x46,
-        0x19,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0x40,
-        0x1A,
-        0x43,
-        0x1E,
-        0x98,
-        0x41,
-        0x30,
-        0xBC,
-        0x02,
-        0xBC,
-        0x08,
-        0x47,
-        0xC0,
-        0x46,
-        0xAA,
-        0x0A,
-        0x00,
-        0x08,
-        0x54,
-        0x05,
-        0x00,
-        0x08,
-        0x01,
-        0x23,
-        0x98,
-        0x43,
-        0x80,
-        0x23,
-        0x1B,
-        0x05,
-        0xC0,
-        0x18,
-        0xF0,
-        0x23,
-        0x30,
-        0xB5,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0xA9,
-        0x24,
-        0x0D,
-        0x4B,
-        0x1C,
-        0x80,
-        0xC0,
-        0x46,
-        0x56,
-        0x21,
-        0x0C,
-        0x4A,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x80,
-        0x25,
-        0x1D,
-        0x80,
-        0xC0,
-        0x46,
-        0x1C,
-        0x80,
-        0xC0,
-        0x46,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x30,
-        0x23,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x07,
-        0x4B,
-        0xC0,
-        0x46,
-        0x02,
-        0x88,
-        0x9A,
-        0x42,
-        0xFB,
-        0xD1,
-        0xF0,
-        0x23,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x30,
-        0xBC,
-        0x01,
-        0xBC,
-        0x00,
-        0x47,
-        0xAA,
-        0x0A,
-        0x00,
-        0x08,
-        0x54,
-        0x05,
-        0x00,
-        0x08,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0xF7,
-        0xB5,
-        0x90,
-        0x22,
-        0x00,
-        0x23,
-        0x84,
-        0x46,
-        0x01,
-        0x20,
-        0x12,
-        0x05,
-        0x01,
-        0x91,
-        0x13,
-        0x80,
-        0x01,
-        0x9A,
-        0x9A,
-        0x42,
-        0x09,
-        0xD8,
-        0x63,
-        0x46,
-        0x80,
-        0x22,
-        0xF0,
-        0x21,
-        0x83,
-        0x43,
-        0x12,
-        0x05,
-        0x99,
-        0x52,
-        0xC0,
-        0x46,
-        0xF7,
-        0xBC,
-        0x01,
-        0xBC,
-        0x00,
-        0x47,
-        0x80,
-        0x22,
-        0x52,
-        0x02,
-        0x93,
-        0x42,
-        0x02,
-        0xD1,
-        0x90,
-        0x22,
-        0x12,
-        0x05,
-        0x10,
-        0x80,
-        0xA9,
-        0x21,
-        0x12,
-        0x4A,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x56,
-        0x25,
-        0x11,
-        0x49,
-        0x0D,
-        0x80,
-        0xC0,
-        0x46,
-        0xA0,
-        0x21,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x0F,
-        0x4A,
-        0x9E,
-        0x18,
-        0x01,
-        0x3A,
-        0x9D,
-        0x18,
-        0x62,
-        0x46,
-        0x80,
-        0x21,
-        0xD2,
-        0x18,
-        0x37,
-        0x78,
-        0x82,
-        0x43,
-        0x09,
-        0x05,
-        0x52,
-        0x18,
-        0x29,
-        0x78,
-        0x3F,
-        0x02,
-        0x39,
-        0x43,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x31,
-        0x78,
-        0x09,
-        0x02,
-        0x0C,
-        0x00,
-        0x17,
-        0x88,
-        0x29,
-        0x78,
-        0x0C,
-        0x43,
-        0xA7,
-        0x42,
-        0xF6,
-        0xD1,
-        0x02,
-        0x33,
-        0xC5,
-        0xE7,
-        0xAA,
-        0x0A,
-        0x00,
-        0x08,
-        0x54,
-        0x05,
-        0x00,
-        0x08,
-        0x01,
-        0x00,
-        0x00,
-        0x0E,
-        0x80,
-        0x23,
-        0xF0,
-        0x22,
-        0x1B,
-        0x05,
-        0x30,
-        0xB5,
-        0x18,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0xAA,
-        0x24,
-        0x09,
-        0x49,
-        0x0C,
-        0x80,
-        0xC0,
-        0x46,
-        0x55,
-        0x25,
-        0x08,
-        0x4C,
-        0x25,
-        0x80,
-        0xC0,
-        0x46,
-        0x90,
-        0x24,
-        0x0C,
-        0x80,
-        0xC0,
-        0x46,
-        0x19,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0x40,
-        0x1A,
-        0x43,
-        0x1E,
-        0x98,
-        0x41,
-        0x30,
-        0xBC,
-        0x02,
-        0xBC,
-        0x08,
-        0x47,
-        0xC0,
-        0x46,
-        0xAA,
-        0x0A,
-        0x00,
-        0x08,
-        0x54,
-        0x05,
-        0x00,
-        0x08,
-        0x01,
-        0x23,
-        0x98,
-        0x43,
-        0x80,
-        0x23,
-        0x1B,
-        0x05,
-        0xC0,
-        0x18,
-        0xF0,
-        0x23,
-        0x30,
-        0xB5,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0xAA,
-        0x24,
-        0x0D,
-        0x4B,
-        0x1C,
-        0x80,
-        0xC0,
-        0x46,
-        0x55,
-        0x21,
-        0x0C,
-        0x4A,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x80,
-        0x25,
-        0x1D,
-        0x80,
-        0xC0,
-        0x46,
-        0x1C,
-        0x80,
-        0xC0,
-        0x46,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x30,
-        0x23,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x07,
-        0x4B,
-        0xC0,
-        0x46,
-        0x02,
-        0x88,
-        0x9A,
-        0x42,
-        0xFB,
-        0xD1,
-        0xF0,
-        0x23,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x30,
-        0xBC,
-        0x01,
-        0xBC,
-        0x00,
-        0x47,
-        0xAA,
-        0x0A,
-        0x00,
-        0x08,
-        0x54,
-        0x05,
-        0x00,
-        0x08,
-        0xFF,
-        0xFF,
-        0x00,
-        0x00,
-        0xF7,
-        0xB5,
-        0x90,
-        0x22,
-        0x00,
-        0x23,
-        0x84,
-        0x46,
-        0x01,
-        0x20,
-        0x12,
-        0x05,
-        0x01,
-        0x91,
-        0x13,
-        0x80,
-        0x01,
-        0x9A,
-        0x9A,
-        0x42,
-        0x09,
-        0xD8,
-        0x63,
-        0x46,
-        0x80,
-        0x22,
-        0xF0,
-        0x21,
-        0x83,
-        0x43,
-        0x12,
-        0x05,
-        0x99,
-        0x52,
-        0xC0,
-        0x46,
-        0xF7,
-        0xBC,
-        0x01,
-        0xBC,
-        0x00,
-        0x47,
-        0x80,
-        0x22,
-        0x52,
-        0x02,
-        0x93,
-        0x42,
-        0x02,
-        0xD1,
-        0x90,
-        0x22,
-        0x12,
-        0x05,
-        0x10,
-        0x80,
-        0xAA,
-        0x21,
-        0x12,
-        0x4A,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x55,
-        0x25,
-        0x11,
-        0x49,
-        0x0D,
-        0x80,
-        0xC0,
-        0x46,
-        0xA0,
-        0x21,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x0F,
-        0x4A,
-        0x9E,
-        0x18,
-        0x01,
-        0x3A,
-        0x9D,
-        0x18,
-        0x62,
-        0x46,
-        0x80,
-        0x21,
-        0xD2,
-        0x18,
-        0x37,
-        0x78,
-        0x82,
-        0x43,
-        0x09,
-        0x05,
-        0x52,
-        0x18,
-        0x29,
-        0x78,
-        0x3F,
-        0x02,
-        0x39,
-        0x43,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x31,
-        0x78,
-        0x09,
-        0x02,
-        0x0C,
-        0x00,
-        0x17,
-        0x88,
-        0x29,
-        0x78,
-        0x0C,
-        0x43,
-        0xA7,
-        0x42,
-        0xF6,
-        0xD1,
-        0x02,
-        0x33,
-        0xC5,
-        0xE7,
-        0xAA,
-        0x0A,
-        0x00,
-        0x08,
-        0x54,
-        0x05,
-        0x00,
-        0x08,
-        0x01,
-        0x00,
-        0x00,
-        0x0E,
-        0x80,
-        0x23,
-        0xFF,
-        0x22,
-        0x1B,
-        0x05,
-        0x13,
-        0xB5,
-        0x18,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0x90,
-        0x21,
-        0x19,
-        0x80,
-        0xC0,
-        0x46,
-        0x19,
-        0x68,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0x88,
-        0x42,
-        0x03,
-        0xD1,
-        0x00,
-        0x20,
-        0x16,
-        0xBC,
-        0x02,
-        0xBC,
-        0x08,
-        0x47,
-        0x42,
-        0x20,
-        0x0C,
-        0x49,
-        0x08,
-        0x80,
-        0xC0,
-        0x46,
-        0x96,
-        0x24,
-        0x0B,
-        0x48,
-        0x00,
-        0x78,
-        0x0C,
-        0x80,
-        0xC0,
-        0x46,
-        0x1A,
-        0x80,
-        0xC0,
-        0x46,
-        0xA0,
-        0x42,
-        0xEE,
-        0xD0,
-        0x00,
-        0x23,
-        0x80,
-        0x22,
-        0x01,
-        0x93,
-        0xD2,
-        0x00,
-        0x01,
-        0x9B,
-        0x93,
-        0x42,
-        0x01,
-        0xDB,
-        0x01,
-        0x20,
-        0xE6,
-        0xE7,
-        0xC0,
-        0x46,
-        0x01,
-        0x9B,
-        0x01,
-        0x33,
-        0x01,
-        0x93,
-        0xF5,
-        0xE7,
-        0x58,
-        0x00,
-        0x00,
-        0x08,
-        0xB2,
-        0x00,
-        0x00,
-        0x08,
-        0x01,
-        0x23,
-        0x98,
-        0x43,
-        0x80,
-        0x23,
-        0x1B,
-        0x05,
-        0xC0,
-        0x18,
-        0xFF,
-        0x23,
-        0x82,
-        0xB0,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x9F,
-        0x3B,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x70,
-        0x33,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x20,
-        0x22,
-        0x02,
-        0x80,
-        0xC0,
-        0x46,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x50,
-        0x3B,
-        0xC0,
-        0x46,
-        0x02,
-        0x88,
-        0x1A,
-        0x42,
-        0xFB,
-        0xD0,
-        0xFF,
-        0x23,
-        0x03,
-        0x80,
-        0xC0,
-        0x46,
-        0x00,
-        0x23,
-        0x80,
-        0x22,
-        0x01,
-        0x93,
-        0xD2,
-        0x00,
-        0x01,
-        0x9B,
-        0x93,
-        0x42,
-        0x01,
-        0xDB,
-        0x02,
-        0xB0,
-        0x70,
-        0x47,
-        0xC0,
-        0x46,
-        0x01,
-        0x9B,
-        0x01,
-        0x33,
-        0x01,
-        0x93,
-        0xF5,
-        0xE7,
-        0x90,
-        0x22,
-        0x00,
-        0x23,
-        0xF0,
-        0xB5,
-        0x12,
-        0x05,
-        0x87,
-        0xB0,
-        0x01,
-        0x90,
-        0x02,
-        0x91,
-        0x13,
-        0x80,
-        0x80,
-        0x22,
-        0x01,
-        0x27,
-        0x94,
-        0x46,
-        0x02,
-        0x9A,
-        0x93,
-        0x42,
-        0x0A,
-        0xD3,
-        0x00,
-        0x23,
-        0x80,
-        0x22,
-        0x05,
-        0x93,
-        0xD2,
-        0x00,
-        0x05,
-        0x9B,
-        0x93,
-        0x42,
-        0x42,
-        0xDB,
-        0x07,
-        0xB0,
-        0xF0,
-        0xBC,
-        0x01,
-        0xBC,
-        0x00,
-        0x47,
-        0x80,
-        0x22,
-        0x52,
-        0x02,
-        0x93,
-        0x42,
-        0x02,
-        0xD1,
-        0x90,
-        0x22,
-        0x12,
-        0x05,
-        0x17,
-        0x80,
-        0x01,
-        0x9A,
-        0x98,
-        0x18,
-        0x02,
-        0x00,
-        0x80,
-        0x21,
-        0xBA,
-        0x43,
-        0x09,
-        0x05,
-        0x52,
-        0x18,
-        0xEA,
-        0x21,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x64,
-        0x46,
-        0x11,
-        0x88,
-        0x21,
-        0x42,
-        0xFA,
-        0xD0,
-        0x17,
-        0x49,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0xE0,
-        0x21,
-        0x16,
-        0x4C,
-        0x1C,
-        0x19,
-        0x09,
-        0x05,
-        0x03,
-        0x94,
-        0x59,
-        0x18,
-        0x04,
-        0x00,
-        0xBC,
-        0x43,
-        0x26,
-        0x00,
-        0x4D,
-        0x78,
-        0x0C,
-        0x78,
-        0x2D,
-        0x02,
-        0x2C,
-        0x43,
-        0x35,
-        0x00,
-        0x80,
-        0x26,
-        0x36,
-        0x05,
-        0xAC,
-        0x53,
-        0xC0,
-        0x46,
-        0x03,
-        0x9C,
-        0x02,
-        0x31,
-        0x02,
-        0x30,
-        0xA1,
-        0x42,
-        0xEE,
-        0xD1,
-        0xD0,
-        0x21,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0xC0,
-        0x46,
-        0x60,
-        0x46,
-        0x11,
-        0x88,
-        0x01,
-        0x42,
-        0xFA,
-        0xD0,
-        0xFF,
-        0x21,
-        0x11,
-        0x80,
-        0xC0,
-        0x46,
-        0x80,
-        0x22,
-        0xD2,
-        0x00,
-        0x9B,
-        0x18,
-        0xB2,
-        0xE7,
-        0xC0,
-        0x46,
-        0x05,
-        0x9B,
-        0x01,
-        0x33,
-        0x05,
-        0x93,
-        0xB4,
-        0xE7,
-        0xC0,
-        0x46,
-        0xFF,
-        0x01,
-        0x00,
-        0x00,
-        0x00,
-        0x04,
-        0x00,
-        0x0E,
-        0x3C,
-        0x33,
-        0x20,
-        0x66,
-        0x72,
-        0x6F,
-        0x6D,
-        0x20,
-        0x4D,
-        0x61,
-        0x6E,
-        0x69,
-        0x61,
-        0x63,
-        0x70,
-        0x08,
-    ]
-)
+"""
+The pre-built batteryless payload is shipped as package data (payload.bin) next to this module.
+It's the same binary as batteryless_patch/src/payload_bin.hpp.
+"""
+
+import hashlib
+from importlib import resources
+
+PAYLOAD_FILE = "payload.bin"
+PAYLOAD_SHA256 = "1c1bb8a0fd316ed5bfd7194d08c2bbcf282170aaacfca7946dd9cac286b67a58"
+
+
+def load_payload() -> bytes:
+    data = resources.files(__package__).joinpath(PAYLOAD_FILE).read_bytes()
+    if hashlib.sha256(data).hexdigest() != PAYLOAD_SHA256:
+        raise ImportError(f"{__package__}/{PAYLOAD_FILE} is damaged, hash mismatch.")
+    return data
+
+
+payload_bin = load_payload()
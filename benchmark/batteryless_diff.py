@@ -0,0 +1,163 @@
+# coding=utf-8
+# Differential test and benchmark of the batteryless patcher backends (C++, Rust and pure Python).
+# Run from the repository root: python -m benchmark.batteryless_diff [--backend NAME ...] [--repeat N] [--size MiB]
+# Every backend patches the same synthetic ROMs, one per write function signature plus the EEPROM V111 hook, a ROM
+# without a write function, a misaligned ROM, a ROM which has to be expanded and a full size ROM, in auto and manual
+# mode. The outputs are compared byte for byte with the first backend and the throughput of every backend is reported.
+# The exit code is 1 if any output differs.
+
+import argparse
+import concurrent.futures
+import hashlib
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import typing
+
+from batteryless_patch_py import batteryless_patch
+from utils import PatchBackend
+
+IRQ_HANDLER_REFERENCE = bytes([0xFC, 0x7F, 0x00, 0x03])
+ENTRYPOINT = struct.pack("<I", 0xEA00002E)
+
+
+class Case(typing.NamedTuple):
+    name: str
+    size: int  # bytes, may be misaligned
+    signatures: tuple[bytes, ...]
+    blank: bool = True  # whether the upper half of the ROM is blank (room for the payload)
+
+
+class Outcome(typing.NamedTuple):
+    status: str  # the return code, or the exception raised
+    digest: str | None  # sha256 of the output, None if nothing was written
+    seconds: float  # best of repeat
+
+
+def make_cases(size: int) -> list[Case]:
+    signatures = {
+        "sram": batteryless_patch.write_sram_signature,
+        "sram2": batteryless_patch.write_sram2_signature,
+        "sram_ram": batteryless_patch.write_sram_ram_signature,
+        "eeprom": batteryless_patch.write_eeprom_signature,
+        "flash": batteryless_patch.write_flash_signature,
+        "flash2": batteryless_patch.write_flash2_signature,
+        "flash3": batteryless_patch.write_flash3_signature,
+        "eeprom_v111": batteryless_patch.write_eepromv111_signature,
+    }
+    cases = [Case(name, size, (signature,)) for name, signature in signatures.items()]
+    cases += [
+        Case("flash+eeprom_v111", size, (signatures["flash"], signatures["eeprom_v111"])),
+        Case("no_write_function", size, ()),
+        Case("misaligned", size - 0x1234, (signatures["sram"],)),
+        Case("expand", 0x40000, (signatures["flash"],), blank=False),
+        Case("full_size", batteryless_patch.max_rom_size, (signatures["eeprom"],)),
+        Case("full_size_no_room", batteryless_patch.max_rom_size, (signatures["eeprom"],), blank=False),
+    ]
+    return cases
+
+
+def make_rom(path: str, case: Case, seed: int) -> None:
+    rng = random.Random(seed)
+    code_size = case.size // 2 if case.blank else case.size
+    # No 0xFF filled sector may end up in the random data, and 0xFF bytes keep the patterns from matching by chance.
+    rom = bytearray(rng.randbytes(code_size).replace(b"\xff", b"\xfe")) + b"\xff" * (case.size - code_size)
+    rom[0:4] = ENTRYPOINT
+    rom[0x1000:0x1004] = IRQ_HANDLER_REFERENCE
+    rom[0x2000:0x2004] = IRQ_HANDLER_REFERENCE
+    offset = 0x4000
+    for signature in case.signatures:
+        rom[offset : offset + len(signature)] = signature
+        offset += 0x1000
+    with open(path, "wb") as f:
+        f.write(rom)
+
+
+def _silence() -> None:
+    # The extensions print from C++ and Rust, so stdout is redirected at the file descriptor level.
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+
+def run_backend(backend: str, roms: list[str], out_dir: str, repeat: int) -> list[Outcome]:
+    """Patches every ROM in auto and manual mode. Runs in a worker, the extensions can't be unloaded."""
+    _silence()
+    _, patcher = PatchBackend.resolve("batteryless", backend)
+    outcomes = []
+    for i, rom in enumerate(roms):
+        for auto_mode in (True, False):
+            out_path = os.path.join(out_dir, f"{backend}_{i}_{int(auto_mode)}.gba")
+            best, status = float("inf"), None
+            for _ in range(repeat):
+                if os.path.exists(out_path):
+                    os.remove(out_path)
+                start = time.perf_counter()
+                try:
+                    code = patcher(rom, out_path, auto_mode)
+                    status = "0" if code is None else str(code)  # the Rust extension returns None or raises
+                except Exception as e:
+                    status = type(e).__name__
+                best = min(best, time.perf_counter() - start)
+            digest = None
+            if os.path.exists(out_path):
+                with open(out_path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            outcomes.append(Outcome(status, digest, best))
+    return outcomes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="batteryless patcher backend comparison")
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=PatchBackend.BACKENDS,
+        help="backend to run (default: all available), can be repeated",
+    )
+    parser.add_argument("--size", type=int, default=16, help="synthetic ROM size in MiB")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per ROM, the best is reported")
+    args = parser.parse_args()
+    backends = args.backend or PatchBackend.available("batteryless")
+
+    cases = make_cases(args.size * 0x100000)
+    results = dict()
+    with tempfile.TemporaryDirectory() as tmp:
+        roms = [os.path.join(tmp, f"rom{i}.gba") for i in range(len(cases))]
+        for i, (rom, case) in enumerate(zip(roms, cases)):
+            make_rom(rom, case, i)
+        for backend in backends:
+            with concurrent.futures.ProcessPoolExecutor(1) as executor:
+                results[backend] = executor.submit(run_backend, backend, roms, tmp, args.repeat).result()
+
+    reference = backends[0]
+    mismatches = 0
+    width = max(len(case.name) for case in cases) + 7
+    print(f"{'ROM':<{width}} | " + " | ".join(f"{backend:>8}" for backend in backends) + " | output")
+    for i, case in enumerate(cases):
+        for j, mode in enumerate(("auto", "manual")):
+            outcomes = [results[backend][2 * i + j] for backend in backends]
+            same = all(outcome.digest == results[reference][2 * i + j].digest for outcome in outcomes)
+            mismatches += not same
+            print(
+                f"{case.name + ' ' + mode:<{width}} | "
+                + " | ".join(f"{outcome.status:>8}" for outcome in outcomes)
+                + f" | {'identical' if same else 'DIFFERS'}"
+            )
+    print()
+    total = sum(case.size for case in cases) * 2 / 0x100000
+    for backend in backends:
+        seconds = sum(outcome.seconds for outcome in results[backend])
+        print(f"{backend}: {total / seconds:.1f} MiB/s, {seconds / len(results[backend]) * 1000:.1f} ms per ROM on average")
+    if len(backends) < 2:
+        print(f"Only the {reference} backend is available, nothing to compare.")
+    elif mismatches:
+        print(f"{mismatches} output(s) differ from the {reference} backend.")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
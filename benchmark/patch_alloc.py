@@ -0,0 +1,87 @@
+# coding=utf-8
+# Allocation benchmark of the pure Python patchers in a batch.
+# Run from the repository root: python -m benchmark.patch_alloc [--patch batteryless|rts] [--count N] [--size MiB] [ROM ...]
+# Without ROMs, synthetic ROMs with an IRQ handler reference and a SRAM write function are generated.
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from batteryless_patch_py import batteryless_patch
+from rts_patch_py import patcher as rts_patcher
+from utils import BufferPool
+
+
+def make_rom(path: str, size: int, seed: int) -> None:
+    rng = random.Random(seed)
+    rom = bytearray(rng.randbytes(size // 2)) + b"\xff" * (size - size // 2)
+    rom[0:4] = struct.pack("<I", 0xEA00002E)
+    rom[0x1000:0x1004] = bytes([0xFC, 0x7F, 0x00, 0x03])
+    sig = batteryless_patch.write_sram_signature
+    rom[0x4000 : 0x4000 + len(sig)] = sig
+    with open(path, "wb") as f:
+        f.write(rom)
+
+
+def run_batch(roms: list[str], out_dir: str, patch: str) -> list[tuple[float, int, int]]:
+    """Patches every ROM, returns (seconds, allocated blocks, peak bytes) per ROM."""
+    results = []
+    for i, rom in enumerate(roms):
+        out_path = os.path.join(out_dir, f"{i}.gba")
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            if patch == "batteryless":
+                batteryless_patch.patch(rom, out_path, True)
+            else:
+                rts_patcher.apply_patch(rom, output_file=out_path, interactive=False)
+        elapsed = time.perf_counter() - start
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blocks = sum(
+            stat.count_diff
+            for stat in after.compare_to(before, "filename")
+            if stat.count_diff > 0
+        )
+        results.append((elapsed, blocks, peak))
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Patcher allocation benchmark")
+    parser.add_argument("roms", nargs="*", help="ROMs to patch, synthetic ROMs if none")
+    parser.add_argument("--patch", choices=("batteryless", "rts"), default="batteryless")
+    parser.add_argument("--count", type=int, default=8, help="number of synthetic ROMs")
+    parser.add_argument("--size", type=int, default=16, help="synthetic ROM size in MiB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        roms = args.roms
+        if not roms:
+            roms = [os.path.join(tmp, f"rom{i}.gba") for i in range(args.count)]
+            for i, rom in enumerate(roms):
+                make_rom(rom, args.size * 0x100000, i)
+        results = run_batch(roms, tmp, args.patch)
+
+    print(f"{'ROM':>4} | {'time [s]':>8} | {'blocks':>8} | {'peak [MiB]':>10}")
+    for i, (elapsed, blocks, peak) in enumerate(results):
+        print(f"{i:>4} | {elapsed:>8.3f} | {blocks:>8} | {peak / 0x100000:>10.2f}")
+    print(
+        f"\n{BufferPool.pool.allocations} arena(s) of "
+        f"{BufferPool.ARENA_SIZE // 0x100000} MiB allocated for {len(results)} ROM(s), "
+        f"{sum(r[2] for r in results) / len(results) / 0x100000:.2f} MiB peak per ROM on average."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+# coding=utf-8
+# Patch time per ROM of the gba_patch extension, for one or more builds of it.
+# Run from the repository root: python -m benchmark.sram_patch [--lib DIR ...] [--count N] [--size MiB] [ROM ...]
+# Every --lib is a folder containing a gba_patch build, e.g. the lib folder of an older checkout, so the times before
+# and after a change of the C++ code can be compared. Without ROMs, synthetic ROMs with a FLASH1M_V103 library
+# string (but none of its patch patterns, so every patch is looked for in the whole ROM) are generated.
+
+import argparse
+import concurrent.futures
+import contextlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+def make_rom(path: str, size: int, seed: int) -> None:
+    rng = random.Random(seed)
+    rom = bytearray(rng.randbytes(size // 2)) + b"\xff" * (size - size // 2)
+    library = b"FLASH1M_V103"
+    offset = rng.randrange(0x1000, size // 2 - len(library))
+    rom[offset : offset + len(library)] = library
+    with open(path, "wb") as f:
+        f.write(rom)
+
+
+def _use_lib(lib_dir: str) -> None:
+    sys.path.insert(0, os.path.abspath(lib_dir))
+
+
+def time_roms(roms: list[str], out_dir: str, repeat: int) -> list[float]:
+    """Best of repeat sram_patch times per ROM, in seconds. Runs in a worker with the build on its path."""
+    import gba_patch
+
+    times = []
+    for i, rom in enumerate(roms):
+        out_path = os.path.join(out_dir, f"{i}.gba")
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                gba_patch.sram_patch(rom.encode(), out_path.encode())
+            best = min(best, time.perf_counter() - start)
+        times.append(best)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="gba_patch SRAM patch benchmark")
+    parser.add_argument("roms", nargs="*", help="ROMs to patch, synthetic ROMs if none")
+    parser.add_argument(
+        "--lib", action="append", help="folder of a gba_patch build (default: lib), can be repeated"
+    )
+    parser.add_argument("--count", type=int, default=8, help="number of synthetic ROMs")
+    parser.add_argument("--size", type=int, default=32, help="synthetic ROM size in MiB")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per ROM, the best is reported")
+    args = parser.parse_args()
+    libs = args.lib or ["lib"]
+
+    results = dict()
+    with tempfile.TemporaryDirectory() as tmp:
+        roms = args.roms
+        if not roms:
+            roms = [os.path.join(tmp, f"rom{i}.gba") for i in range(args.count)]
+            for i, rom in enumerate(roms):
+                make_rom(rom, args.size * 0x100000, i)
+        for lib in libs:
+            # Extension modules can't be unloaded, so every build is imported in its own process.
+            with concurrent.futures.ProcessPoolExecutor(1, initializer=_use_lib, initargs=(lib,)) as executor:
+                results[lib] = executor.submit(time_roms, roms, tmp, args.repeat).result()
+
+    width = max(len(lib) for lib in libs + ["time [s]"])
+    print(f"{'ROM':>4} | " + " | ".join(f"{lib:>{width}}" for lib in libs))
+    for i in range(len(roms)):
+        print(f"{i:>4} | " + " | ".join(f"{results[lib][i]:>{width}.3f}" for lib in libs))
+    baseline = sum(results[libs[0]]) / len(roms)
+    print()
+    for lib in libs:
+        average = sum(results[lib]) / len(roms)
+        print(f"{lib}: {average * 1000:.1f} ms per ROM on average, speed-up {baseline / average:.2f}x over {libs[0]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
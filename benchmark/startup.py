@@ -0,0 +1,131 @@
+# coding=utf-8
+# Cold-start benchmark for the GUI entry points.
+# Run from the repository root: python -m benchmark.startup [--ui pyside6|tkinter]
+
+import argparse
+import os
+import subprocess
+import sys
+
+STARTUP_BUDGET = 1.0  # seconds until the main window has been constructed
+
+UI_MODULES = {
+    "pyside6": "pyside6_ui.MenuBuilderGUI",
+    "tkinter": "tkinter_ui.MenuBuilderGUI",
+}
+
+# Modules that must not be imported before the first build or image selection.
+DEFERRED_MODULES = [
+    "utils.MenuBuilder",
+    "utils.Patcher",
+    "utils.Patcher_py",
+    "lib.gba_patch",
+    "lib.batteryless_patch",
+    "batteryless_patch_py.payload_bin",
+    "rts_patch_py.payload_bin",
+    "rom_builder.rom_builder",
+]
+
+WINDOW_SCRIPT = {
+    "pyside6": """
+import sys, time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from pyside6_ui import MenuBuilderGUI
+app = QApplication([])
+window = MenuBuilderGUI.MenuBuilderGUI()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+print(",".join(sorted(sys.modules)))
+""",
+    "tkinter": """
+import sys, time
+start = time.perf_counter()
+from tkinter_ui import MenuBuilderGUI
+ui = MenuBuilderGUI.MenuBuilderGUI()
+ui.update()
+print(time.perf_counter() - start)
+print(",".join(sorted(sys.modules)))
+ui.destroy()
+""",
+}
+
+
+def import_time_report(module: str, top: int = 20) -> list[tuple[int, int, str]]:
+    """Run `python -X importtime` on the module, return (self_us, cumulative_us, name) sorted by cumulative time."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    records = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        records.append(
+            (int(fields[0].strip()), int(fields[1].strip()), fields[2].rstrip())
+        )
+    records.sort(key=lambda r: r[1], reverse=True)
+    return records[:top]
+
+
+def measure_window(ui: str) -> tuple[float, set[str]]:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-c", WINDOW_SCRIPT[ui]],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    lines = proc.stdout.strip().splitlines()
+    return float(lines[-2]), set(lines[-1].split(","))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="GUI cold-start benchmark")
+    parser.add_argument("--ui", choices=UI_MODULES.keys(), default="pyside6")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=STARTUP_BUDGET,
+        help="maximum seconds until the main window is shown",
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="number of imports to list"
+    )
+    args = parser.parse_args()
+
+    print(f"Import time report for {UI_MODULES[args.ui]} (cumulative, top {args.top}):")
+    print(f"{'self [us]':>10} | {'cumulative':>10} | module")
+    for self_us, cumulative_us, name in import_time_report(
+        UI_MODULES[args.ui], args.top
+    ):
+        print(f"{self_us:>10} | {cumulative_us:>10} | {name}")
+
+    try:
+        elapsed, modules = measure_window(args.ui)
+    except RuntimeError as e:
+        print(f"Couldn't construct the main window: {e}")
+        return 1
+
+    ret = 0
+    print(f"\nMain window ready after {elapsed:.3f}s (budget {args.budget:.3f}s).")
+    if elapsed > args.budget:
+        print("Cold-start budget exceeded.")
+        ret = 1
+    eager = [m for m in DEFERRED_MODULES if m in modules]
+    if eager:
+        print(f"Modules imported before first build: {', '.join(eager)}")
+        ret = 1
+    return ret
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 #include <cassert>
 #include <cstddef>
+#include <cstring>
 #include <algorithm>
+#include <array>
 #include <fstream>
 #include <iterator>
 #include <limits>
@@ -36,11 +38,13 @@ void read_file(std::vector<unsigned char>& data, const std::string& file_path) {
 
 		// Reset position b/c of file size reading earlier.
 		fstrm.seekg(0, std::ios::beg);
-		data.reserve(fsize <= max_size ? (size_t)fsize : max_size);
+		data.resize(fsize <= max_size ? (size_t)fsize : max_size);
 
 		// C/C++ standards require all char types to have identical binary layout w/ no padding bits.
 		// http://stackoverflow.com/a/10336701
-		data.assign(std::istreambuf_iterator<char>(fstrm), std::istreambuf_iterator<char>());
+		// Read straight into the vector instead of byte by byte through a stream iterator.
+		fstrm.read(reinterpret_cast<char*>(data.data()), data.size());
+		data.resize(fstrm.gcount());
 		fstrm.close();
 	}
 	else {
@@ -111,24 +115,39 @@ void write_dummy_save(const std::string& file_path, const size_t size, const boo
 }
 
 
-ByteOffset find_bytes(const std::vector<unsigned char>& data,
-	const std::vector<unsigned char>& find_data,
-	const std::vector<bool>* wildcard_mask) {
+ByteOffset find_bytes(const ByteSpan data,
+	const ByteSpan find_data,
+	const std::vector<bool>* wildcard_mask,
+	const size_t begin, const size_t end) {
 	// A true value in wildcard_mask will make the corresponding index in find_data match any value.
-	assert((wildcard_mask == NULL || wildcard_mask->size() <= 0) || wildcard_mask->size() == find_data.size());
-	bool use_mask = wildcard_mask != NULL && wildcard_mask->size() > 0 && wildcard_mask->size() == find_data.size();
+	// Only matches lying completely in [begin, end) are found.
+	assert((wildcard_mask == NULL || wildcard_mask->size() <= 0) || wildcard_mask->size() == find_data.size);
+	bool use_mask = wildcard_mask != NULL && wildcard_mask->size() > 0 && wildcard_mask->size() == find_data.size;
 
 	// Wildcard variant of the Boyer-Moore string matching algorithm. Fast w/ large alphabets.
-	if (find_data.size() <= data.size()) {
-		size_t data_len = data.size();
-		size_t find_len = find_data.size();
+	size_t data_len = std::min(end, data.size);
 
-		size_t data_idx = find_data.size() - 1;
-		size_t find_idx = find_data.size() - 1;
+	if (begin <= data_len && find_data.size > 0 && find_data.size <= data_len - begin) {
+		size_t find_len = find_data.size;
+
+		// The last index, relative to pattern start, that matches each byte value (0 if none).
+		// Index 0 is never looked at, a byte only matching there shifts like a mismatch.
+		std::array<size_t, 256> last_match_idx = {};
+
+		for (size_t i = 1; i < find_len; i++) {
+			if (use_mask && wildcard_mask->at(i)) {
+				last_match_idx.fill(i);
+			} else {
+				last_match_idx[find_data[i]] = i;
+			}
+		}
+
+		size_t data_idx = begin + find_len - 1;
+		size_t find_idx = find_len - 1;
 
 		do {
-			if (find_data.at(find_idx) == data.at(data_idx)
-				|| (use_mask && wildcard_mask->at(find_idx))) {
+			if (find_data[find_idx] == data[data_idx]
+				|| (use_mask && (*wildcard_mask)[find_idx])) {
 				if (find_idx == 0) {
 					// Match found.
 					return ByteOffset(true, data_idx);
@@ -139,17 +158,7 @@ ByteOffset find_bytes(const std::vector<unsigned char>& data,
 				}
 			}
 			else {
-				// Find the last index, relative to pattern start, that matches the current data byte.
-				size_t last_match_idx = 0;
-
-				for (last_match_idx = find_len - 1; last_match_idx > 0; last_match_idx--) {
-					if (find_data.at(last_match_idx) == data.at(data_idx)
-						|| (use_mask && wildcard_mask->at(last_match_idx))) {
-						break;
-					}
-				}
-
-				data_idx += find_len - std::min(find_idx, last_match_idx + 1);
+				data_idx += find_len - std::min(find_idx, last_match_idx[data[data_idx]] + 1);
 				find_idx = find_len - 1;
 			}
 		} while (data_idx < data_len);
@@ -159,30 +168,34 @@ ByteOffset find_bytes(const std::vector<unsigned char>& data,
 }
 
 
-ByteOffset replace_bytes(std::vector<unsigned char>& data,
-	const std::vector<unsigned char>& find_data,
-	const std::vector<unsigned char>& replacement_data,
+ByteOffset replace_bytes(const MutableByteSpan data,
+	const ByteSpan find_data,
+	const ByteSpan replacement_data,
 	const std::vector<bool>* find_mask,
-	const std::vector<bool>* replacement_mask) {
+	const std::vector<bool>* replacement_mask,
+	const size_t begin, const size_t end) {
 	// A true value in find_mask will make the corresponding index in find_data match any value.
 	// A true value in replacement_mask will make the corresponding index in replacement_data be skipped when writing.
 
-	ByteOffset find_result = find_bytes(data, find_data, find_mask);
+	ByteOffset find_result = find_bytes(data, find_data, find_mask, begin, end);
 	bool found = find_result.valid;
 	size_t idx = find_result.offset;
 
-	assert(!found || (idx >= 0 && idx < data.size()));
-	assert((replacement_mask == NULL || replacement_mask->size() <= 0) || (replacement_mask->size() == replacement_data.size()));
-	bool use_replacement_mask = replacement_mask != NULL && replacement_mask->size() > 0 && replacement_mask->size() == replacement_data.size();
+	assert(!found || idx < data.size);
+	assert((replacement_mask == NULL || replacement_mask->size() <= 0) || (replacement_mask->size() == replacement_data.size));
+	bool use_replacement_mask = replacement_mask != NULL && replacement_mask->size() > 0 && replacement_mask->size() == replacement_data.size;
 
-	// Replace data. Overwrites subsequent bytes if replacement is longer than find data.
+	// Replace data. Overwrites subsequent bytes if replacement is longer than find data, up to the end of the data.
 	if (found) {
-		data.reserve(std::max(data.size(), idx + replacement_data.size() + 1));
-
-		// TODO Optimize vector data replacement routine.
-		for (size_t i = 0; i < replacement_data.size(); i++) {
-			if (!use_replacement_mask || !replacement_mask->at(i)) {
-				data[idx + i] = replacement_data.at(i);
+		size_t length = std::min(replacement_data.size, data.size - idx);
+
+		if (!use_replacement_mask) {
+			std::memcpy(data.data + idx, replacement_data.data, length);
+		} else {
+			for (size_t i = 0; i < length; i++) {
+				if (!replacement_mask->at(i)) {
+					data[idx + i] = replacement_data[i];
+				}
 			}
 		}
 	}
@@ -191,13 +204,13 @@ ByteOffset replace_bytes(std::vector<unsigned char>& data,
 }
 
 
-size_t find_rom_eod(const std::vector<unsigned char> rom_data, const bool interchangeable_empty_byte) {
-	assert(rom_data.size() > 0);
+size_t find_rom_eod(const ByteSpan rom_data, const bool interchangeable_empty_byte) {
+	assert(rom_data.size > 0);
 
-	const unsigned char end_byte = rom_data.back();
+	const unsigned char end_byte = rom_data[rom_data.size - 1];
 
 	if (end_byte == 0xff || end_byte == 0x00) {
-		for (size_t i = rom_data.size() - 1; i < ((size_t)0) - 1; i--) {
+		for (size_t i = rom_data.size - 1; i < ((size_t)0) - 1; i--) {
 			if ((!interchangeable_empty_byte && rom_data[i] != end_byte)
 				|| (interchangeable_empty_byte && rom_data[i] != 0xff && rom_data[i] != 0x00)) {
 				return i;
@@ -207,7 +220,7 @@ size_t find_rom_eod(const std::vector<unsigned char> rom_data, const bool interc
 		return 0;
 	}
 
-	return rom_data.size() > 0 ? rom_data.size() - 1 : 0;
+	return rom_data.size > 0 ? rom_data.size - 1 : 0;
 }
 
 
@@ -223,7 +236,7 @@ size_t next_aligned_address(const size_t address, const size_t alignment) {
 
 
 void read_bytes_to_value(uint32_t& dest,
-	const std::vector<unsigned char> read_data, const size_t read_pos, const size_t read_size,
+	const ByteSpan read_data, const size_t read_pos, const size_t read_size,
 	const Endianness read_endianness) {
 	// One-line endianness detection.
 	// http://esr.ibiblio.org/?p=5095
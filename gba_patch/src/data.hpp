@@ -1,6 +1,7 @@
 #ifndef EZGBA_DATA_HPP
 #define EZGBA_DATA_HPP
 
+#include <cstdint>
 #include <string>
 #include <vector>
 
@@ -24,6 +25,29 @@ typedef struct ByteOffset_ {
 } ByteOffset;
 
 
+// A view of bytes owned by someone else, usually a ROM vector. Passing a view never copies the data.
+// A std::vector<unsigned char> converts to a view implicitly.
+typedef struct ByteSpan_ {
+	const unsigned char * data;
+	size_t size;
+
+	ByteSpan_(const unsigned char * data, const size_t size) : data(data), size(size) {}
+	ByteSpan_(const std::vector<unsigned char> & vector) : data(vector.data()), size(vector.size()) {}
+	unsigned char operator[](const size_t i) const { return this->data[i]; }
+} ByteSpan;
+
+
+typedef struct MutableByteSpan_ {
+	unsigned char * data;
+	size_t size;
+
+	MutableByteSpan_(unsigned char * data, const size_t size) : data(data), size(size) {}
+	MutableByteSpan_(std::vector<unsigned char> & vector) : data(vector.data()), size(vector.size()) {}
+	unsigned char & operator[](const size_t i) const { return this->data[i]; }
+	operator ByteSpan() const { return ByteSpan(this->data, this->size); }
+} MutableByteSpan;
+
+
 enum Endianness {
 	BIG_ENDIAN_BYTE_ORDER,
 	LITTLE_ENDIAN_BYTE_ORDER
@@ -38,22 +62,24 @@ void write_file(const std::vector<unsigned char> & data, const std::string & fil
 
 void write_dummy_save(const std::string & file_path, const size_t size = 512, const bool create_parent_dirs = true);
 
-ByteOffset find_bytes(const std::vector<unsigned char> & data,
-					  const std::vector<unsigned char> & find_data,
-					  const std::vector<bool> * wildcard_mask = NULL);
+ByteOffset find_bytes(const ByteSpan data,
+					  const ByteSpan find_data,
+					  const std::vector<bool> * wildcard_mask = NULL,
+					  const size_t begin = 0, const size_t end = SIZE_MAX);
 
-ByteOffset replace_bytes(std::vector<unsigned char> & data,
-						 const std::vector<unsigned char> & find_data,
-						 const std::vector<unsigned char> & replacement_data,
+ByteOffset replace_bytes(const MutableByteSpan data,
+						 const ByteSpan find_data,
+						 const ByteSpan replacement_data,
 						 const std::vector<bool> * find_mask = NULL,
-						 const std::vector<bool> * replacement_mask = NULL);
+						 const std::vector<bool> * replacement_mask = NULL,
+						 const size_t begin = 0, const size_t end = SIZE_MAX);
 
-size_t find_rom_eod(const std::vector<unsigned char> rom_data, const bool interchangeable_empty_byte = true);
+size_t find_rom_eod(const ByteSpan rom_data, const bool interchangeable_empty_byte = true);
 
 size_t next_aligned_address(const size_t address, const size_t alignment);
 
 void read_bytes_to_value(uint32_t & dest,
-						 const std::vector<unsigned char> read_data, const size_t read_pos, const size_t read_size,
+						 const ByteSpan read_data, const size_t read_pos, const size_t read_size,
 						 const Endianness read_endianness = BIG_ENDIAN_BYTE_ORDER);
 
 #endif //EZGBA_DATA_HPP
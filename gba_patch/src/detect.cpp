@@ -0,0 +1,64 @@
+#include <cstring>
+#include <algorithm>
+#include <array>
+
+#include "detect.hpp"
+
+
+// Every save library string ends with "_V" and three digits, e.g. "FLASH1M_V103". Instead of searching the ROM
+// once per library, look for the '_' of the common "_V" suffix with memchr and compare the few library strings
+// ending there. One linear pass over the ROM finds all of them.
+static const size_t SUFFIX_LENGTH = 5; // "_V" + 3 digits
+
+
+std::vector<SaveLibrary> detect_save_libraries(const ByteSpan rom_data) {
+	std::array<bool, gba::NO_SAVE + 1> found = {};
+	std::vector<SaveLibrary> libraries;
+
+	const unsigned char * data = rom_data.data;
+	const size_t data_len = rom_data.size;
+	size_t pos = 0;
+
+	while (pos + SUFFIX_LENGTH <= data_len) {
+		const void * hit = std::memchr(data + pos, '_', data_len - pos - SUFFIX_LENGTH + 1);
+		if (hit == NULL) {
+			break;
+		}
+		const size_t underscore = (const unsigned char *) hit - data;
+		pos = underscore + 1;
+
+		if (data[underscore + 1] != 'V') {
+			continue;
+		}
+
+		for (const gba::SaveType & save_type : gba::SAVE_TYPES) {
+			const std::vector<unsigned char> & pattern = gba::SAVE_TYPE_BYTE_PATTERNS.at(save_type);
+
+			if (found[save_type] || pattern.size() < SUFFIX_LENGTH) {
+				continue;
+			}
+
+			// The pattern starts this many bytes before the underscore.
+			const size_t prefix = pattern.size() - SUFFIX_LENGTH;
+
+			if (underscore >= prefix && underscore + SUFFIX_LENGTH <= data_len
+				&& std::memcmp(data + underscore - prefix, pattern.data(), pattern.size()) == 0) {
+				found[save_type] = true;
+				libraries.push_back(SaveLibrary(save_type, underscore - prefix));
+			}
+		}
+	}
+
+	// Same order as gba::SAVE_TYPES, the order the patches are applied in.
+	std::stable_sort(libraries.begin(), libraries.end(), [](const SaveLibrary & a, const SaveLibrary & b) {
+		return a.save_type < b.save_type;
+	});
+
+	return libraries;
+}
+
+
+std::string save_type_name(const gba::SaveType save_type) {
+	const std::vector<unsigned char> & pattern = gba::SAVE_TYPE_BYTE_PATTERNS.at(save_type);
+	return std::string(pattern.begin(), pattern.end());
+}
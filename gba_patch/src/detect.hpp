@@ -0,0 +1,23 @@
+#ifndef EZGBA_DETECT_HPP
+#define EZGBA_DETECT_HPP
+
+#include <string>
+#include <vector>
+
+#include "data.hpp"
+#include "gba.hpp"
+
+
+typedef struct SaveLibrary_ {
+	gba::SaveType save_type;
+	size_t offset;
+
+	SaveLibrary_(const gba::SaveType save_type, const size_t offset) : save_type(save_type), offset(offset) {}
+} SaveLibrary;
+
+
+std::vector<SaveLibrary> detect_save_libraries(const ByteSpan rom_data);
+
+std::string save_type_name(const gba::SaveType save_type);
+
+#endif //EZGBA_DETECT_HPP
@@ -1,5 +1,8 @@
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
 #include <iostream>
+#include "data.hpp"
+#include "detect.hpp"
 #include "misc.hpp"
 
 namespace py = pybind11;
@@ -25,8 +28,17 @@ int ips_patch(const std::string & rom_path, const std::string & ips_path, const
     else return 1;
 }
 
+std::vector<std::pair<std::string, size_t>> detect_save_types(const std::string & rom_path){
+    std::vector<std::pair<std::string, size_t>> libraries;
+    for (const SaveLibrary & library : detect_save_libraries(read_file(rom_path))) {
+        libraries.push_back(std::make_pair(save_type_name(library.save_type), library.offset));
+    }
+    return libraries;
+}
+
 PYBIND11_MODULE(gba_patch, m) {
     m.def("sram_patch", &sram_patch, py::arg("rom_path"), py::arg("out_path"));
     m.def("sram_patch_bank", &sram_patch_bank, py::arg("rom_path"), py::arg("out_path"), py::arg("sram_bank_type"));
     m.def("ips_patch", &ips_patch, py::arg("rom_path"), py::arg("ips_path"), py::arg("out_path"));
+    m.def("detect_save_types", &detect_save_types, py::arg("rom_path"));
 }
\ No newline at end of file
@@ -1,11 +1,13 @@
 #include <cassert>
 #include <cstddef>
+#include <cstring>
 #include <algorithm>
 #include <limits>
 #include <sstream>
 #include <vector>
 #include <cstdint>
 
+#include "detect.hpp"
 #include "error.hpp"
 #include "patch.hpp"
 
@@ -25,6 +27,36 @@ struct RomPatch {
 };
 
 
+bool SearchWindow_::whole_rom(const size_t rom_size) const {
+	return this->begin == 0 && this->end >= rom_size;
+}
+
+
+SearchWindow save_library_window(const size_t library_offset, const size_t radius) {
+	const size_t begin = library_offset > radius ? library_offset - radius : 0;
+	const size_t end = library_offset < SIZE_MAX - radius ? library_offset + radius : SIZE_MAX;
+	return SearchWindow(begin, end);
+}
+
+
+// replace_bytes in the window first, in the whole ROM if the pattern isn't there.
+ByteOffset replace_bytes_near(std::vector<unsigned char> & rom_data,
+							  const std::vector<unsigned char> & find_data,
+							  const std::vector<unsigned char> & replacement_data,
+							  const std::vector<bool> * find_mask,
+							  const std::vector<bool> * replacement_mask,
+							  const SearchWindow & window) {
+	ByteOffset result = replace_bytes(rom_data, find_data, replacement_data, find_mask, replacement_mask,
+									  window.begin, window.end);
+
+	if (!result.valid && !window.whole_rom(rom_data.size())) {
+		result = replace_bytes(rom_data, find_data, replacement_data, find_mask, replacement_mask);
+	}
+
+	return result;
+}
+
+
 void patch_complement_check(std::vector<unsigned char> & rom_data) {
 	if (rom_data.size() > 0xbd) {
 		// A byte is always 8 bits in D.
@@ -53,11 +85,7 @@ void uniformize_rom_padding(std::vector<unsigned char> &rom_data, const size_t a
 		size_t begin = alignment > 0 ? next_aligned_address(rom_eod, alignment) : rom_eod;
 
 		if (begin < ((size_t) 0) - 1 && begin < rom_data.size()) {
-			for (size_t i = begin; i < rom_data.size(); i++) {
-				if (rom_data[i] != empty) {
-					rom_data[i] = empty;
-				}
-			}
+			std::memset(rom_data.data() + begin, empty, rom_data.size() - begin);
 		}
 	}
 }
@@ -164,18 +192,14 @@ void apply_ips_patch(std::vector<unsigned char> &data, const std::vector<unsigne
 			// Array boundaries have been checked before; this shouldn't throw.
 			data.resize(write_pos+write_size > data.size() ? write_pos+write_size : data.size());
 
-			for (size_t i=0; i < write_size; i++) {
-				data[write_pos+i] = ips_patch[read_pos+i];
-			}
+			std::memcpy(data.data() + write_pos, ips_patch.data() + read_pos, write_size);
 
 			read_pos += write_size;
 		} else {
 			// RLE-encoded patch.
 			data.resize(write_pos+rle_size > data.size() ? write_pos+rle_size : data.size());
 
-			for (size_t i=write_pos; i < write_pos+rle_size; i++) {
-				data[i] = rle_value;
-			}
+			std::memset(data.data() + write_pos, rle_value, rle_size);
 		}
 	}
 
@@ -680,7 +704,8 @@ const std::vector<RomPatch> SRAM_PATCHES_FLASH_V12Z = {
 
 
 // EEPROM_V111 needs special, calculated patches.
-std::vector<ByteOffset> patch_eepromv111(std::vector<unsigned char> & rom_data, const bool interchangeable_empty_byte = true) {
+std::vector<ByteOffset> patch_eepromv111(std::vector<unsigned char> & rom_data, const bool interchangeable_empty_byte = true,
+										 const SearchWindow & window = SearchWindow()) {
 	// The three bytes preceding the last byte of this data need to be amended.
 	const std::vector<unsigned char> find1 = {0x0e, 0x48, 0x39, 0x68, 0x01, 0x60, 0x0e, 0x48};
 	const std::vector<unsigned char> replacement1 = {0x00, 0x48, 0x00, 0x47, 0, 0, 0, 0x08};
@@ -707,8 +732,8 @@ std::vector<ByteOffset> patch_eepromv111(std::vector<unsigned char> & rom_data,
 
 	std::vector<ByteOffset> results;
 
-	ByteOffset replace1_results = replace_bytes(rom_data, find1, replacement1);
-	ByteOffset replace2_results = replace_bytes(rom_data, find2, replacement2); // Second patch is just a normal patch.
+	ByteOffset replace1_results = replace_bytes_near(rom_data, find1, replacement1, NULL, NULL, window);
+	ByteOffset replace2_results = replace_bytes_near(rom_data, find2, replacement2, NULL, NULL, window); // Second patch is just a normal patch.
 
 	results.push_back(replace1_results);
 	results.push_back(replace2_results);
@@ -722,13 +747,10 @@ std::vector<ByteOffset> patch_eepromv111(std::vector<unsigned char> & rom_data,
 		bool is_big_endian = *(uint16_t *) "\0\xff" < 0x100;
 
 		// Ensure there's enough room for the footer.
-		rom_data.reserve(std::max(rom_data.size(), footer_offset+1));
-		rom_data.resize(std::max(rom_data.size(), footer_offset+1));
+		rom_data.resize(std::max(rom_data.size(), footer_offset+footer.size()));
 
 		// Write footer.
-		for (size_t i=0; i < footer.size(); i++) {
-			rom_data[footer_offset+i] = footer[i];
-		}
+		std::memcpy(rom_data.data() + footer_offset, footer.data(), footer.size());
 
 		results.push_back(ByteOffset(true, footer_offset));
 
@@ -765,11 +787,13 @@ std::vector<ByteOffset> patch_eepromv111(std::vector<unsigned char> & rom_data,
 };
 
 
-std::vector<ByteOffset> patch_sram_by_set(std::vector<unsigned char> & rom_data, const std::vector<RomPatch> & patch_set) {
+std::vector<ByteOffset> patch_sram_by_set(std::vector<unsigned char> & rom_data, const std::vector<RomPatch> & patch_set,
+										  const SearchWindow & window = SearchWindow()) {
 	std::vector<ByteOffset> results;
 
 	for (const RomPatch & patch : patch_set) {
-		results.push_back(replace_bytes(rom_data, patch.find_data, patch.replacement_data, &patch.find_mask, &patch.replacement_mask));
+		results.push_back(replace_bytes_near(rom_data, patch.find_data, patch.replacement_data, &patch.find_mask,
+											 &patch.replacement_mask, window));
 	}
 
 	return results;
@@ -777,39 +801,40 @@ std::vector<ByteOffset> patch_sram_by_set(std::vector<unsigned char> & rom_data,
 
 
 std::vector<ByteOffset> patch_sram_by_type(std::vector<unsigned char> & rom_data, const gba::SaveType save_type,
-						const unsigned char sram_bank_type, const bool interchangeable_empty_byte) {
+						const unsigned char sram_bank_type, const bool interchangeable_empty_byte,
+						const SearchWindow & window) {
 	std::vector<ByteOffset> results;
 
 	switch (save_type) {
 		case gba::FLASH_V120:
 		case gba::FLASH_V121:
-			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH_V12X);
+			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH_V12X, window);
 			break;
 
 		case gba::FLASH_V123:
 		case gba::FLASH_V124:
-			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH_V12Y);
+			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH_V12Y, window);
 			break;
 
 		case gba::FLASH_V125:
 		case gba::FLASH_V126:
-			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH_V12Z);
+			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH_V12Z, window);
 			break;
 
 		case gba::FLASH512_V130:
 		case gba::FLASH512_V131:
 		case gba::FLASH512_V133:
-			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH512_V13X);
+			results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH512_V13X, window);
 			break;
 
 		case gba::FLASH1M_V102:
 		    switch (sram_bank_type) {
 		        case 1:
-		            results = patch_sram_by_set(rom_data, SRAM_BANK_1_PATCHES_FLASH1M_V102);
+		            results = patch_sram_by_set(rom_data, SRAM_BANK_1_PATCHES_FLASH1M_V102, window);
 			        break;
 			    default:
 		        case 0:
-		            results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH1M_V102);
+		            results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH1M_V102, window);
 		            break;
 		    }
 			break;
@@ -817,31 +842,31 @@ std::vector<ByteOffset> patch_sram_by_type(std::vector<unsigned char> & rom_data
 		case gba::FLASH1M_V103:
 		    switch (sram_bank_type) {
 		        case 1:
-		            results = patch_sram_by_set(rom_data, SRAM_BANK_1_PATCHES_FLASH1M_V103);
+		            results = patch_sram_by_set(rom_data, SRAM_BANK_1_PATCHES_FLASH1M_V103, window);
 			        break;
 			    default:
 		        case 0:
-		            results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH1M_V103);
+		            results = patch_sram_by_set(rom_data, SRAM_PATCHES_FLASH1M_V103, window);
 		            break;
 		    }
 			break;
 
 		case gba::EEPROM_V111:
-			results = patch_eepromv111(rom_data, interchangeable_empty_byte);
+			results = patch_eepromv111(rom_data, interchangeable_empty_byte, window);
 			break;
 
 		case gba::EEPROM_V120:
 		case gba::EEPROM_V121:
 		case gba::EEPROM_V122:
-			results = patch_sram_by_set(rom_data, SRAM_PATCHES_EEPROM_V12X);
+			results = patch_sram_by_set(rom_data, SRAM_PATCHES_EEPROM_V12X, window);
 			break;
 
 		case gba::EEPROM_V124:
-			results = patch_sram_by_set(rom_data, SRAM_PATCHES_EEPROM_V124);
+			results = patch_sram_by_set(rom_data, SRAM_PATCHES_EEPROM_V124, window);
 			break;
 
 		case gba::EEPROM_V126:
-			results = patch_sram_by_set(rom_data, SRAM_PATCHES_EEPROM_V126);
+			results = patch_sram_by_set(rom_data, SRAM_PATCHES_EEPROM_V126, window);
 			break;
 
 		case gba::NO_SAVE:
@@ -863,14 +888,12 @@ std::vector<ByteOffset> patch_sram_by_type(std::vector<unsigned char> & rom_data
 std::vector<ByteOffset> patch_sram(std::vector<unsigned char> &rom_data, unsigned char sram_bank_type) {
 	std::vector<ByteOffset> results;
 
-	for (const gba::SaveType & save_type : gba::SAVE_TYPES) {
-		const std::vector<unsigned char> pattern = gba::SAVE_TYPE_BYTE_PATTERNS.at(save_type);
-
-		if (pattern.size() > 0 && find_bytes(rom_data, pattern)) {
-			std::vector<ByteOffset> foo = patch_sram_by_type(rom_data, save_type, sram_bank_type);
-			results.insert(results.end(), foo.begin(), foo.end());
-		}
+	// One pass over the ROM finds every save library, their patches are then looked for next to them.
+	for (const SaveLibrary & library : detect_save_libraries(rom_data)) {
+		std::vector<ByteOffset> foo = patch_sram_by_type(rom_data, library.save_type, sram_bank_type, true,
+														 save_library_window(library.offset));
+		results.insert(results.end(), foo.begin(), foo.end());
 	}
 
 	return results;
-}
\ No newline at end of file
+}
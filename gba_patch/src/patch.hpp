@@ -5,6 +5,23 @@
 #include "data.hpp"
 #include "gba.hpp"
 
+
+// The part of the ROM the SRAM patches are looked for in first, the neighbourhood of the save library.
+// Patches not found in it are looked for in the whole ROM.
+typedef struct SearchWindow_ {
+	size_t begin;
+	size_t end;
+
+	SearchWindow_(const size_t begin = 0, const size_t end = SIZE_MAX) : begin(begin), end(end) {}
+	bool whole_rom(const size_t rom_size) const;
+} SearchWindow;
+
+
+// How far from the save library string its code is expected.
+const size_t SAVE_LIBRARY_WINDOW = 0x10000;
+
+SearchWindow save_library_window(const size_t library_offset, const size_t radius = SAVE_LIBRARY_WINDOW);
+
 void patch_complement_check(std::vector<unsigned char> & rom_data);
 
 void uniformize_rom_padding(std::vector<unsigned char> &rom_data, const size_t alignment = 16);
@@ -17,6 +34,7 @@ void apply_ips_patch(std::vector<unsigned char> &data, const std::vector<unsigne
 std::vector<ByteOffset> patch_sram(std::vector<unsigned char> &rom_data, unsigned char sram_bank_type = 0);
 
 std::vector<ByteOffset> patch_sram_by_type(std::vector<unsigned char> &rom_data, const gba::SaveType save_type,
-						const unsigned char sram_bank_type = 0, const bool interchangeable_empty_byte = true);
+						const unsigned char sram_bank_type = 0, const bool interchangeable_empty_byte = true,
+						const SearchWindow & window = SearchWindow());
 
 #endif //EZGBA_PATCH_HPP
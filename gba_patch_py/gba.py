@@ -0,0 +1,36 @@
+# coding=utf-8
+from enum import Enum
+
+
+class SaveType(Enum):
+    # Same order as gba::SAVE_TYPES, the value is the save library string.
+    FLASH_V120 = b"FLASH_V120"
+    FLASH_V121 = b"FLASH_V121"
+    FLASH_V123 = b"FLASH_V123"
+    FLASH_V124 = b"FLASH_V124"
+    FLASH_V125 = b"FLASH_V125"
+    FLASH_V126 = b"FLASH_V126"
+    FLASH512_V130 = b"FLASH512_V130"
+    FLASH512_V131 = b"FLASH512_V131"
+    FLASH512_V133 = b"FLASH512_V133"
+    FLASH1M_V102 = b"FLASH1M_V102"
+    FLASH1M_V103 = b"FLASH1M_V103"
+    EEPROM_V111 = b"EEPROM_V111"
+    EEPROM_V120 = b"EEPROM_V120"
+    EEPROM_V121 = b"EEPROM_V121"
+    EEPROM_V122 = b"EEPROM_V122"
+    EEPROM_V124 = b"EEPROM_V124"
+    EEPROM_V126 = b"EEPROM_V126"
+    # SRAM and FRAM don't require extra patching for flash cart saving (except for the EZ4 patch).
+    SRAM_V110 = b"SRAM_V110"
+    SRAM_V111 = b"SRAM_V111"
+    SRAM_V112 = b"SRAM_V112"
+    SRAM_V113 = b"SRAM_V113"
+    FRAM_V100 = b"SRAM_F_V100"
+    FRAM_V102 = b"SRAM_F_V102"
+    FRAM_V103 = b"SRAM_F_V103"
+    FRAM_V110 = b"SRAM_F_V110"
+    NO_SAVE = b""
+
+
+SAVE_TYPES = list(SaveType)
@@ -1,7 +1,11 @@
 # coding=utf-8
+import functools
+import sys
 from enum import Enum
 
 from gba_patch_py.data import read_bytes_to_value
+from gba_patch_py.gba import SaveType, SAVE_TYPES
+from gba_patch_py.sram_patches import RomPatch, load_patch_sets
 
 
 def apply_ips_patch(rom_data: bytes, ips_data: bytes) -> bytes:
@@ -116,3 +120,222 @@ def patch_complement_check(rom_data: bytes) -> bytes:
         raise Exception("Invalid ROM data; data size too small.")
 
 
+# SRAM patching, the same as patch_sram of gba_patch. The patch sets are loaded from sram_patches.json.
+#
+# A masked pattern is searched as its longest run without wildcards (the anchor) with bytes.find, which runs at
+# memchr/memcmp speed. Only the candidates found this way are compared with the other runs of the pattern.
+
+SAVE_LIBRARY_WINDOW = 0x10000  # How far from the save library string its code is expected.
+_SUFFIX_LENGTH = 5  # "_V" + 3 digits, the end of every save library string
+_EMPTY_BLOCK_SIZE = 0x10000
+
+_patch_sets = None
+
+
+def _get_patch_sets() -> dict:
+    global _patch_sets
+    if _patch_sets is None:
+        _patch_sets = load_patch_sets()
+    return _patch_sets
+
+
+@functools.lru_cache(maxsize=None)
+def _pattern_runs(
+    find_data: bytes, wildcards: tuple[int, ...]
+) -> tuple[tuple[int, bytes], list[tuple[int, bytes]]]:
+    """The anchor (offset, bytes) of a masked pattern and its other runs without wildcards."""
+    runs, start = [], 0
+    for i in sorted(wildcards) + [len(find_data)]:
+        if i > start:
+            runs.append((start, find_data[start:i]))
+        start = i + 1
+    if not runs:
+        return (0, b""), []
+    anchor = max(runs, key=lambda run: len(run[1]))
+    return anchor, [run for run in runs if run is not anchor]
+
+
+def find_bytes(
+    data,
+    find_data: bytes,
+    wildcards: tuple[int, ...] = (),
+    begin: int = 0,
+    end: int | None = None,
+) -> int:
+    """Offset of the first match lying completely in [begin, end), -1 if none."""
+    end = len(data) if end is None else min(end, len(data))
+    if not find_data or begin + len(find_data) > end:
+        return -1
+    if not wildcards:
+        return data.find(find_data, begin, end)
+
+    (anchor_offset, anchor), runs = _pattern_runs(find_data, wildcards)
+    if not anchor:
+        return begin  # Everything is a wildcard.
+    tail = len(find_data) - anchor_offset - len(anchor)
+    pos = data.find(anchor, begin + anchor_offset, end - tail)
+    while pos != -1:
+        start = pos - anchor_offset
+        if all(
+            data[start + offset : start + offset + len(run)] == run
+            for offset, run in runs
+        ):
+            return start
+        pos = data.find(anchor, pos + 1, end - tail)
+    return -1
+
+
+def replace_bytes(
+    data: bytearray,
+    patch: RomPatch,
+    begin: int = 0,
+    end: int | None = None,
+) -> int:
+    """Overwrites the first match of the patch with its replacement, up to the end of data. Returns the offset."""
+    offset = find_bytes(data, patch.find_data, patch.find_wildcards, begin, end)
+    if offset != -1:
+        replacement = patch.replacement_data[: len(data) - offset]
+        if not patch.replacement_skips:
+            data[offset : offset + len(replacement)] = replacement
+        else:
+            skips = set(patch.replacement_skips)
+            for i, value in enumerate(replacement):
+                if i not in skips:
+                    data[offset + i] = value
+    return offset
+
+
+def _replace_bytes_near(data: bytearray, patch: RomPatch, window: tuple[int, int]) -> int:
+    # In the window first, in the whole ROM if the pattern isn't there.
+    offset = replace_bytes(data, patch, *window)
+    if offset == -1 and (window[0] > 0 or window[1] < len(data)):
+        offset = replace_bytes(data, patch)
+    return offset
+
+
+def save_library_window(
+    library_offset: int, radius: int = SAVE_LIBRARY_WINDOW
+) -> tuple[int, int]:
+    return max(library_offset - radius, 0), library_offset + radius
+
+
+def detect_save_libraries(data) -> list[tuple[SaveType, int]]:
+    """The first offset of every save library string, in SAVE_TYPES order. One pass over the ROM."""
+    found = dict()
+    pos = data.find(b"_V")
+    while pos != -1:
+        for save_type in SAVE_TYPES:
+            pattern = save_type.value
+            if save_type in found or len(pattern) < _SUFFIX_LENGTH:
+                continue
+            start = pos - (len(pattern) - _SUFFIX_LENGTH)
+            if start >= 0 and data[start : start + len(pattern)] == pattern:
+                found[save_type] = start
+        pos = data.find(b"_V", pos + 1)
+    return [(save_type, found[save_type]) for save_type in SAVE_TYPES if save_type in found]
+
+
+def find_rom_eod(data, interchangeable_empty_byte: bool = True) -> int:
+    """Offset of the last byte that isn't padding."""
+    end_byte = data[-1]
+    if end_byte not in (0x00, 0xFF):
+        return len(data) - 1
+    empty = b"\x00\xff" if interchangeable_empty_byte else bytes([end_byte])
+    for block_end in range(len(data), 0, -_EMPTY_BLOCK_SIZE):
+        block_start = max(block_end - _EMPTY_BLOCK_SIZE, 0)
+        used = len(bytes(data[block_start:block_end]).rstrip(empty))
+        if used > 0:
+            return block_start + used - 1
+    return 0
+
+
+def next_aligned_address(address: int, alignment: int) -> int:
+    return (address + alignment - 1) // alignment * alignment
+
+
+EEPROM_V111_FOOTER = bytes.fromhex(
+    "39682748814223d0891c0888012802d1"
+    "2448786033e000230022891c10b40124"
+    "086820405b000343891c521c062af7d1"
+    "10bc3960db01022000021b180e200006"
+    "1b187b60391c083108880938088016e0"
+    "15490023002210b40124086820405b00"
+    "0343891c521c062af7d110bcdb010220"
+    "00021b180e2000061b18083b3b600b48"
+    "396801600a48796801600a48391c0831"
+    "0a88802109060a430260074800470000"
+    "0000000d0000000e0400000ed4000004"
+    "d8000004dc00000400000008"
+)
+
+
+def patch_eepromv111(
+    data: bytearray, window: tuple[int, int], interchangeable_empty_byte: bool = True
+) -> list[int]:
+    # EEPROM_V111 needs special, calculated patches.
+    # The three bytes preceding the last byte of the first replacement need to be amended.
+    patch1 = RomPatch(bytes.fromhex("0e48396801600e48"), bytes.fromhex("0048004700000008"))
+    patch2 = RomPatch(bytes.fromhex("27e0d02000050188"), bytes.fromhex("27e0e02000050188"))
+
+    footer_offset = next_aligned_address(find_rom_eod(data, interchangeable_empty_byte) + 1, 16)
+    off1 = _replace_bytes_near(data, patch1, window)
+    off2 = _replace_bytes_near(data, patch2, window)  # Second patch is just a normal patch.
+    if off1 == -1:
+        raise Exception(
+            "Failed to find leading pattern in ROM for EEPROM_V111 to SRAM patch. Cannot write supplement or footer patch."
+        )
+
+    # Ensure there's enough room for the footer.
+    if len(data) < footer_offset + len(EEPROM_V111_FOOTER):
+        data.extend(bytes(footer_offset + len(EEPROM_V111_FOOTER) - len(data)))
+    data[footer_offset : footer_offset + len(EEPROM_V111_FOOTER)] = EEPROM_V111_FOOTER
+    # Amend first patch and footer patch.
+    data[off1 + 4 : off1 + 7] = ((footer_offset + 1) & 0xFFFFFF).to_bytes(3, "little")
+    data[footer_offset + 184 : footer_offset + 187] = ((off1 + 33) & 0xFFFFFF).to_bytes(3, "little")
+    return [off1, off2, footer_offset, off1, footer_offset]
+
+
+def _patch_set_name(save_type: SaveType, sram_bank_type: int) -> str | None:
+    name = save_type.name
+    if name.startswith("FLASH1M_"):
+        bank = "BANK_1_" if sram_bank_type == 1 else ""
+        return f"SRAM_{bank}PATCHES_{name}"
+    if name in ("FLASH_V120", "FLASH_V121"):
+        return "SRAM_PATCHES_FLASH_V12X"
+    if name in ("FLASH_V123", "FLASH_V124"):
+        return "SRAM_PATCHES_FLASH_V12Y"
+    if name in ("FLASH_V125", "FLASH_V126"):
+        return "SRAM_PATCHES_FLASH_V12Z"
+    if name.startswith("FLASH512_"):
+        return "SRAM_PATCHES_FLASH512_V13X"
+    if name in ("EEPROM_V120", "EEPROM_V121", "EEPROM_V122"):
+        return "SRAM_PATCHES_EEPROM_V12X"
+    if name in ("EEPROM_V124", "EEPROM_V126"):
+        return f"SRAM_PATCHES_{name}"
+    return None  # EEPROM_V111 is calculated, SRAM, FRAM and no save don't need patches.
+
+
+def patch_sram_by_type(
+    data: bytearray,
+    save_type: SaveType,
+    sram_bank_type: int = 0,
+    interchangeable_empty_byte: bool = True,
+    window: tuple[int, int] = (0, sys.maxsize),
+) -> list[int]:
+    if save_type == SaveType.EEPROM_V111:
+        return patch_eepromv111(data, window, interchangeable_empty_byte)
+    name = _patch_set_name(save_type, sram_bank_type)
+    if name is None:
+        return []
+    return [_replace_bytes_near(data, patch, window) for patch in _get_patch_sets()[name]]
+
+
+def patch_sram(data: bytearray, sram_bank_type: int = 0) -> list[int]:
+    """Patches every save library found in the ROM to SRAM, returns the patch offsets (-1: not found)."""
+    results = []
+    # One pass over the ROM finds every save library, their patches are then looked for next to them.
+    for save_type, offset in detect_save_libraries(data):
+        results += patch_sram_by_type(
+            data, save_type, sram_bank_type, True, save_library_window(offset)
+        )
+    return results
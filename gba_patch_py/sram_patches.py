@@ -0,0 +1,112 @@
+# coding=utf-8
+# The SRAM patch sets of gba_patch (the RomPatch tables of gba_patch/src/patch.cpp), shipped as package data
+# (sram_patches.json) next to this module. Check or regenerate the data file after changing the C++ tables:
+#
+# python -m gba_patch_py.sram_patches --check gba_patch/src/patch.cpp
+# python -m gba_patch_py.sram_patches --write gba_patch/src/patch.cpp
+import argparse
+import json
+import os
+import re
+import sys
+import typing
+from importlib import resources
+
+DATA_FILE = "sram_patches.json"
+
+
+class RomPatch(typing.NamedTuple):
+    find_data: bytes
+    replacement_data: bytes
+    find_wildcards: tuple[int, ...] = ()  # indices of find_data matching any byte
+    replacement_skips: tuple[int, ...] = ()  # indices of replacement_data not written
+
+
+def _from_json(entry: dict) -> RomPatch:
+    return RomPatch(
+        bytes.fromhex(entry["find"]),
+        bytes.fromhex(entry["replace"]),
+        tuple(entry.get("find_wildcards", ())),
+        tuple(entry.get("replace_skips", ())),
+    )
+
+
+def _to_json(patch: RomPatch) -> dict:
+    entry = {"find": patch.find_data.hex(), "replace": patch.replacement_data.hex()}
+    if patch.find_wildcards:
+        entry["find_wildcards"] = list(patch.find_wildcards)
+    if patch.replacement_skips:
+        entry["replace_skips"] = list(patch.replacement_skips)
+    return entry
+
+
+def load_patch_sets() -> dict[str, list[RomPatch]]:
+    data = resources.files(__package__).joinpath(DATA_FILE).read_text(encoding="UTF-8")
+    return {
+        name: [_from_json(entry) for entry in patches]
+        for name, patches in json.loads(data).items()
+    }
+
+
+def _brace_groups(text: str) -> list[str]:
+    groups, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if char == "{":
+            if depth == 0:
+                start = i + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                groups.append(text[start:i])
+    return groups
+
+
+def parse_cpp_patch_sets(source: str) -> dict[str, list[RomPatch]]:
+    """The `const std::vector<RomPatch> NAME = {...};` tables of patch.cpp."""
+    source = re.sub(r"//[^\n]*", "", source)
+    patch_sets = dict()
+    for table in re.finditer(r"const std::vector<RomPatch> (\w+) = \{(.*?)\n\};", source, re.S):
+        patches = []
+        for body in re.split(r"\bRomPatch\(", table.group(2))[1:]:
+            groups = _brace_groups(body)
+            values = [re.findall(r"0x[0-9a-fA-F]+|\d+", group) for group in groups[:2]]
+            masks = [re.findall(r"true|false", group) for group in groups[2:4]]
+            masks += [[]] * (2 - len(masks))
+            patches.append(
+                RomPatch(
+                    bytes(int(value, 0) for value in values[0]),
+                    bytes(int(value, 0) for value in values[1]),
+                    tuple(i for i, value in enumerate(masks[0]) if value == "true"),
+                    tuple(i for i, value in enumerate(masks[1]) if value == "true"),
+                )
+            )
+        patch_sets[table.group(1)] = patches
+    return patch_sets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checks or regenerates " + DATA_FILE)
+    parser.add_argument("patch_cpp", help="path of gba_patch/src/patch.cpp")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--check", action="store_true", help="compares the data file with patch.cpp")
+    group.add_argument("--write", action="store_true", help="writes the data file from patch.cpp")
+    args = parser.parse_args()
+
+    with open(args.patch_cpp, "r", encoding="UTF-8") as f:
+        cpp_sets = parse_cpp_patch_sets(f.read())
+    if args.write:
+        data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), DATA_FILE)
+        with open(data_path, "w", encoding="UTF-8") as f:
+            json.dump(
+                {name: [_to_json(p) for p in patches] for name, patches in cpp_sets.items()},
+                f,
+                indent=4,
+            )
+            f.write("\n")
+        print(f"Wrote {len(cpp_sets)} patch sets to {data_path}")
+        sys.exit(0)
+    if cpp_sets != load_patch_sets():
+        print(f"{DATA_FILE} differs from {args.patch_cpp}, regenerate it with --write.")
+        sys.exit(1)
+    print(f"{DATA_FILE} matches {args.patch_cpp}.")
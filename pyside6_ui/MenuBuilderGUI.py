@@ -6,7 +6,6 @@ import subprocess
 import typing
 import base64
 import platform
-from PIL import Image
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -29,14 +28,24 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QStyleFactory,
     QSizePolicy,
+    QStyle,
+)
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QThread,
+    QThreadPool,
+    QRunnable,
+    QObject,
+    Signal,
+    QMimeData,
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QMimeData
 from PySide6.QtGui import QPixmap, QIcon, QAction, QFont, QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import QAbstractItemView
 
-from utils import MenuBuilder
 from resources_src import Resource, I18n, Config
 from rom_builder.cartridge_config import cartridge_types
+from utils import RomImport
 
 # These code are still really poor quality, a little better than the tkinter version.
 # Seems it won't be rebuilt.
@@ -53,6 +62,9 @@ class BuildThread(QThread):
         self.game_list = game_list
 
     def run(self):
+        # Deferred so the patchers and their payloads are only loaded on first build.
+        from utils import MenuBuilder
+
         msg, err = [], []
         for result in MenuBuilder.build_start(
             self.options, self.argoptions, self.game_list
@@ -64,6 +76,61 @@ class BuildThread(QThread):
         self.build_finished.emit(msg, err)
 
 
+ANALYSIS_THREADS = 2  # every worker keeps a 32 MiB ROM buffer
+COLUMN_SAVE_TYPE, COLUMN_SIZE, COLUMN_WARNING = 3, 4, 5
+
+
+class AnalysisSignals(QObject):
+    finished = Signal(str, object)
+
+
+class AnalysisTask(QRunnable):
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.signals = AnalysisSignals()
+
+    def run(self):
+        # Deferred like the build, the patchers are loaded by the first analysis.
+        from utils import RomAnalysis
+
+        analysis = RomAnalysis.RomAnalysis(
+            self.path, None, 0, None, "none", False, False, (RomAnalysis.UNREADABLE,)
+        )
+        try:
+            analysis = RomAnalysis.analyse(self.path)
+        finally:
+            # Always, or the game would show as being analysed for good and never be analysed again.
+            self.signals.finished.emit(self.path, analysis)
+
+
+class ImportSignals(QObject):
+    batch = Signal(object)
+    finished = Signal()
+
+
+class ImportTask(QRunnable):
+
+    def __init__(self, paths, exclude):
+        super().__init__()
+        self.paths = paths
+        self.exclude = exclude
+        self.signals = ImportSignals()
+
+    def run(self):
+        # Walking large folders, maybe on a network drive, would freeze the window, the rows are added per batch.
+        for batch in RomImport.batches(RomImport.find_roms(self.paths, self.exclude)):
+            self.signals.batch.emit(batch)
+        self.signals.finished.emit()
+
+
+def format_size(size: int) -> str:
+    if size >= 0x100000:
+        return f"{size / 0x100000:g} MB"
+    return f"{size // 0x400} KB"
+
+
 class GbaStruct(typing.TypedDict):
     path: str
     name: str
@@ -325,20 +392,14 @@ class DragDropTreeWidget(QTreeWidget):
                         if file_path and os.path.exists(file_path):
                             file_paths.append(file_path)
 
-        for file_path in file_paths:
-            if os.path.splitext(file_path)[1].lower() in [
-                ".gba",
-                ".gbc",
-                ".gb",
-                ".nes",
-            ]:
-                parent = self.parent()
-                while parent and not hasattr(parent, "handle_dropped_file"):
-                    parent = parent.parent()
-
-                if parent and hasattr(parent, "handle_dropped_file"):
-                    parent.handle_dropped_file(file_path)
-                    break
+        parent = self.parent()
+        while parent and not hasattr(parent, "handle_dropped_file"):
+            parent = parent.parent()
+
+        if parent and RomImport.is_bulk(file_paths):
+            parent.import_games(file_paths)
+        elif parent and file_paths and RomImport.is_rom(file_paths[0]):
+            parent.handle_dropped_file(file_paths[0])
 
         event.acceptProposedAction()
 
@@ -357,6 +418,13 @@ class MenuBuilderGUI(QMainWindow):
         self.bg_path = ""
         self.build_thread = None
 
+        # Games are analysed in the background as soon as they are added, the build reuses the analyses.
+        self.analysis_pool = QThreadPool(self)
+        self.analysis_pool.setMaxThreadCount(ANALYSIS_THREADS)
+        self.analysis_tasks: dict[str, AnalysisTask] = dict()
+        self.analyses: dict[str, object] = dict()
+        self.import_tasks: list[ImportTask] = []
+
         self.init_ui()
         self.apply_theme(config.tk_theme)
 
@@ -456,6 +524,7 @@ class MenuBuilderGUI(QMainWindow):
                 self.app_lang.table_rom_headings[
                     list(self.app_lang.table_rom_headings.keys())[2]
                 ],
+                *self.app_lang.table_rom_analysis_headings.values(),
             ]
         )
         self.table_game_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
@@ -516,6 +585,7 @@ class MenuBuilderGUI(QMainWindow):
         self.check_cartridge_battery_type.stateChanged.connect(
             self.toggle_use_rts_visibility
         )
+        self.check_cartridge_battery_type.stateChanged.connect(self.annotate_games)
         settings_layout.addWidget(
             self.check_cartridge_battery_type, row, 1, Qt.AlignLeft
         )
@@ -551,8 +621,29 @@ class MenuBuilderGUI(QMainWindow):
         self.check_sram_bank.setChecked(False)
         settings_layout.addWidget(self.check_sram_bank, row, 1, Qt.AlignLeft)
 
+        # Bundle GB/NES games
+        row += 1
+        settings_layout.addWidget(QLabel(self.app_lang.text_bundle_emulator), row, 0)
+        self.check_bundle_emulator = QCheckBox()
+        self.check_bundle_emulator.setChecked(False)
+        settings_layout.addWidget(self.check_bundle_emulator, row, 1, Qt.AlignLeft)
+
+        # Tight ROM sizing
+        row += 1
+        settings_layout.addWidget(QLabel(self.app_lang.text_tight_rom_size), row, 0)
+        self.check_tight_rom_size = QCheckBox()
+        self.check_tight_rom_size.setChecked(False)
+        settings_layout.addWidget(self.check_tight_rom_size, row, 1, Qt.AlignLeft)
+
         frame_layout.addWidget(frame_settings)
 
+        # The mapped sizes depend on the cartridge settings.
+        self.combo_cartridge_type.currentIndexChanged.connect(self.annotate_games)
+        self.combo_cartridge_min_rom_size.currentIndexChanged.connect(
+            self.annotate_games
+        )
+        self.check_tight_rom_size.stateChanged.connect(self.annotate_games)
+
         # Background Image
         frame_layout.addWidget(QLabel(self.app_lang.text_lk_bg))
 
@@ -590,6 +681,9 @@ class MenuBuilderGUI(QMainWindow):
         if file_ext not in [".gba", ".gbc", ".gb", ".nes"]:
             return
 
+        # Start while the dialog is open.
+        self.analyse_game(file_path)
+
         dialog = EditRomDialog(
             self, self.app_lang.window_title_add_rom, is_new_rom=True
         )
@@ -599,6 +693,50 @@ class MenuBuilderGUI(QMainWindow):
         if dialog.exec() == QDialog.Accepted:
             self.add_game(dialog.get_rom_info())
 
+    def import_games(self, paths):
+        # Games already in the list aren't added again, e.g. when a folder is dropped twice.
+        task = ImportTask(
+            paths,
+            [
+                self.table_game_list.topLevelItem(i).text(1)
+                for i in range(self.table_game_list.topLevelItemCount())
+            ],
+        )
+        task.signals.batch.connect(self.on_import_batch)
+        task.signals.finished.connect(lambda: self.on_import_finished(task))
+        self.import_tasks.append(task)
+        QThreadPool.globalInstance().start(task)
+
+    def on_import_batch(self, roms):
+        global max_slot
+        # Imports running at the same time, e.g. the same folder dropped twice, may find the same games, and the
+        # games they add after the drop aren't excluded, so the list is checked again when adding.
+        listed = {
+            RomImport.path_key(self.table_game_list.topLevelItem(i).text(1))
+            for i in range(self.table_game_list.topLevelItemCount())
+        }
+        # Every game gets a save slot of its own, like the add dialog suggests.
+        items = []
+        for rom in roms:
+            if RomImport.path_key(rom.path) in listed:
+                continue
+            listed.add(RomImport.path_key(rom.path))
+            items.append(QTreeWidgetItem([rom.name, rom.path, str(max_slot)]))
+            max_slot += 1
+
+        self.table_game_list.setUpdatesEnabled(False)
+        try:
+            self.table_game_list.addTopLevelItems(items)
+            for item in items:
+                self.analyse_game(item.text(1))
+                self.annotate_game(item)
+        finally:
+            self.table_game_list.setUpdatesEnabled(True)
+
+    def on_import_finished(self, task: ImportTask):
+        self.import_tasks.remove(task)
+        self.update_button_states()
+
     def show_window_add_rom(self):
         dialog = EditRomDialog(
             self, self.app_lang.window_title_add_rom, is_new_rom=True
@@ -698,6 +836,8 @@ class MenuBuilderGUI(QMainWindow):
             ]
         )
         self.table_game_list.addTopLevelItem(item)
+        self.analyse_game(game_info["path"])
+        self.annotate_game(item)
 
     def edit_game(self, game_info: GbaStruct, item: QTreeWidgetItem):
         global max_slot
@@ -711,6 +851,8 @@ class MenuBuilderGUI(QMainWindow):
                 else "None"
             ),
         )
+        self.analyse_game(game_info["path"])
+        self.annotate_game(item)
 
         max_save_slot = 0
         for i in range(self.table_game_list.topLevelItemCount()):
@@ -721,6 +863,71 @@ class MenuBuilderGUI(QMainWindow):
 
         max_slot = max_save_slot + 1
 
+    def analyse_game(self, path: str):
+        if path in self.analysis_tasks:
+            return
+        # Cheap for files analysed before, RomAnalysis checks whether they changed.
+        task = AnalysisTask(path)
+        task.signals.finished.connect(self.on_analysis_finished)
+        self.analysis_tasks[path] = task
+        self.analysis_pool.start(task)
+
+    def on_analysis_finished(self, path: str, analysis):
+        self.analysis_tasks.pop(path, None)
+        self.analyses[path] = analysis
+        # Searched by Qt, the list may hold hundreds of games after a bulk import.
+        for item in self.table_game_list.findItems(path, Qt.MatchExactly, 1):
+            self.annotate_game(item)
+
+    def annotate_games(self):
+        for i in range(self.table_game_list.topLevelItemCount()):
+            self.annotate_game(self.table_game_list.topLevelItem(i))
+
+    def annotate_game(self, item: QTreeWidgetItem):
+        path = item.text(1)
+        analysis = self.analyses.get(path)
+        if analysis is None or path in self.analysis_tasks:
+            item.setText(COLUMN_SAVE_TYPE, self.app_lang.text_analysing)
+            item.setText(COLUMN_SIZE, "")
+            item.setText(COLUMN_WARNING, "")
+            item.setIcon(COLUMN_WARNING, QIcon())
+            return
+
+        save_type = analysis.save_type if analysis.is_gba else ""
+        if analysis.sram_ips:
+            save_type += f" ({self.app_lang.text_sram_ips})"
+        item.setText(COLUMN_SAVE_TYPE, save_type)
+
+        cartridge = cartridge_types[self.combo_cartridge_type.currentIndex()]
+        mapped_size = analysis.mapped_size(
+            "tight" if self.check_tight_rom_size.isChecked() else "legacy",
+            cartridge["sector_size"],
+            cartridge["block_size"],
+            self.app_lang.text_cart_min_size_list[
+                list(self.app_lang.text_cart_min_size_list.keys())[
+                    self.combo_cartridge_min_rom_size.currentIndex()
+                ]
+            ],
+            # Patched like the build does, without a battery every game with a save slot.
+            batteryless=not self.check_cartridge_battery_type.isChecked()
+            and item.text(2) != "None",
+        )
+        item.setText(COLUMN_SIZE, "" if mapped_size is None else format_size(mapped_size))
+
+        warning = "; ".join(
+            self.app_lang.analysis_warnings[warning] for warning in analysis.warnings
+        )
+        item.setText(COLUMN_WARNING, warning)
+        item.setToolTip(COLUMN_WARNING, warning)
+        item.setIcon(
+            COLUMN_WARNING,
+            (
+                self.style().standardIcon(QStyle.SP_MessageBoxWarning)
+                if warning
+                else QIcon()
+            ),
+        )
+
     def toggle_use_rts_visibility(self):
         if self.check_cartridge_battery_type.isChecked():
             self.label_batteryless_autosave.hide()
@@ -742,6 +949,8 @@ class MenuBuilderGUI(QMainWindow):
         )
 
         if file_path:
+            from PIL import Image
+
             image = Image.open(file_path)
             if image.size == (240, 160):
                 self.bg_path = file_path
@@ -780,6 +989,9 @@ class MenuBuilderGUI(QMainWindow):
                     self.combo_cartridge_min_rom_size.currentIndex()
                 ]
             ],
+            "size_policy": (
+                "tight" if self.check_tight_rom_size.isChecked() else "legacy"
+            ),
         }
 
         argoptions = {}
@@ -787,6 +999,7 @@ class MenuBuilderGUI(QMainWindow):
         argoptions["sram_bank_type"] = 1 if self.check_sram_bank.isChecked() else 0
         argoptions["use_rts"] = self.check_use_rts.isChecked()
         argoptions["batteryless_autosave"] = self.check_batteryless_autosave.isChecked()
+        argoptions["bundle_emulator"] = self.check_bundle_emulator.isChecked()
 
         if self.bg_path:
             argoptions["bg"] = self.bg_path
@@ -830,6 +1043,8 @@ class MenuBuilderGUI(QMainWindow):
                 error_list.append(
                     {"game": error.path, "type": error.type, "msg": error.msg}
                 )
+                if error.log:
+                    error_list[-1]["log"] = error.log.splitlines()
 
             error_log = {
                 "options": self.build_thread.options,
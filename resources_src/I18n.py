@@ -56,11 +56,24 @@ class lang_base(ABC):
     text_sram_bank: str
     text_use_rts: str
     text_batteryless_autosave: str
+    text_bundle_emulator: str
+    text_tight_rom_size: str
     text_cart_min_size_list: dict[str, int] = {"4 MB": 4194304, "512 KB": 524288, "8 MB": 4194304}
     text_about_title: str
     text_about_url: str = "https://github.com/orzgithub/GBA_MultiMenu_GUI"
     text_about_version: str = "Beta 0.3"
     table_rom_headings: dict[str, str] = {"name": "", "path": "", "save_slot": ""}
+    table_rom_analysis_headings: dict[str, str] = {"save_type": "", "size": "", "warning": ""}
+    text_analysing: str
+    text_sram_ips: str
+    analysis_warnings: dict[str, str] = {
+        "unreadable": "",
+        "truncated": "",
+        "too_large": "",
+        "already_patched": "",
+        "no_irq_reference": "",
+        "no_payload_room": "",
+    }
     frame_rom_mgr: str
     frame_rom_gen: str
     button_done: str
@@ -125,12 +138,29 @@ class zh_CN(lang_base):
     text_sram_bank: str = "SRAM 1M存档支持"
     text_use_rts: str = "使用即时存档"
     text_batteryless_autosave: str = "无电池存档自动存档"
+    text_bundle_emulator: str = "GB/NES游戏合并到同一模拟器"
+    text_tight_rom_size: str = "紧凑ROM空间分配"
     text_about_title: str = "LK合卡菜单生成"
     table_rom_headings: dict[str, str] = {
         "name": "名称",
         "path": "路径",
         "save_slot": "存档槽位",
     }
+    table_rom_analysis_headings: dict[str, str] = {
+        "save_type": "存档类型",
+        "size": "占用空间",
+        "warning": "警告",
+    }
+    text_analysing: str = "分析中…"
+    text_sram_ips: str = "IPS补丁"
+    analysis_warnings: dict[str, str] = {
+        "unreadable": "无法读取文件",
+        "truncated": "文件太小，不是GBA ROM",
+        "too_large": "ROM超过32MB",
+        "already_patched": "已打过免电池或RTS补丁",
+        "no_irq_reference": "无法打免电池或RTS补丁（未找到中断处理地址）",
+        "no_payload_room": "无法打免电池补丁（ROM没有空间）",
+    }
     frame_rom_mgr: str = "GBA ROM管理"
     frame_rom_gen: str = "菜单参数"
     button_done: str = "完成"
@@ -202,12 +232,29 @@ class en_US(lang_base):
     text_sram_bank: str = "SRAM 1M save support"
     text_use_rts: str = "Use RTS"
     text_batteryless_autosave: str = "Batteryless save auto save"
+    text_bundle_emulator: str = "Bundle GB/NES games"
+    text_tight_rom_size: str = "Tight ROM sizing"
     text_about_title: str = "LK Muiltmenu builder"
     table_rom_headings: dict[str, str] = {
         "name": "Name",
         "path": "Path",
         "save_slot": "Save slot",
     }
+    table_rom_analysis_headings: dict[str, str] = {
+        "save_type": "Save type",
+        "size": "Size",
+        "warning": "Warning",
+    }
+    text_analysing: str = "Analysing…"
+    text_sram_ips: str = "IPS patch"
+    analysis_warnings: dict[str, str] = {
+        "unreadable": "The file can't be read",
+        "truncated": "The file is too small to be a GBA ROM",
+        "too_large": "The ROM is larger than 32 MB",
+        "already_patched": "Already batteryless or RTS patched",
+        "no_irq_reference": "Can't be batteryless or RTS patched (no IRQ handler reference)",
+        "no_payload_room": "Can't be batteryless patched (no room in the ROM)",
+    }
     frame_rom_mgr: str = "GBA ROM Manager"
     frame_rom_gen: str = "Menu Settings"
     button_done: str = "Done"
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# GBA Multi Game Menu – Build log
+#
+# Every build writes to its own log. The latest records are kept in a ring buffer, and the log file is written
+# while the build runs, as plain text or as JSON lines, so nothing accumulates between builds. Builds logging to the
+# same file share one handle per process, which writes and flushes every record whole, so records don't interleave.
+import collections
+import datetime
+import json
+import logging
+import os
+import threading
+import typing
+
+LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+RING_BUFFER_SIZE = 1000
+
+
+class LogRecord(typing.NamedTuple):
+    time: datetime.datetime
+    level: int
+    message: str
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "time": self.time.isoformat(timespec="milliseconds"),
+                "level": logging.getLevelName(self.level).lower(),
+                "message": self.message,
+            },
+            ensure_ascii=False,
+        )
+
+
+class _LogFile:
+    def __init__(self, key: str, path: str, encoding: str):
+        self.key = key
+        self.encoding = encoding
+        self.users = 0
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding=encoding)
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self._file.write(text)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+_log_files: dict[str, _LogFile] = dict()
+_log_files_lock = threading.Lock()
+
+
+def _open_log_file(path: str, encoding: str) -> _LogFile:
+    key = os.path.normcase(os.path.abspath(path))
+    with _log_files_lock:
+        log_file = _log_files.get(key)
+        if log_file is None:
+            log_file = _log_files[key] = _LogFile(key, path, encoding)
+        elif log_file.encoding != encoding:
+            raise ValueError(
+                f"“{path}” is already logged to as {'JSON lines' if log_file.encoding == 'UTF-8' else 'text'}."
+            )
+        log_file.users += 1
+        return log_file
+
+
+def _close_log_file(log_file: _LogFile) -> None:
+    with _log_files_lock:
+        log_file.users -= 1
+        if log_file.users == 0:
+            del _log_files[log_file.key]
+            log_file.close()
+
+
+class BuildLog:
+    def __init__(
+        self,
+        path: str | None = None,
+        level: str = "info",
+        json_lines: bool = False,
+        echo: bool = True,
+        capacity: int = RING_BUFFER_SIZE,
+    ):
+        if level not in LOG_LEVELS:
+            raise ValueError(f"Unknown log level “{level}”.")
+        self.level = LOG_LEVELS[level]
+        self.json_lines = json_lines
+        self.echo = echo
+        self.records: collections.deque[LogRecord] = collections.deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._file = None
+        if path is not None:
+            self._file = _open_log_file(path, "UTF-8" if json_lines else "UTF-8-SIG")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                _close_log_file(self._file)
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, message: str, level: int = logging.INFO, echo: bool | None = None) -> None:
+        if level < self.level:
+            return
+        record = LogRecord(datetime.datetime.now(), level, message)
+        with self._lock:
+            self.records.append(record)
+            if self.echo if echo is None else echo:
+                print(message)
+            if self._file is not None:
+                self._file.write(record.to_json() + "\n" if self.json_lines else message + "\n")
+
+    def debug(self, message: str) -> None:
+        self.write(message, logging.DEBUG)
+
+    def info(self, message: str) -> None:
+        self.write(message, logging.INFO)
+
+    def warning(self, message: str) -> None:
+        self.write(message, logging.WARNING)
+
+    def error(self, message: str) -> None:
+        self.write(message, logging.ERROR)
+
+    def text(self) -> str:
+        """The buffered part of the log."""
+        with self._lock:
+            return "".join(record.message + "\n" for record in self.records)
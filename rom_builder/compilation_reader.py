@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+# GBA Multi Game Menu – Compilation reader
+#
+# Memory maps an existing compilation (or its _partN files) and decodes the item list, the status sector and
+# the save slots lazily, so single games or saves can be extracted without loading the whole image.
+import argparse
+import bisect
+import glob
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import typing
+
+if __package__:
+    from .cartridge_config import cartridge_types
+    from .item_list import ITEM_RECORD, ItemRecord, decode_record
+else:  # run directly
+    from cartridge_config import cartridge_types
+    from item_list import ITEM_RECORD, ItemRecord, decode_record
+
+BLOCK_SIZE = 0x80000
+ITEM_LIST_ALIGN = 0x40000
+STATUS_MAGIC = b"KUMA"
+
+
+class StatusSector(typing.NamedTuple):
+    version: int
+    battery_present: bool
+    last_boot_menu_index: int
+    last_boot_save_index: int
+    last_boot_save_type: int
+    sram_bank_type: int
+
+
+class Layout(typing.NamedTuple):
+    item_list_offset: int
+    status_offset: int
+    save_offset: int
+    sector_size: int
+
+
+def part_paths(path: str) -> list[str]:
+    """Returns the files of a compilation, either the file itself or all of its _partN files."""
+    match = re.match(r"^(.*)_part\d+(\.[^.]*)$", path)
+    if match is None:
+        if os.path.exists(path):
+            return [path]
+        base, ext = os.path.splitext(path)
+    else:
+        base, ext = match.group(1), match.group(2)
+    parts = glob.glob(f"{glob.escape(base)}_part*{glob.escape(ext)}")
+    parts = [p for p in parts if re.match(r"^.*_part(\d+)\.[^.]*$", p)]
+    if not parts:
+        raise FileNotFoundError(f"No compilation found at {path}")
+    return sorted(parts, key=lambda p: int(re.match(r"^.*_part(\d+)\.[^.]*$", p).group(1)))
+
+
+class CompilationImage:
+    def __init__(self, path: str | list[str]):
+        paths = part_paths(path) if isinstance(path, str) else path
+        self.paths = paths
+        self._maps: list[mmap.mmap] = []
+        self._offsets: list[int] = []
+        size = 0
+        for part in paths:
+            with open(part, "rb") as f:
+                self._maps.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            self._offsets.append(size)
+            size += len(self._maps[-1])
+        self._size = size
+        self._layout: Layout | None = None
+        self._starts: list[int] | None = None
+
+    def close(self) -> None:
+        for m in self._maps:
+            m.close()
+        self._maps = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def view(self, offset: int, size: int) -> memoryview:
+        """A zero copy view when the range is inside one part, else a copy. Release it before closing the image."""
+        offset = max(0, min(offset, self._size))
+        size = max(0, min(size, self._size - offset))
+        part = bisect.bisect_right(self._offsets, offset) - 1
+        start = offset - self._offsets[part]
+        if start + size <= len(self._maps[part]):
+            return memoryview(self._maps[part])[start : start + size]
+        chunks = bytearray()
+        while size > 0:
+            chunk = self._maps[part][start : start + size]
+            chunks += chunk
+            size -= len(chunk)
+            part, start = part + 1, 0
+        return memoryview(chunks)
+
+    def __getitem__(self, key: int | slice) -> int | bytes:
+        if isinstance(key, slice):
+            start, stop, _ = key.indices(self._size)
+            with self.view(start, stop - start) as v:
+                return v.tobytes()
+        if key < 0:
+            key += self._size
+        part = bisect.bisect_right(self._offsets, key) - 1
+        return self._maps[part][key - self._offsets[part]]
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        # Matches crossing two parts are not found, nothing the menu needs is placed like that.
+        for part, m in enumerate(self._maps):
+            if self._offsets[part] + len(m) <= start:
+                continue
+            pos = m.find(sub, max(0, start - self._offsets[part]))
+            if pos != -1:
+                return self._offsets[part] + pos
+        return -1
+
+    @property
+    def layout(self) -> Layout | None:
+        """Finds the item list and the sector size by the status sector following the item list."""
+        if self._layout is None:
+            menu_rom_end = self.find(b"dkARM\0\0\0")
+            pos = max(menu_rom_end, 0)
+            pos += -pos % 0x20000
+            while pos + len(STATUS_MAGIC) <= self._size:
+                if self[pos : pos + len(STATUS_MAGIC)] == STATUS_MAGIC:
+                    # The item list is aligned to 256 KiB and the status area is in the next sector.
+                    sector_size = 0x20000 if pos % ITEM_LIST_ALIGN else 0x40000
+                    self._layout = Layout(
+                        pos - sector_size, pos, pos + sector_size, sector_size
+                    )
+                    break
+                pos += 0x20000
+        return self._layout
+
+    def items(self) -> typing.Iterator[ItemRecord]:
+        if self.layout is None:
+            return
+        pos = self.layout.item_list_offset
+        while pos + ITEM_RECORD.size <= self.layout.status_offset:
+            raw = self[pos : pos + ITEM_RECORD.size]
+            if raw[0] == 0xFF:
+                break
+            yield decode_record(raw)
+            pos += ITEM_RECORD.size
+
+    def status(self) -> StatusSector | None:
+        if self.layout is None:
+            return None
+        status = self[self.layout.status_offset : self.layout.status_offset + 0x10]
+        return StatusSector(
+            version=status[4],
+            battery_present=status[5] != 0,
+            last_boot_menu_index=struct.unpack_from("<H", status, 6)[0],
+            last_boot_save_index=status[9],
+            last_boot_save_type=status[10],
+            sram_bank_type=status[11],
+        )
+
+    def save_slots(self) -> list[int]:
+        """Used save slots, 0 based like in the item list."""
+        return sorted({item.save_slot for item in self.items() if item.save_type})
+
+    def save_offset(self, slot: int) -> int:
+        return self.layout.save_offset + slot * self.layout.sector_size
+
+    def game_size(self, item: ItemRecord) -> int:
+        """Mapped size of a game, cut at the next game placed in its window."""
+        if self._starts is None:
+            self._starts = sorted({i.block_offset * BLOCK_SIZE for i in self.items()})
+        start = item.block_offset * BLOCK_SIZE
+        end = min(start + item.block_count * BLOCK_SIZE, self._size)
+        next_start = bisect.bisect_right(self._starts, start)
+        if next_start < len(self._starts):
+            end = min(end, self._starts[next_start])
+        return end - start
+
+    def read_game(self, item: ItemRecord, trim: bool = True) -> bytes:
+        start = item.block_offset * BLOCK_SIZE
+        data = self[start : start + self.game_size(item)]
+        if trim:
+            # Like utils/Trim.py, strip the padding but keep 16 byte alignment.
+            end = len(data.rstrip(b"\xff"))
+            data = data[: end + (-end % 16)]
+        return data
+
+    def read_save(self, slot: int, size: int | None = None) -> bytes:
+        if size is None:
+            status = self.status()
+            size = 0x20000 if status is not None and status.sram_bank_type else 0x10000
+        return self[self.save_offset(slot) : self.save_offset(slot) + size]
+
+    def extract_game(self, item: ItemRecord, out_path: str, trim: bool = True) -> None:
+        with open(out_path, "wb") as f:
+            f.write(self.read_game(item, trim))
+
+    def extract_save(self, slot: int, out_path: str, size: int | None = None) -> None:
+        with open(out_path, "wb") as f:
+            f.write(self.read_save(slot, size))
+
+    def guess_cartridge_type(self) -> int:
+        """1 based cartridge type with the sector size of the image and enough flash for it."""
+        for i, cart in enumerate(cartridge_types):
+            if (
+                cart["sector_size"] == self.layout.sector_size
+                and cart["flash_size"] >= self._size
+            ):
+                return i + 1
+        return 1
+
+    def to_config(self, rom_dir: str, config_path: str) -> dict:
+        """Extracts all games and saves to rom_dir and writes a builder config to start a new build from."""
+        os.makedirs(rom_dir, exist_ok=True)
+        status = self.status()
+        games = []
+        files: dict[int, str] = dict()
+        for index, item in enumerate(self.items()):
+            # Entries sharing a ROM (like emulator bundles) also share the extracted file.
+            if item.block_offset not in files:
+                files[item.block_offset] = f"{index + 1:03d}.gba"
+                self.extract_game(item, f"{rom_dir}/{files[item.block_offset]}")
+            game = {
+                "enabled": True,
+                "file": files[item.block_offset],
+                "title": item.title,
+                "title_font": item.title_font + 1,
+                "save_slot": item.save_slot + 1 if item.save_type else None,
+            }
+            if item.keys:
+                game["keys"] = item.key_names
+            if item.save_type:
+                save_file = os.path.splitext(f"{rom_dir}/{game['file']}")[0] + ".sav"
+                if not os.path.exists(save_file):
+                    self.extract_save(item.save_slot, save_file)
+            games.append(game)
+        config = {
+            "cartridge": {
+                "type": self.guess_cartridge_type(),
+                "battery_present": status.battery_present,
+            },
+            "games": games,
+        }
+        with open(config_path, "w", encoding="UTF-8-SIG") as f:
+            f.write(json.dumps(obj=config, indent=4, ensure_ascii=False))
+        return config
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Lists and extracts the content of a GBA Multi Game Menu compilation"
+    )
+    parser.add_argument("image", help="the compilation ROM or one of its _partN files")
+    parser.add_argument(
+        "--extract",
+        type=int,
+        metavar="INDEX",
+        help="extracts the game with this 1 based index of the item list",
+    )
+    parser.add_argument(
+        "--extract-save", type=int, metavar="SLOT", help="extracts this 1 based save slot"
+    )
+    parser.add_argument(
+        "--to-config",
+        type=str,
+        metavar="ROM_DIR",
+        help="extracts everything to ROM_DIR and writes a config to rebuild it",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config.json",
+        help="sets the config file written by --to-config",
+    )
+    parser.add_argument("--output", "-o", type=str, help="output file of an extraction")
+    args = parser.parse_args()
+
+    with CompilationImage(args.image) as image:
+        if image.layout is None:
+            print("Error: Not a GBA Multi Game Menu compilation.")
+            sys.exit(1)
+        if args.extract is not None:
+            item = list(image.items())[args.extract - 1]
+            image.extract_game(item, args.output or f"{item.title}.gba")
+        elif args.extract_save is not None:
+            image.extract_save(
+                args.extract_save - 1, args.output or f"{args.extract_save}.sav"
+            )
+        elif args.to_config is not None:
+            config = image.to_config(args.to_config, args.config)
+            print(f"Extracted {len(config['games'])} game(s) to {args.to_config}.")
+        else:
+            status = image.status()
+            print(
+                "Sector size: {:d} KiB, battery {:s}".format(
+                    image.layout.sector_size // 1024,
+                    "present" if status.battery_present else "not present",
+                )
+            )
+            for index, item in enumerate(image.items()):
+                print(
+                    "{:3d} | 0x{:08X} | 0x{:08X} | {:s} | {:s}{:s}".format(
+                        index + 1,
+                        item.block_offset * BLOCK_SIZE,
+                        item.block_count * BLOCK_SIZE,
+                        f"{item.save_slot + 1:2d}" if item.save_type else "  ",
+                        item.title,
+                        f" [{'+'.join(item.key_names)}]" if item.keys else "",
+                    )
+                )
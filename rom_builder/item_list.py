@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# GBA Multi Game Menu – Item list codec
+#
+# The item list is an array of fixed size records read by the menu, terminated by the erased (0xFF) flash after it.
+# Visible games come first, followed by one group per hidden key combination.
+import struct
+import typing
+
+ITEM_RECORD = struct.Struct("<BBHHBBH6x96s")
+TITLE_LENGTH = 0x30
+KEY_NAMES = ("A", "B", "SELECT", "START", "RIGHT", "LEFT", "UP", "DOWN", "R", "L")
+
+
+class ItemRecord(typing.NamedTuple):
+    title_font: int
+    title_length: int
+    block_offset: int
+    block_count: int
+    save_type: int
+    save_slot: int
+    keys: int
+    title: str
+
+    @property
+    def key_names(self) -> list[str]:
+        return [name for i, name in enumerate(KEY_NAMES) if self.keys & (1 << i)]
+
+
+def display_title(title: str) -> str:
+    return title[: TITLE_LENGTH - 1] + "…" if len(title) > TITLE_LENGTH else title
+
+
+def encode_keys(names: list[str]) -> int:
+    keys = 0
+    for name in names:
+        if name.upper() in KEY_NAMES:
+            keys |= 1 << KEY_NAMES.index(name.upper())
+    return keys
+
+
+def group_by_key(games: list[dict]) -> list[list[dict]]:
+    """Groups games in a single pass, visible games first and then the hidden groups by key combination."""
+    groups: dict[int, list[dict]] = {0: []}
+    for game in games:
+        groups.setdefault(game["keys"], []).append(game)
+    return [groups[key] for key in sorted(groups)]
+
+
+def encode(games: list[dict]) -> bytearray:
+    """Encodes games, already in item list order, into a preallocated buffer."""
+    item_list = bytearray(len(games) * ITEM_RECORD.size)
+    for i, game in enumerate(games):
+        ITEM_RECORD.pack_into(
+            item_list,
+            i * ITEM_RECORD.size,
+            game["title_font"],
+            len(game["title"]),
+            game["block_offset"],
+            game["block_count"],
+            game["save_type"],
+            game["save_slot"],
+            game["keys"],
+            display_title(game["title"]).encode("UTF-16LE"),
+        )
+    return item_list
+
+
+def decode_record(raw) -> ItemRecord:
+    record = ITEM_RECORD.unpack(raw)
+    return ItemRecord(
+        *record[:7],
+        title=record[7].decode("UTF-16LE", errors="replace").rstrip("\0"),
+    )
+
+
+def decode(data) -> list[ItemRecord]:
+    """Decodes an item list up to its terminator or the end of data."""
+    items = []
+    for pos in range(0, len(data) - ITEM_RECORD.size + 1, ITEM_RECORD.size):
+        if data[pos] == 0xFF:
+            break
+        items.append(decode_record(data[pos : pos + ITEM_RECORD.size]))
+    return items
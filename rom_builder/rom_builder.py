@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 # GBA Multi Game Menu – ROM Builder
 # Author: Lesserkuma (github.com/lesserkuma)
-import sys, os, glob, json, math, re, struct, hashlib, argparse, datetime, dataclasses, typing
+import sys, os, glob, json, math, struct, hashlib, argparse, datetime, dataclasses, typing, logging
 
 if __name__ == "__main__": # run directly
     from cartridge_config import cartridge_types
+    import build_log
+    import item_list
+    import rom_sizing
+    import save_import
+    import sector_report
+    import verify
 else:
     from .cartridge_config import cartridge_types
+    from . import build_log, item_list, rom_sizing, save_import, sector_report, verify
 
 # Configuration
 app_version = "1.2"
@@ -26,17 +33,32 @@ class Args:
     no_wait: bool = False
     no_log: bool = False
     config: str = "config.json"
-    bg: str = "bg.png"
+    bg: str | None = None  # no custom background
     output: str = "LK_MULTIMENU_<CODE>.gba"
     rom_base_path: str = "roms"
     cli_mode: bool = True
+    verify: bool = False
+    layout: str | None = None
+    log_file: str = "log.txt"
+    menu_rom: str = "lk_multimenu.gba"
+    log_level: str = "info"
+    log_json: bool = False
 
 
-log = ""
+def build(args_set: dict = None, log: build_log.BuildLog | None = None) -> FuncModeRet | int:
+    """Builds the compilation. Logs to log if given, the caller reads and closes it, else to args.log_file."""
+    args: Args = Args(**args_set)
+    if log is not None:
+        return _build(args, log)
+    with build_log.BuildLog(
+        path=None if args.no_log else args.log_file,
+        level=args.log_level,
+        json_lines=args.log_json,
+    ) as log:
+        return _build(args, log)
 
 
-def build(args_set: dict = None) -> FuncModeRet | int:
-    args: Args = Args(**args_set)
+def _build(args: Args, log: build_log.BuildLog) -> FuncModeRet | int:
 
     def UpdateSectorMap(start, length, c):
         sector_map[start + 1 : start + length] = c * (length - 1)
@@ -54,14 +76,8 @@ def build(args_set: dict = None) -> FuncModeRet | int:
             val = size / 1024 / 1024
             return "{:.2f} MB".format(val)
 
-    def logp(*args, **kwargs):
-        global log
-        s = format(" ".join(map(str, args)))
-        print("{:s}".format(s), **kwargs)
-        if "end" in kwargs and kwargs["end"] == "":
-            log += "{:s}".format(s)
-        else:
-            log += "{:s}\n".format(s)
+    def logp(*args, level=logging.INFO):
+        log.write(" ".join(map(str, args)), level)
 
     ################################
 
@@ -70,14 +86,15 @@ def build(args_set: dict = None) -> FuncModeRet | int:
     logp("GBA Multi Game Menu ROM Builder v{:s}\nby Lesserkuma\n".format(app_version))
 
     output_file = args.output
-    if output_file == "lk_multimenu.gba":
-        logp("Error: The file must not be named “lk_multimenu.gba”")
+    if os.path.abspath(output_file) == os.path.abspath(args.menu_rom):
+        logp("Error: The file must not be named “lk_multimenu.gba”", level=logging.ERROR)
         if not args.no_wait:
             input("\nPress ENTER to exit.\n")
         return 1 if args.cli_mode else FuncModeRet("Wrong output name.", None, False)
-    if not os.path.exists("lk_multimenu.gba"):
+    if not os.path.exists(args.menu_rom):
         logp(
-            "Error: The Menu ROM is missing.\nPlease put it in the same directory that you are running this tool from.\nExpected file name: “lk_multimenu.gba”"
+            "Error: The Menu ROM is missing.\nPlease put it in the same directory that you are running this tool from.\nExpected file name: “lk_multimenu.gba”",
+            level=logging.ERROR,
         )
         if not args.no_wait:
             input("\nPress ENTER to exit.\n")
@@ -120,7 +137,8 @@ def build(args_set: dict = None) -> FuncModeRet | int:
         }
         if len(games) == 0:
             logp(
-                f"Error: No usable ROM files were found in the “{args.rom_base_path:s}” folder."
+                f"Error: No usable ROM files were found in the “{args.rom_base_path:s}” folder.",
+                level=logging.ERROR,
             )
         else:
             with open(args.config, "w", encoding="UTF-8-SIG") as f:
@@ -144,7 +162,8 @@ def build(args_set: dict = None) -> FuncModeRet | int:
             except json.decoder.JSONDecodeError as e:
                 logp(
                     f"Error: The configuration file ({args.config:s}) is malformed and could not be loaded.\n"
-                    + str(e)
+                    + str(e),
+                    level=logging.ERROR,
                 )
                 if not args.no_wait:
                     input("\nPress ENTER to exit.\n")
@@ -160,6 +179,10 @@ def build(args_set: dict = None) -> FuncModeRet | int:
                 min_rom_size = j["cartridge"]["min_rom_size"]
             else:
                 min_rom_size = 0x400000
+            if "size_policy" in j["cartridge"]:
+                size_policy = j["cartridge"]["size_policy"]
+            else:
+                size_policy = "legacy"
 
     # Prepare compilation
     flash_size = cartridge_types[cartridge_type]["flash_size"]
@@ -169,14 +192,13 @@ def build(args_set: dict = None) -> FuncModeRet | int:
     block_count = flash_size // block_size
     sectors_per_block = 0x80000 // sector_size
     compilation = bytearray()
-    roms_keys = [0]
     for i in range(flash_size // 0x2000000):
         chunk = bytearray([0xFF] * 0x2000000)
         compilation += chunk
     sector_map = list("." * sector_count)
 
     # Read menu ROM
-    with open("lk_multimenu.gba", "rb") as f:
+    with open(args.menu_rom, "rb") as f:
         menu_rom = bytearray(f.read())
         menu_rom += bytearray(
             [0xFF] * ((len(menu_rom) + 0x10 - (len(menu_rom) % 0x10)) - len(menu_rom))
@@ -195,14 +217,11 @@ def build(args_set: dict = None) -> FuncModeRet | int:
         ] = build_timestamp
 
     # Change background image
-    if args.bg != Args.bg or os.path.exists("bg.png"):
+    if args.bg:
         try:
             from PIL import Image
 
-            if args.bg:
-                img = Image.open(args.bg)
-            else:
-                img = Image.open("bg.png")
+            img = Image.open(args.bg)
             img = img.convert("P")
             palette = img.getpalette()
             palette_rgb555 = [
@@ -221,8 +240,9 @@ def build(args_set: dict = None) -> FuncModeRet | int:
                 raw_palette
             )
         except ImportError:
-            print(
-                "Error: Couldn’t update background image. Pillow library is not installed."
+            logp(
+                "Error: Couldn’t update background image. Pillow library is not installed.",
+                level=logging.ERROR,
             )
 
     menu_rom_size = menu_rom.find(b"dkARM\0\0\0") + 8
@@ -306,56 +326,41 @@ def build(args_set: dict = None) -> FuncModeRet | int:
         if not os.path.exists(f"{args.rom_base_path:s}/{game['file']}"):
             game["missing"] = True
             continue
-        size = os.path.getsize(f"{args.rom_base_path:s}/{game['file']}")
-        if (size & (size - 1)) != 0:
-            x = 0x80000
-            while x < size:
-                x *= 2
-            size = x
-        if size < 0x400000:
-            with open(f"{args.rom_base_path:s}/{game['file']}", "rb") as f:
-                buffer = f.read()
-                if b"Batteryless mod by Lesserkuma" in buffer:
-                    size = max(0x400000, min_rom_size)
-                else:
-                    size = max(size, min_rom_size)
+        rom_path = f"{args.rom_base_path:s}/{game['file']}"
+        map_256m = "map_256m" in game and game["map_256m"] == True
+        game_size_policy = game["size_policy"] if "size_policy" in game else size_policy
+        try:
+            rom_size_info = rom_sizing.rom_size(
+                rom_path,
+                game_size_policy,
+                sector_size,
+                block_size,
+                min_rom_size,
+                map_256m,
+                game["map_size"] if "map_size" in game else None,
+            )
+        except ValueError as e:
+            logp(f"Error: “{game['title']}”: {e}", level=logging.ERROR)
+            if not args.no_wait:
+                input("\nPress ENTER to exit.\n")
+            return 1 if args.cli_mode else FuncModeRet(str(e), None, False)
+        if game_size_policy == "legacy" and "map_size" not in game:
+            game["sector_count_legacy"] = rom_size_info.sector_count
+        else:
+            game["sector_count_legacy"] = rom_sizing.legacy_rom_size(
+                rom_path, sector_size, min_rom_size, map_256m
+            ).sector_count
         game["index"] = index
-        game["size"] = size
+        game["size"] = rom_size_info.size
         if "title_font" in game:
             game["title_font"] -= 1
         else:
             game["title_font"] = 0
-        game["sector_count"] = int(size / sector_size)
+        game["sector_count"] = rom_size_info.sector_count
+        game["sector_count_map"] = rom_size_info.sector_count_map
 
         # Hidden ROMs
-        keys = 0
-        if "keys" in game:
-            for key in game["keys"]:
-                if key.upper() == "A":
-                    keys |= 1 << 0
-                elif key.upper() == "B":
-                    keys |= 1 << 1
-                elif key.upper() == "SELECT":
-                    keys |= 1 << 2
-                elif key.upper() == "START":
-                    keys |= 1 << 3
-                elif key.upper() == "RIGHT":
-                    keys |= 1 << 4
-                elif key.upper() == "LEFT":
-                    keys |= 1 << 5
-                elif key.upper() == "UP":
-                    keys |= 1 << 6
-                elif key.upper() == "DOWN":
-                    keys |= 1 << 7
-                elif key.upper() == "R":
-                    keys |= 1 << 8
-                elif key.upper() == "L":
-                    keys |= 1 << 9
-        game["keys"] = keys
-
-        if keys > 0:
-            roms_keys.append(keys)
-            roms_keys = list(set(roms_keys))
+        game["keys"] = item_list.encode_keys(game.get("keys", []))
 
         if battery_present and game["save_slot"] is not None:
             game["save_type"] = 2
@@ -365,28 +370,24 @@ def build(args_set: dict = None) -> FuncModeRet | int:
             UpdateSectorMap(offset, 1, "s")
 
             if save_slot not in saves_read:
-                save_data_file = (
-                    os.path.splitext(f"{args.rom_base_path:s}/{game['file']}")[0]
-                    + ".sav"
-                )
-                save_data = bytearray([0] * sector_size)
-                if os.path.exists(save_data_file):
-                    with open(save_data_file, "rb") as f:
-                        save_data = f.read()
-                    if len(save_data) < sector_size:
-                        save_data += bytearray([0] * (sector_size - len(save_data)))
-                    if len(save_data) > sector_size:
-                        save_data = save_data[:sector_size]
+                if "save_file" in game and os.path.exists(game["save_file"]):
+                    save_data_file = game["save_file"]
+                else:
+                    save_data_file = save_import.find_save_file(rom_path)
+                save_data = None
+                if save_data_file is not None:
+                    save_data = save_import.load_save(save_data_file)
                     saves_read.append(save_slot)
-                compilation[
-                    offset * sector_size : offset * sector_size + sector_size
-                ] = save_data
+                save_import.write_save(
+                    compilation, offset * sector_size, sector_size, save_data
+                )
         else:
             game["save_type"] = 0
             game["save_slot"] = 0
         index += 1
-    if len(saves_read) > 0:
-        save_end_offset = "".join(sector_map).rindex("S") + 1
+    if "S" in sector_map:
+        # Also keep the slots without a .sav file free, not only the imported ones
+        save_end_offset = len(sector_map) - sector_map[::-1].index("S")
     else:
         save_end_offset = save_data_sector_offset
 
@@ -409,14 +410,17 @@ def build(args_set: dict = None) -> FuncModeRet | int:
     # Read ROM data
     games_not_found: list = []
     games.sort(key=lambda game: game["size"], reverse=True)
+    placed_files = {}
     for game in games:
+        if game["file"] in placed_files:
+            # Several menu entries may share one ROM, like a multi-ROM emulator bundle
+            for k in ("sector_offset", "block_offset", "block_count"):
+                game[k] = placed_files[game["file"]][k]
+            continue
         found = False
         for i in range(save_end_offset, len(sector_map)):
-            sector_count_map = game["sector_count"]
-
-            if "map_256m" in game and game["map_256m"] == True:
-                # Map as 256M ROM, but don't waste space; some games may need this for unknown reasons
-                sector_count_map = (32 * 1024 * 1024) // sector_size
+            # Games mapped as 256M ROM don't waste space; some games may need this for unknown reasons
+            sector_count_map = game["sector_count_map"]
 
             if i % sector_count_map == 0:
                 if (
@@ -432,6 +436,7 @@ def build(args_set: dict = None) -> FuncModeRet | int:
                         game["sector_offset"] * sector_size // block_size
                     )
                     game["block_count"] = sector_count_map * sector_size // block_size
+                    placed_files[game["file"]] = game
                     found = True
 
                     if not boot_logo_found and hashlib.sha1(
@@ -472,7 +477,7 @@ def build(args_set: dict = None) -> FuncModeRet | int:
             )
 
     if not boot_logo_found:
-        logp("Warning: Valid boot logo is missing!")
+        logp("Warning: Valid boot logo is missing!", level=logging.WARNING)
 
     # Generate item list
     games = [game for game in games if "sector_offset" in game]
@@ -480,16 +485,23 @@ def build(args_set: dict = None) -> FuncModeRet | int:
 
     # Print information
     logp("Sector map (1 block = {:d} KiB):".format(sector_size // 1024))
-    for i in range(0, len(sector_map)):
-        logp(sector_map[i], end="")
-        if i % 64 == 63:
-            logp("")
-    sectors_used = len(re.findall(r"[MmSsRrIiCc]", "".join(sector_map)))
+    logp(sector_report.render(sector_map))
+    sector_stats = sector_report.statistics(sector_map)
     logp(
         "{:.2f}% ({:d} of {:d} sectors) used\n".format(
-            sectors_used / sector_count * 100, sectors_used, sector_count
+            sector_stats.percent, sector_stats.used, sector_stats.total
         )
     )
+    sectors_reclaimed = sum(
+        game["sector_count_legacy"] - game["sector_count"]
+        for game in placed_files.values()
+    )
+    if sectors_reclaimed != 0:
+        logp(
+            "{:s} ({:d} sectors) reclaimed compared to the legacy size policy\n".format(
+                formatFileSize(sectors_reclaimed * sector_size), sectors_reclaimed
+            )
+        )
     logp(f"Added {len(games)} ROM(s) to the compilation\n")
 
     if battery_present:
@@ -499,17 +511,10 @@ def build(args_set: dict = None) -> FuncModeRet | int:
         logp("    | Offset     | Map Size  | Title")
         toc_sep = "----+------------+-----------+-------------------------------------------------"
 
-    item_list = bytearray()
-
-    for key in roms_keys:
-        c = 0
-        for game in games:
-            if game["keys"] != key:
-                continue
-
-            title = game["title"]
-            if len(title) > 0x30:
-                title = title[:0x2F] + "…"
+    item_groups = item_list.group_by_key(games)
+    for group in item_groups:
+        for c, game in enumerate(group):
+            title = item_list.display_title(game["title"])
 
             table_line = (
                 f"{game['index'] + 1:3d} | "
@@ -529,26 +534,15 @@ def build(args_set: dict = None) -> FuncModeRet | int:
                 else:
                     logp(toc_sep)
             logp(table_line)
-            c += 1
-
-            title = title.ljust(0x30, "\0")
-            item_list += bytearray(struct.pack("B", game["title_font"]))
-            item_list += bytearray(struct.pack("B", len(game["title"])))
-            item_list += bytearray(struct.pack("<H", game["block_offset"]))
-            item_list += bytearray(struct.pack("<H", game["block_count"]))
-            item_list += bytearray(struct.pack("B", game["save_type"]))
-            item_list += bytearray(struct.pack("B", game["save_slot"]))
-            item_list += bytearray(struct.pack("<H", game["keys"]))
-            item_list += bytearray([0] * 6)
-            item_list += bytearray(title.encode("UTF-16LE"))
 
+    item_list_data = item_list.encode([game for group in item_groups for game in group])
     compilation[
-        item_list_offset * sector_size : item_list_offset * sector_size + len(item_list)
-    ] = item_list
-    rom_code = "L{:s}".format(hashlib.sha1(status + item_list).hexdigest()[:3]).upper()
+        item_list_offset * sector_size : item_list_offset * sector_size + len(item_list_data)
+    ] = item_list_data
+    rom_code = "L{:s}".format(hashlib.sha1(status + item_list_data).hexdigest()[:3]).upper()
 
     # Write compilation
-    rom_size = len("".join(sector_map).rstrip(".")) * sector_size
+    rom_size = sector_report.used_end(sector_map) * sector_size
     compilation[0xAC:0xB0] = rom_code.encode("ASCII")
     checksum = 0
     for i in range(0xA0, 0xBD):
@@ -560,7 +554,7 @@ def build(args_set: dict = None) -> FuncModeRet | int:
     logp(
         "Game List:       0x{:08X}–0x{:08X}".format(
             item_list_offset * sector_size,
-            item_list_offset * sector_size + len(item_list),
+            item_list_offset * sector_size + len(item_list_data),
         )
     )
     logp(
@@ -580,6 +574,7 @@ def build(args_set: dict = None) -> FuncModeRet | int:
     logp("Output ROM Code: {:s}".format(rom_code))
     output_file = output_file.replace("<CODE>", rom_code)
 
+    output_files = []
     if args.split:
         for i in range(0, math.ceil(flash_size / 0x2000000)):
             pos = i * 0x2000000
@@ -593,19 +588,44 @@ def build(args_set: dict = None) -> FuncModeRet | int:
             )
             with open(output_file_part, "wb") as f:
                 f.write(compilation[pos : pos + size])
+            output_files.append(output_file_part)
     else:
         with open(output_file, "wb") as f:
             f.write(compilation[:rom_size])
+        output_files.append(output_file)
+
+    if args.layout:
+        sector_report.write_layout(args.layout, sector_map, sector_size, games)
+
+    # Verify compilation
+    verify_errors = []
+    if args.verify:
+        verify_errors = verify.verify_file(
+            output_files,
+            [
+                verify.SourceRom(game["title"], f"{args.rom_base_path:s}/{game['file']}")
+                for game in games
+            ],
+            battery_present,
+        )
+        for error in verify_errors:
+            logp(f"Verification error: {error}", level=logging.ERROR)
+        if not verify_errors:
+            logp("Output ROM verified")
 
     # Write log
-    if not args.no_log:
-        global log
-        log += "\nArgument List: {:s}\n".format(str(sys.argv[1:]))
-        log += "\n################################\n\n"
-        with open("log.txt", "ab") as f:
-            f.write(log.encode("UTF-8-SIG"))
+    log.write("\nArgument List: {:s}".format(str(sys.argv[1:])), echo=False)
+    log.write("\n################################\n", echo=False)
     if not args.no_wait:
         input("\nPress ENTER to exit.\n")
+    if verify_errors:
+        return (
+            1
+            if args.cli_mode
+            else FuncModeRet(
+                f"Verification failed: {' '.join(verify_errors)}", games_not_found, False
+            )
+        )
     return (
         0
         if args.cli_mode
@@ -643,6 +663,19 @@ if __name__ == "__main__":
         action="store_true",
         default=Args.no_log,
     )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        choices=build_log.LOG_LEVELS,
+        default=Args.log_level,
+        help="sets the lowest level of messages to log",
+    )
+    parser.add_argument(
+        "--log-json",
+        help="writes the log file as JSON lines",
+        action="store_true",
+        default=Args.log_json,
+    )
     parser.add_argument(
         "--config",
         type=str,
@@ -653,7 +686,7 @@ if __name__ == "__main__":
         "--bg",
         type=str,
         default=Args.bg,
-        help="sets the background image to use",
+        help="sets the background image to use (default: bg.png if it exists)",
     )
     parser.add_argument(
         "--output",
@@ -661,6 +694,18 @@ if __name__ == "__main__":
         default=Args.output,
         help="sets the file name of the compilation ROM",
     )
+    parser.add_argument(
+        "--verify",
+        help="re-reads the compilation and verifies it after writing",
+        action="store_true",
+        default=Args.verify,
+    )
+    parser.add_argument(
+        "--layout",
+        type=str,
+        default=Args.layout,
+        help="writes the sector layout of the compilation as JSON to this file",
+    )
     parser.add_argument(
         "--rom-base-path",
         type=str,
@@ -675,10 +720,14 @@ if __name__ == "__main__":
             "no_wait": args.no_wait,
             "no_log": args.no_log,
             "config": args.config,
-            "bg": args.bg,
+            "bg": args.bg if args.bg or not os.path.exists("bg.png") else "bg.png",
             "output": args.output,
             "rom_base_path": args.rom_base_path,
             "cli_mode": True,
+            "verify": args.verify,
+            "layout": args.layout,
+            "log_level": args.log_level,
+            "log_json": args.log_json,
         }
     )
     if ret is not None and ret != 0:
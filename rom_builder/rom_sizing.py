@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# GBA Multi Game Menu – ROM sizing policies
+#
+# Every game is mapped as a power of two window of whole blocks, and its offset has to be aligned to that window.
+# The "legacy" policy also reserves the whole window in flash (and at least min_rom_size), the "tight" policy only
+# reserves the sectors the ROM data actually occupies, so smaller games can be placed in the unused tail of a window.
+import math
+import os
+import typing
+
+SIZE_POLICIES = ("legacy", "tight")
+BATTERYLESS_MOD_SIGNATURE = b"Batteryless mod by Lesserkuma"
+BATTERYLESS_MOD_SIZE = 0x400000  # Lesserkuma's batteryless mods keep their save at the end of a 4 MiB ROM
+MAP_256M_SIZE = 0x2000000
+
+
+class RomSize(typing.NamedTuple):
+    size: int  # mapped size in bytes, power of two
+    sector_count: int  # sectors occupied in flash
+    sector_count_map: int  # sectors mapped, the offset must be aligned to it
+
+
+def next_power_of_two(size: int, minimum: int) -> int:
+    x = minimum
+    while x < size:
+        x *= 2
+    return x
+
+
+def is_batteryless_mod(rom_path: str) -> bool:
+    with open(rom_path, "rb") as f:
+        return BATTERYLESS_MOD_SIGNATURE in f.read()
+
+
+def legacy_rom_size(
+    rom_path: str,
+    sector_size: int,
+    min_rom_size: int = 0x400000,
+    map_256m=False,
+    map_size: int | None = None,
+    data_size: int | None = None,
+    batteryless_mod: bool | None = None,
+) -> RomSize:
+    size = os.path.getsize(rom_path) if data_size is None else data_size
+    if (size & (size - 1)) != 0:
+        size = next_power_of_two(size, 0x80000)
+    if size < 0x400000:
+        if is_batteryless_mod(rom_path) if batteryless_mod is None else batteryless_mod:
+            size = max(BATTERYLESS_MOD_SIZE, min_rom_size)
+        else:
+            size = max(size, min_rom_size)
+    if map_size is not None:
+        size = max(size, map_size)
+    sector_count = int(size / sector_size)
+    return RomSize(
+        size,
+        sector_count,
+        MAP_256M_SIZE // sector_size if map_256m else sector_count,
+    )
+
+
+def tight_rom_size(
+    rom_path: str,
+    sector_size: int,
+    block_size: int,
+    map_256m=False,
+    map_size: int | None = None,
+    data_size: int | None = None,
+    batteryless_mod: bool | None = None,
+) -> RomSize:
+    if data_size is None:
+        data_size = os.path.getsize(rom_path)
+    if data_size < BATTERYLESS_MOD_SIZE and (
+        is_batteryless_mod(rom_path) if batteryless_mod is None else batteryless_mod
+    ):
+        data_size = BATTERYLESS_MOD_SIZE
+    size = next_power_of_two(data_size, block_size)
+    if map_size is not None:
+        size = max(size, map_size)
+    return RomSize(
+        size,
+        math.ceil(data_size / sector_size),
+        (MAP_256M_SIZE if map_256m else size) // sector_size,
+    )
+
+
+def rom_size(
+    rom_path: str,
+    policy: str,
+    sector_size: int,
+    block_size: int,
+    min_rom_size: int = 0x400000,
+    map_256m=False,
+    map_size: int | None = None,
+    data_size: int | None = None,
+    batteryless_mod: bool | None = None,
+) -> RomSize:
+    """data_size and batteryless_mod are read from the ROM if not given, e.g. by an earlier analysis."""
+    if policy not in SIZE_POLICIES:
+        raise ValueError(f"Unknown size policy “{policy}”.")
+    if map_size is not None and (map_size & (map_size - 1) or map_size % block_size):
+        raise ValueError(
+            f"Map size 0x{map_size:X} is not a power of two multiple of the block size 0x{block_size:X}."
+        )
+    if policy == "legacy":
+        return legacy_rom_size(
+            rom_path, sector_size, min_rom_size, map_256m, map_size, data_size, batteryless_mod
+        )
+    return tight_rom_size(
+        rom_path, sector_size, block_size, map_256m, map_size, data_size, batteryless_mod
+    )
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# GBA Multi Game Menu – Save data import
+#
+# Reads save files from emulators and flash carts, strips their footers and normalizes them to the native
+# EEPROM/SRAM/Flash sizes. The latest parsed saves are cached by path, mtime and size for the whole process, and
+# identical saves share the same data.
+import collections
+import hashlib
+import os
+import threading
+import typing
+
+SAVE_EXTENSIONS = (".sav", ".srm", ".fla", ".eep", ".sra", ".dsv")
+SAVE_TYPES = {
+    0x200: "EEPROM 4K",
+    0x2000: "EEPROM 64K",
+    0x8000: "SRAM 256K",
+    0x10000: "Flash 512K",
+    0x20000: "Flash 1M",
+}
+RTC_FOOTER_SIZE = 0x10  # mGBA and VBA-M append the RTC state to the save of games with RTC
+DESMUME_FOOTER_MAGIC = b"|-DESMUME SAVE-|"
+DESMUME_FOOTER_SIZE = 0x7A
+CACHE_SIZE = 256  # saves are 128 KiB at most
+
+
+class SaveData(typing.NamedTuple):
+    data: bytes
+    save_type: str
+    sha1: str
+
+
+class SaveCache:
+    """The latest saves by path, mtime and size, and by content so identical saves share their data."""
+
+    def __init__(self, capacity: int = CACHE_SIZE):
+        self.capacity = capacity
+        self._saves: collections.OrderedDict[tuple[str, int, int], SaveData] = collections.OrderedDict()
+        self._saves_by_hash: collections.OrderedDict[str, SaveData] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, int, int]) -> SaveData | None:
+        with self._lock:
+            save = self._saves.get(key)
+            if save is not None:
+                self._saves.move_to_end(key)
+            return save
+
+    def put(self, key: tuple[str, int, int], save: SaveData) -> SaveData:
+        """Caches the save, returns the cached save of the same content if there is one."""
+        with self._lock:
+            save = self._saves_by_hash.setdefault(save.sha1, save)
+            self._saves_by_hash.move_to_end(save.sha1)
+            self._saves[key] = save
+            self._saves.move_to_end(key)
+            while len(self._saves) > self.capacity:
+                self._saves.popitem(last=False)
+            while len(self._saves_by_hash) > self.capacity:
+                self._saves_by_hash.popitem(last=False)
+            return save
+
+    def clear(self) -> None:
+        with self._lock:
+            self._saves.clear()
+            self._saves_by_hash.clear()
+
+
+# One cache per process, like the patch plans.
+cache = SaveCache()
+
+
+def find_save_file(rom_path: str) -> str | None:
+    rom_base = os.path.splitext(rom_path)[0]
+    for ext in SAVE_EXTENSIONS:
+        if os.path.exists(rom_base + ext):
+            return rom_base + ext
+    return None
+
+
+def normalize(raw: bytes) -> tuple[bytes, str]:
+    if raw.endswith(DESMUME_FOOTER_MAGIC) and len(raw) > DESMUME_FOOTER_SIZE:
+        raw = raw[:-DESMUME_FOOTER_SIZE]
+    if len(raw) - RTC_FOOTER_SIZE in SAVE_TYPES:
+        raw = raw[:-RTC_FOOTER_SIZE]
+    if len(raw) in SAVE_TYPES:
+        return raw, SAVE_TYPES[len(raw)]
+    # Unknown dump, pad it to the next known save size so it is at least usable.
+    for size in sorted(SAVE_TYPES):
+        if len(raw) < size:
+            return raw + bytes(size - len(raw)), SAVE_TYPES[size]
+    return raw, "Unknown"
+
+
+def load_save(save_path: str) -> SaveData:
+    save_path = os.path.abspath(save_path)
+    stat = os.stat(save_path)
+    key = (save_path, stat.st_mtime_ns, stat.st_size)
+    save = cache.get(key)
+    if save is not None:
+        return save
+    with open(save_path, "rb") as f:
+        data, save_type = normalize(f.read())
+    return cache.put(key, SaveData(data, save_type, hashlib.sha1(data).hexdigest()))
+
+
+def write_save(buffer: bytearray, offset: int, size: int, save: SaveData | None) -> None:
+    # Writes the save into a slot of the compilation, padded with zeros or truncated to the slot size.
+    view = memoryview(buffer)[offset : offset + size]
+    length = 0
+    if save is not None:
+        length = min(len(save.data), size)
+        view[:length] = memoryview(save.data)[:length]
+    view[length:] = bytes(size - length)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# GBA Multi Game Menu – Sector map report
+#
+# The sector map has one character per flash sector, an upper case letter marks the first sector of a region and
+# lower case letters its remaining sectors, "." is free space.
+import collections
+import json
+import re
+import typing
+
+SECTOR_TYPES = {
+    "m": "menu",
+    "l": "item list",
+    "c": "status",
+    "s": "save",
+    "r": "rom",
+}
+USED_TYPES = "msrc"  # the item list sector is reserved, but not counted as used
+ROW_LENGTH = 64
+
+_REGION = re.compile("|".join(f"{c.upper()}{c}*" for c in SECTOR_TYPES))
+
+
+class SectorStats(typing.NamedTuple):
+    used: int
+    total: int
+    by_type: dict[str, int]
+
+    @property
+    def percent(self) -> float:
+        return self.used / self.total * 100
+
+
+class Region(typing.NamedTuple):
+    type: str
+    start: int
+    length: int
+
+
+def render(sector_map: list[str], row_length: int = ROW_LENGTH) -> str:
+    sectors = "".join(sector_map)
+    return "\n".join(
+        sectors[i : i + row_length] for i in range(0, len(sectors), row_length)
+    )
+
+
+def statistics(sector_map: list[str]) -> SectorStats:
+    counts = collections.Counter(sector_map)
+    by_type = {
+        name: counts[c] + counts[c.upper()]
+        for c, name in SECTOR_TYPES.items()
+        if counts[c] + counts[c.upper()]
+    }
+    used = sum(counts[c] + counts[c.upper()] for c in USED_TYPES)
+    return SectorStats(used, len(sector_map), by_type)
+
+
+def regions(sector_map: list[str]) -> list[Region]:
+    return [
+        Region(SECTOR_TYPES[m.group()[0].lower()], m.start(), len(m.group()))
+        for m in _REGION.finditer("".join(sector_map))
+    ]
+
+
+def used_end(sector_map: list[str]) -> int:
+    """Number of sectors up to the last one in use."""
+    return len("".join(sector_map).rstrip("."))
+
+
+def layout(sector_map: list[str], sector_size: int, games: list[dict] = ()) -> dict:
+    stats = statistics(sector_map)
+    return {
+        "sector_size": sector_size,
+        "sector_count": stats.total,
+        "sectors_used": stats.used,
+        "sectors_by_type": stats.by_type,
+        "regions": [
+            {
+                "type": region.type,
+                "offset": region.start * sector_size,
+                "size": region.length * sector_size,
+            }
+            for region in regions(sector_map)
+        ],
+        "games": [
+            {
+                "index": game["index"] + 1,
+                "title": game["title"],
+                "file": game["file"],
+                "offset": game["sector_offset"] * sector_size,
+                "size": game["sector_count"] * sector_size,
+                "map_size": game["sector_count_map"] * sector_size,
+                "save_slot": game["save_slot"] + 1 if game["save_type"] > 0 else None,
+            }
+            for game in games
+        ],
+    }
+
+
+def write_layout(path: str, sector_map: list[str], sector_size: int, games: list[dict] = ()) -> None:
+    with open(path, "w", encoding="UTF-8") as f:
+        f.write(json.dumps(obj=layout(sector_map, sector_size, games), indent=4, ensure_ascii=False))
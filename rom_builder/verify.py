@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# GBA Multi Game Menu – Compilation verifier
+#
+# Re-reads a written compilation and checks the header checksum, the boot logo, the status sector,
+# the item list and, if the source ROMs are known, that every ROM was placed byte for byte.
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import sys
+import typing
+
+if __package__:
+    from .compilation_reader import BLOCK_SIZE, CompilationImage
+    from .item_list import ItemRecord, display_title
+else:  # run directly
+    from compilation_reader import BLOCK_SIZE, CompilationImage
+    from item_list import ItemRecord, display_title
+
+BOOT_LOGO_SHA1 = bytes.fromhex("17daa0fec02fc33c0f6abb549a8b80b6613b48ee")
+
+
+class SourceRom(typing.NamedTuple):
+    title: str
+    path: str
+
+
+def header_checksum(data) -> int:
+    checksum = 0
+    for i in range(0xA0, 0xBD):
+        checksum = checksum - data[i]
+    return (checksum - 0x19) & 0xFF
+
+
+def _file_sha1(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha1").digest()
+
+
+def verify(
+    image: CompilationImage,
+    sources: list[SourceRom] | None = None,
+    battery_present: bool | None = None,
+) -> list[str]:
+    """Verifies an opened compilation. Returns a list of errors."""
+    errors = []
+    if len(image) < 0xC0:
+        return ["Image too small to contain a ROM header."]
+    header = image[0:0xC0]
+    if header_checksum(header) != header[0xBD]:
+        errors.append(
+            f"Header checksum is 0x{header[0xBD]:02X}, expected 0x{header_checksum(header):02X}."
+        )
+    if hashlib.sha1(header[0x04:0xA0]).digest() != BOOT_LOGO_SHA1:
+        errors.append("Boot logo is missing or damaged.")
+
+    layout = image.layout
+    if layout is None:
+        errors.append("Status sector (KUMA) not found.")
+        return errors
+    status = image.status()
+    if battery_present is not None and status.battery_present != battery_present:
+        errors.append(
+            f"Status sector says battery {'present' if status.battery_present else 'not present'}."
+        )
+
+    items = list(image.items())
+    if not items:
+        errors.append("Item list is empty.")
+    image_end = len(image)
+    save_end = max(
+        [image.save_offset(item.save_slot + 1) for item in items if item.save_type],
+        default=layout.save_offset,
+    )
+    for index, item in enumerate(items):
+        start = item.block_offset * BLOCK_SIZE
+        if item.block_count == 0 or start >= image_end:
+            errors.append(
+                f"Item {index + 1} “{item.title}” points outside of the image (block 0x{item.block_offset:X})."
+            )
+        elif start < save_end:
+            errors.append(
+                f"Item {index + 1} “{item.title}” overlaps the menu or the save area (block 0x{item.block_offset:X})."
+            )
+
+    if sources:
+        by_title: dict[str, list[ItemRecord]] = dict()
+        for item in items:
+            by_title.setdefault(item.title, []).append(item)
+
+        def check_source(source: SourceRom) -> str | None:
+            candidates = by_title.get(display_title(source.title))
+            if not candidates:
+                return f"“{source.title}” is not in the item list."
+            size = os.path.getsize(source.path)
+            source_sha1 = _file_sha1(source.path)
+            for item in candidates:
+                start = item.block_offset * BLOCK_SIZE
+                if size > item.block_count * BLOCK_SIZE or start + size > image_end:
+                    continue
+                with image.view(start, size) as view:
+                    if hashlib.sha1(view).digest() == source_sha1:
+                        return None
+            return f"“{source.title}” doesn't match {source.path}."
+
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            errors.extend(e for e in executor.map(check_source, sources) if e)
+    return errors
+
+
+def verify_file(
+    path: str | list[str],
+    sources: list[SourceRom] | None = None,
+    battery_present: bool | None = None,
+) -> list[str]:
+    """Verifies a compilation file, or all _partN files of a split compilation."""
+    with CompilationImage(path) as image:
+        return verify(image, sources, battery_present)
+
+
+def sources_from_config(config_path: str, rom_base_path: str) -> tuple[list[SourceRom], bool]:
+    with open(config_path, "r", encoding="UTF-8-SIG") as f:
+        j = json.load(f)
+    sources = [
+        SourceRom(game["title"], f"{rom_base_path:s}/{game['file']}")
+        for game in j["games"]
+        if "enabled" in game
+        and game["enabled"]
+        and os.path.exists(f"{rom_base_path:s}/{game['file']}")
+    ]
+    return sources, j["cartridge"]["battery_present"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verifies a GBA Multi Game Menu compilation")
+    parser.add_argument("image", help="the compilation ROM or one of its _partN files")
+    parser.add_argument("--config", type=str, help="the config file used to build it")
+    parser.add_argument(
+        "--rom-base-path",
+        type=str,
+        default="roms",
+        help="sets the folder where the ROM stored",
+    )
+    args = parser.parse_args()
+
+    sources, battery_present = None, None
+    if args.config:
+        sources, battery_present = sources_from_config(args.config, args.rom_base_path)
+    errors = verify_file(args.image, sources, battery_present)
+    for error in errors:
+        print(f"Error: {error}")
+    print(f"{args.image}: {'OK' if not errors else f'{len(errors)} error(s)'}")
+    sys.exit(1 if errors else 0)
@@ -22,6 +22,7 @@ import struct
 import argparse
 from typing import Optional, Tuple
 
+from utils import BufferPool, FreeSpace, PatchPlan
 from utils.PressAnyKey import press_any_key
 from .payload_bin import payload_bin
 payload_bin_len = len(payload_bin)
@@ -42,6 +43,21 @@ WRITE_EEPROMV111_SIGNATURE = bytes([0x0A, 0x88, 0x80, 0x21, 0x09, 0x06, 0x0A, 0x
 OLD_IRQ_ADDR = bytes([0xfc, 0x7f, 0x00, 0x03])
 NEW_IRQ_ADDR = bytes([0xf4, 0x7f, 0x00, 0x03])
 
+# In the order of the batteryless patch, so both patches share the patch plans of a ROM.
+WRITE_SIGNATURES = (WRITE_SRAM_SIGNATURE, WRITE_SRAM2_SIGNATURE, WRITE_SRAM_RAM_SIGNATURE, WRITE_EEPROM_SIGNATURE,
+                    WRITE_FLASH_SIGNATURE, WRITE_FLASH2_SIGNATURE, WRITE_FLASH3_SIGNATURE, WRITE_EEPROMV111_SIGNATURE)
+
+SAVE_FUNCTIONS = [
+    (WRITE_SRAM_SIGNATURE, 0x8000, "SRAM (32KB)"),
+    (WRITE_SRAM2_SIGNATURE, 0x8000, "SRAM (32KB)"),
+    (WRITE_SRAM_RAM_SIGNATURE, 0x8000, "SRAM (32KB)"),
+    (WRITE_EEPROM_SIGNATURE, 0x2000, "EEPROM (8KB)"),
+    (WRITE_EEPROMV111_SIGNATURE, 0x2000, "EEPROM (8KB)"),
+    (WRITE_FLASH_SIGNATURE, 0x10000, "Flash (64KB)"),
+    (WRITE_FLASH2_SIGNATURE, 0x10000, "Flash (64KB)"),
+    (WRITE_FLASH3_SIGNATURE, 0x20000, "Flash (128KB)")
+]
+
 class PayloadHeader:
     STRUCT_FORMAT = '<IIIIII'
 
@@ -75,29 +91,14 @@ class PayloadHeader:
         header_bytes = self.to_bytes()
         return header_bytes + payload_data[24:]
 
-def memfind(haystack: bytes, needle: bytes, stride: int = 1) -> int:
-    needle_len = len(needle)
-    haystack_len = len(haystack)
-
-    for i in range(0, haystack_len - needle_len + 1, stride):
-        if haystack[i:i+needle_len] == needle:
-            return i
-    return -1
-
-def detect_save_type(rom_data: bytes) -> Tuple[int, str]:
-    signatures = [
-        (WRITE_SRAM_SIGNATURE, 0x8000, "SRAM (32KB)"),
-        (WRITE_SRAM2_SIGNATURE, 0x8000, "SRAM (32KB)"),
-        (WRITE_SRAM_RAM_SIGNATURE, 0x8000, "SRAM (32KB)"),
-        (WRITE_EEPROM_SIGNATURE, 0x2000, "EEPROM (8KB)"),
-        (WRITE_EEPROMV111_SIGNATURE, 0x2000, "EEPROM (8KB)"),
-        (WRITE_FLASH_SIGNATURE, 0x10000, "Flash (64KB)"),
-        (WRITE_FLASH2_SIGNATURE, 0x10000, "Flash (64KB)"),
-        (WRITE_FLASH3_SIGNATURE, 0x20000, "Flash (128KB)")
-    ]
-
-    for signature, save_size, save_type in signatures:
-        pos = memfind(rom_data, signature, 2)
+def memfind(haystack: bytes, needle: bytes, stride: int = 1, end: Optional[int] = None) -> int:
+    if end is None:
+        end = len(haystack)
+    return BufferPool.find_aligned(haystack, needle, stride, 0, end)
+
+def detect_save_type(rom_data: bytes, rom_size: Optional[int] = None) -> Tuple[int, str]:
+    for signature, save_size, save_type in SAVE_FUNCTIONS:
+        pos = memfind(rom_data, signature, 2, rom_size)
         if pos != -1:
             print(f"{save_type} save function detected at offset 0x{pos:08X} - Save size: {save_size // 1024}KB")
             return save_size, save_type
@@ -105,28 +106,39 @@ def detect_save_type(rom_data: bytes) -> Tuple[int, str]:
     print("No save function signatures found. Using default size: 128KB")
     return 0x20000, "Default (128KB)"
 
-def patch_irq_references(rom_data: bytearray) -> int:
+def detect_planned_save_type(plan: PatchPlan.PatchPlan, rom_data: bytes) -> Tuple[int, str]:
+    # detect_save_type from the offsets of the plan, the IRQ patch may have overwritten a match.
+    for signature, save_size, save_type in SAVE_FUNCTIONS:
+        for pos in plan.write_functions[signature]:
+            if rom_data.startswith(signature, pos):
+                print(f"{save_type} save function detected at offset 0x{pos:08X} - Save size: {save_size // 1024}KB")
+                return save_size, save_type
+
+    print("No save function signatures found. Using default size: 128KB")
+    return 0x20000, "Default (128KB)"
+
+def patch_irq_references(rom_data: bytearray, rom_size: Optional[int] = None) -> int:
     found_count = 0
-    data_len = len(rom_data)
+    data_len = len(rom_data) if rom_size is None else rom_size
 
-    for i in range(0, data_len - 4, 4):
-        if rom_data[i:i+4] == OLD_IRQ_ADDR:
-            found_count += 1
-            print(f"Found a reference to the IRQ handler address at 0x{i:08X}, patching")
-            rom_data[i:i+4] = NEW_IRQ_ADDR
+    # Words at 0 to data_len - 8, like the original scan
+    i = BufferPool.find_aligned(rom_data, OLD_IRQ_ADDR, 4, 0, data_len - 1)
+    while i != -1:
+        found_count += 1
+        print(f"Found a reference to the IRQ handler address at 0x{i:08X}, patching")
+        rom_data[i:i+4] = NEW_IRQ_ADDR
+        i = BufferPool.find_aligned(rom_data, OLD_IRQ_ADDR, 4, i + 4, data_len - 1)
 
     return found_count
 
-def find_payload_location(rom_data: bytes, reserved_space: int, sector_size: int) -> int:
-    rom_size = len(rom_data)
+def find_payload_location(rom_data: bytes, reserved_space: int, sector_size: int,
+                          rom_size: Optional[int] = None) -> int:
+    if rom_size is None:
+        rom_size = len(rom_data)
     required_space = reserved_space + payload_bin_len
 
-    for payload_base in range(rom_size - required_space - sector_size, -1, -sector_size):
-        region = rom_data[payload_base:payload_base + required_space]
-        if all(b == 0 for b in region) or all(b == 0xFF for b in region):
-            return payload_base
-
-    return -1
+    free_space = FreeSpace.FreeSpaceIndex(rom_data, rom_size)
+    return free_space.find_last_blank(required_space, sector_size, rom_size - required_space - sector_size)
 
 def parse_arm_branch_instruction(instruction_bytes: bytes) -> int:
     if len(instruction_bytes) != 4:
@@ -179,6 +191,47 @@ def get_user_inputs(wbuf_size: Optional[int] = None, sector_size: Optional[int]
 
     return wbuf_size, sector_size
 
+def _check_options(rom_file: str, rts_file: Optional[str], wbuf_size: Optional[int], sector_size: Optional[int],
+                   interactive: bool) -> Tuple[Optional[str], int, int]:
+    # The error, if any, and the write buffer and sector size to use.
+    if not os.path.exists(rom_file):
+        return f"Input ROM file not found: {rom_file}", 0, 0
+
+    if rts_file and not os.path.exists(rts_file):
+        return f"RTS file not found: {rts_file}", 0, 0
+
+    if interactive and (wbuf_size is None or sector_size is None):
+        wbuf_size, sector_size = get_user_inputs(wbuf_size, sector_size)
+
+    if wbuf_size is None:
+        wbuf_size = 0
+    if sector_size is None:
+        sector_size = 0x10000
+
+    if wbuf_size < 0 or wbuf_size > 0xFFF:
+        return f"Invalid write buffer size: {wbuf_size} (must be 0-4095)", 0, 0
+
+    if sector_size < 0x10000 or sector_size > 0x40000:
+        return f"Invalid sector size: 0x{sector_size:X} (must be 0x10000-0x40000)", 0, 0
+
+    if os.path.getsize(rom_file) > MAX_ROM_SIZE:
+        return f"ROM too large (max 0x{MAX_ROM_SIZE:X} bytes)", 0, 0
+
+    return None, wbuf_size, sector_size
+
+def analyse(rom_file: str) -> PatchPlan.PatchPlan:
+    """
+    Analyse a GBA ROM for apply_plan
+
+    Raises:
+        OSError: the ROM can't be read
+        ValueError: the ROM is too large
+    """
+    if os.path.getsize(rom_file) > MAX_ROM_SIZE:
+        raise ValueError(f"ROM too large (max 0x{MAX_ROM_SIZE:X} bytes)")
+    with BufferPool.pool.acquire() as buffer:
+        return PatchPlan.load(buffer, rom_file, WRITE_SIGNATURES)
+
 def apply_patch(rom_file: str, rts_file: Optional[str] = None,
                 wbuf_size: Optional[int] = None, sector_size: Optional[int] = None,
                 output_file: Optional[str] = None,
@@ -197,165 +250,178 @@ def apply_patch(rom_file: str, rts_file: Optional[str] = None,
     Returns:
         Tuple[bool, str]: success or not and other info
     """
-
-    if not os.path.exists(rom_file):
-        return False, f"Input ROM file not found: {rom_file}"
-
-    if rts_file and not os.path.exists(rts_file):
-        return False, f"RTS file not found: {rts_file}"
-
-    if interactive and (wbuf_size is None or sector_size is None):
-        wbuf_size, sector_size = get_user_inputs(wbuf_size, sector_size)
-
-    if wbuf_size is None:
-        wbuf_size = 0
-    if sector_size is None:
-        sector_size = 0x10000
-
-    if wbuf_size < 0 or wbuf_size > 0xFFF:
-        return False, f"Invalid write buffer size: {wbuf_size} (must be 0-4095)"
-
-    if sector_size < 0x10000 or sector_size > 0x40000:
-        return False, f"Invalid sector size: 0x{sector_size:X} (must be 0x10000-0x40000)"
-
     try:
+        error, wbuf_size, sector_size = _check_options(rom_file, rts_file, wbuf_size, sector_size, interactive)
+        if error:
+            return False, error
         if interactive:
             print(f"Reading ROM file: {rom_file}")
-        with open(rom_file, 'rb') as f:
-            rom_data = bytearray(f.read())
+        # The ROM is patched in place in a pooled buffer, rom_data[rom_size:] is not part of it.
+        with BufferPool.pool.acquire() as buffer:
+            plan = PatchPlan.load(buffer, rom_file, WRITE_SIGNATURES)
+            return _apply_patch(buffer, plan, rom_file, rts_file, wbuf_size, sector_size, output_file, interactive)
+    except Exception as e:
+        return False, f"Error during processing: {e}"
 
-        rom_size = len(rom_data)
-        if interactive:
-            print(f"ROM size: {rom_size} bytes (0x{rom_size:X})")
+def apply_plan(plan: PatchPlan.PatchPlan, rom_file: str, rts_file: Optional[str] = None,
+               wbuf_size: Optional[int] = None, sector_size: Optional[int] = None,
+               output_file: Optional[str] = None,
+               interactive: bool = True) -> Tuple[bool, str]:
+    """
+    Apply RTS patch into the GBA ROM of a plan from analyse, without searching it again
 
-        if rom_size > MAX_ROM_SIZE:
-            return False, f"ROM too large (max 0x{MAX_ROM_SIZE:X} bytes)"
+    Args and returns are the same as apply_patch.
+    """
+    try:
+        error, wbuf_size, sector_size = _check_options(rom_file, rts_file, wbuf_size, sector_size, interactive)
+        if error:
+            return False, error
+        if interactive:
+            print(f"Reading ROM file: {rom_file}")
+        with BufferPool.pool.acquire() as buffer:
+            _, digest = PatchPlan.read(buffer, rom_file)
+            if digest != plan.digest:
+                return False, "The ROM has changed since it was analysed."
+            return _apply_patch(buffer, plan, rom_file, rts_file, wbuf_size, sector_size, output_file, interactive)
+    except Exception as e:
+        return False, f"Error during processing: {e}"
 
-        if memfind(rom_data, SIGNATURE, 4) != -1:
-            return False, "Signature found. ROM already patched!"
+def _apply_patch(buffer: BufferPool.RomBuffer, plan: PatchPlan.PatchPlan, rom_file: str, rts_file: Optional[str],
+                 wbuf_size: int, sector_size: int, output_file: Optional[str],
+                 interactive: bool) -> Tuple[bool, str]:
+    # The buffer holds the ROM of the plan, padded to 256 KiB.
+    rom_data = buffer.arena
+    rom_size = buffer.size
+    if interactive:
+        print(f"ROM size: {plan.size} bytes (0x{plan.size:X})")
 
-        if rom_size & 0x3FFFF:
-            if interactive:
-                print("ROM has been trimmed and is misaligned. Padding to 256KB alignment")
-            rom_size = (rom_size & ~0x3FFFF) + 0x40000
-            rom_data.extend(b'\xFF' * (rom_size - len(rom_data)))
+    if plan.patched:
+        return False, "Signature found. ROM already patched!"
 
+    if plan.size & 0x3FFFF:
         if interactive:
-            print("Finding and patching IRQ handler address references...")
-        found_irq = patch_irq_references(rom_data)
-        if found_irq == 0:
-            return False, "Could not find any reference to the IRQ handler. Has the ROM already been patched?"
+            print("ROM has been trimmed and is misaligned. Padding to 256KB alignment")
+
+    if interactive:
+        print("Finding and patching IRQ handler address references...")
+    found_irq = 0
+    for i in plan.irq_references:
+        # Words at 0 to rom_size - 8, like patch_irq_references
+        if i + 4 < rom_size:
+            found_irq += 1
+            print(f"Found a reference to the IRQ handler address at 0x{i:08X}, patching")
+            rom_data[i:i+4] = NEW_IRQ_ADDR
+    if found_irq == 0:
+        return False, "Could not find any reference to the IRQ handler. Has the ROM already been patched?"
+    if interactive:
+        print(f"Found and patched {found_irq} IRQ references")
+
+    if interactive:
+        print("Scanning ROM for save function signatures...")
+    detected_save_size, save_type = detect_planned_save_type(plan, rom_data)
+
+    if interactive:
+        print("Final save configuration:")
+        print(f"\tSave size: {detected_save_size // 1024} KB (0x{detected_save_size:X} bytes)")
+        print(f"\tWrite buffer: {wbuf_size} bytes")
+        print(f"\tSector size: 0x{sector_size:X} bytes")
+
+    reserved_space = 0x70000  # 448KB
+    reserved_space += detected_save_size
+    if reserved_space % sector_size:
+        reserved_space = reserved_space - (reserved_space % sector_size) + sector_size
         if interactive:
-            print(f"Found and patched {found_irq} IRQ references")
+            print(f"Padding reserved space to 0x{reserved_space:X}")
 
-        if interactive:
-            print("Scanning ROM for save function signatures...")
-        detected_save_size, save_type = detect_save_type(rom_data)
+    required_space = reserved_space + payload_bin_len
+    payload_base = plan.free_space_index().find_last_blank(required_space, 0x40000,
+                                                           rom_size - required_space - 0x40000)
 
+    if payload_base == -1:
         if interactive:
-            print("Final save configuration:")
-            print(f"\tSave size: {detected_save_size // 1024} KB (0x{detected_save_size:X} bytes)")
-            print(f"\tWrite buffer: {wbuf_size} bytes")
-            print(f"\tSector size: 0x{sector_size:X} bytes")
-
-        reserved_space = 0x70000  # 448KB
-        reserved_space += detected_save_size
-        if reserved_space % sector_size:
-            reserved_space = reserved_space - (reserved_space % sector_size) + sector_size
+            print("ROM too small to install payload.")
+        if rom_size + reserved_space > MAX_ROM_SIZE:
+            return False, "ROM already max size. Cannot expand. Cannot install payload"
+        else:
             if interactive:
-                print(f"Padding reserved space to 0x{reserved_space:X}")
+                print("Expanding ROM")
+            new_size = rom_size + reserved_space
+            buffer.resize(new_size)
+            rom_size = new_size
+            payload_base = rom_size - reserved_space - payload_bin_len
 
-        payload_base = find_payload_location(bytes(rom_data), reserved_space, 0x40000)
+    if interactive:
+        print(f"Installing payload at offset 0x{payload_base:X}")
+        print(f"Payload ROM address: 0x{0x08000000 + payload_base:08X}")
+        print(f"Payload size: {payload_bin_len} bytes (0x{payload_bin_len:X})")
 
-        if payload_base == -1:
-            if interactive:
-                print("ROM too small to install payload.")
-            if rom_size + reserved_space > MAX_ROM_SIZE:
-                return False, "ROM already max size. Cannot expand. Cannot install payload"
-            else:
-                if interactive:
-                    print("Expanding ROM")
-                new_size = rom_size + reserved_space
-                rom_data.extend(b'\xFF' * (new_size - len(rom_data)))
-                rom_size = new_size
-                payload_base = rom_size - reserved_space - payload_bin_len
+    rom_data[payload_base:payload_base + payload_bin_len] = payload_bin
 
-        if interactive:
-            print(f"Installing payload at offset 0x{payload_base:X}")
-            print(f"Payload ROM address: 0x{0x08000000 + payload_base:08X}")
-            print(f"Payload size: {payload_bin_len} bytes (0x{payload_bin_len:X})")
+    header = PayloadHeader(rom_data[payload_base:payload_base + 24])
+    header.rts_size = reserved_space
+    header.save_size = detected_save_size
+    header.wbuf_size = wbuf_size
 
-        rom_data[payload_base:payload_base + payload_bin_len] = payload_bin
+    updated_header = header.to_bytes()
+    rom_data[payload_base:payload_base + 24] = updated_header
 
-        header = PayloadHeader(rom_data[payload_base:payload_base + 24])
-        header.rts_size = reserved_space
-        header.save_size = detected_save_size
-        header.wbuf_size = wbuf_size
+    if interactive:
+        print(f"  Combined rts_size field: 0x{header.rts_size:08X}")
 
-        updated_header = header.to_bytes()
-        rom_data[payload_base:payload_base + 24] = updated_header
+    sram_save_base = payload_base + payload_bin_len
+    if interactive:
+        print(f"SRAM save space offset: 0x{sram_save_base:X}")
+        print(f"SRAM save space ROM address: 0x{0x08000000 + sram_save_base:08X}")
+        print(f"Reserved space size: {reserved_space // 1024} KB (0x{reserved_space:X} bytes)")
 
+    if rts_file:
         if interactive:
-            print(f"  Combined rts_size field: 0x{header.rts_size:08X}")
+            print(f"Embedding RTS file: {rts_file}")
+        try:
+            with open(rts_file, 'rb') as f:
+                rts_data = f.read()
 
-        sram_save_base = payload_base + payload_bin_len
-        if interactive:
-            print(f"SRAM save space offset: 0x{sram_save_base:X}")
-            print(f"SRAM save space ROM address: 0x{0x08000000 + sram_save_base:08X}")
-            print(f"Reserved space size: {reserved_space // 1024} KB (0x{reserved_space:X} bytes)")
+            if len(rts_data) != RTS_SIZE:
+                return False, f"RTS file size must be exactly 448KB (458752 bytes), but got {len(rts_data)} bytes"
 
-        if rts_file:
+            rom_data[sram_save_base:sram_save_base + RTS_SIZE] = rts_data
             if interactive:
-                print(f"Embedding RTS file: {rts_file}")
-            try:
-                with open(rts_file, 'rb') as f:
-                    rts_data = f.read()
+                print(f"RTS file embedded successfully at offset 0x{sram_save_base:X}")
+                print("RTS covers sectors 0-6 (448KB) after payload")
+        except Exception as e:
+            return False, f"Failed to read RTS file: {e}"
 
-                if len(rts_data) != RTS_SIZE:
-                    return False, f"RTS file size must be exactly 448KB (458752 bytes), but got {len(rts_data)} bytes"
+    if rom_data[3] != 0xEA:
+        return False, "Unexpected entrypoint instruction"
 
-                rom_data[sram_save_base:sram_save_base + RTS_SIZE] = rts_data
-                if interactive:
-                    print(f"RTS file embedded successfully at offset 0x{sram_save_base:X}")
-                    print("RTS covers sectors 0-6 (448KB) after payload")
-            except Exception as e:
-                return False, f"Failed to read RTS file: {e}"
+    original_entrypoint_address = parse_arm_branch_instruction(rom_data[0:4])
+    if interactive:
+        print(f"Original entrypoint address: 0x{original_entrypoint_address:08X}")
 
-        if rom_data[3] != 0xEA:
-            return False, "Unexpected entrypoint instruction"
+    header.original_entrypoint = original_entrypoint_address
+    updated_header = header.to_bytes()
+    rom_data[payload_base:payload_base + 24] = updated_header
 
-        original_entrypoint_address = parse_arm_branch_instruction(rom_data[0:4])
-        if interactive:
-            print(f"Original entrypoint address: 0x{original_entrypoint_address:08X}")
+    payload_header_in_bin = PayloadHeader(payload_bin[:24])
+    new_entrypoint_address = 0x08000000 + payload_base + payload_header_in_bin.patched_entrypoint_addr
 
-        header.original_entrypoint = original_entrypoint_address
-        updated_header = header.to_bytes()
-        rom_data[payload_base:payload_base + 24] = updated_header
+    new_branch_instruction = create_arm_branch_instruction(new_entrypoint_address)
+    rom_data[0:4] = new_branch_instruction
 
-        payload_header_in_bin = PayloadHeader(payload_bin[:24])
-        new_entrypoint_address = 0x08000000 + payload_base + payload_header_in_bin.patched_entrypoint_addr
+    if output_file is None:
+        base_name = os.path.splitext(rom_file)[0]
+        output_file = f"{base_name}_rts_keypad_wb{wbuf_size}.gba"
 
-        new_branch_instruction = create_arm_branch_instruction(new_entrypoint_address)
-        rom_data[0:4] = new_branch_instruction
+    if interactive:
+        print(f"Writing patched ROM: {output_file}")
+    buffer.write(output_file)
 
-        if output_file is None:
-            base_name = os.path.splitext(rom_file)[0]
-            output_file = f"{base_name}_rts_keypad_wb{wbuf_size}.gba"
+    if interactive:
+        print("Patched successfully!")
+        print("RTS save: L + R + Start")
+        print("RTS load: L + R + Select")
 
-        if interactive:
-            print(f"Writing patched ROM: {output_file}")
-        with open(output_file, 'wb') as f:
-            f.write(rom_data[:rom_size])
-
-        if interactive:
-            print("Patched successfully!")
-            print("RTS save: L + R + Start")
-            print("RTS load: L + R + Select")
-
-        return True, output_file
-
-    except Exception as e:
-        return False, f"Error during processing: {e}"
+    return True, output_file
 
 def print_license():
     # From the original code.
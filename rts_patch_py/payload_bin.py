@@ -1,480 +1,21 @@
 """
 Here only provide a pre-built version of the payload.bin.
-You can build the payload in https://github.com/ArcheyChen/GBA-RTS-PATCH on your own and replace the payload here.
+You can build the payload in https://github.com/ArcheyChen/GBA-RTS-PATCH on your own and replace the payload.bin here.
+Remember to update PAYLOAD_SHA256 after replacing it.
 """
 
-payload_bin = bytes([
-    0xc0, 0x00, 0x00, 0x08, 0xf0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00,
-    0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xb8, 0x00, 0x00, 0x00,
-    0x41, 0x75, 0x73, 0x61, 0x72, 0x27, 0x53, 0x2d, 0x52, 0x54, 0x53, 0x46,
-    0x49, 0x4c, 0x45, 0x2e, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x04, 0x00,
-    0x08, 0x00, 0x0a, 0x00, 0x0c, 0x00, 0x0e, 0x00, 0x48, 0x00, 0x4a, 0x00,
-    0x50, 0x00, 0x52, 0x00, 0x84, 0x00, 0x60, 0x00, 0x62, 0x00, 0x68, 0x00,
-    0x70, 0x00, 0x72, 0x00, 0x78, 0x00, 0x80, 0x00, 0x82, 0x00, 0x88, 0x00,
-    0x90, 0x00, 0x92, 0x00, 0x94, 0x00, 0x96, 0x00, 0x98, 0x00, 0x9a, 0x00,
-    0x9c, 0x00, 0x9e, 0x00, 0xb8, 0x00, 0xc4, 0x00, 0xd0, 0x00, 0xdc, 0x00,
-    0x20, 0x01, 0x22, 0x01, 0x24, 0x01, 0x26, 0x01, 0x28, 0x01, 0x2a, 0x01,
-    0x2c, 0x01, 0x32, 0x01, 0x34, 0x01, 0x40, 0x01, 0x50, 0x01, 0x54, 0x01,
-    0x00, 0x02, 0x04, 0x02, 0x08, 0x02, 0x10, 0x00, 0x12, 0x00, 0x14, 0x00,
-    0x16, 0x00, 0x18, 0x00, 0x1a, 0x00, 0x1c, 0x00, 0x1e, 0x00, 0x20, 0x00,
-    0x22, 0x00, 0x24, 0x00, 0x26, 0x00, 0x30, 0x00, 0x32, 0x00, 0x34, 0x00,
-    0x36, 0x00, 0x40, 0x00, 0x42, 0x00, 0x44, 0x00, 0x46, 0x00, 0x4c, 0x00,
-    0x54, 0x00, 0x00, 0xff, 0x04, 0xe0, 0x2d, 0xe5, 0x76, 0x00, 0x00, 0xeb,
-    0x04, 0xe0, 0x9d, 0xe4, 0x00, 0xf0, 0xa0, 0xe1, 0x01, 0x40, 0x2d, 0xe9,
-    0x23, 0x00, 0x00, 0xeb, 0x01, 0x00, 0x50, 0xe3, 0x01, 0x40, 0xbd, 0xe8,
-    0x00, 0x00, 0x00, 0x0a, 0x0c, 0xf0, 0x10, 0xe5, 0x00, 0x00, 0x4f, 0xe1,
-    0x00, 0x10, 0x0f, 0xe1, 0xdf, 0x20, 0xa0, 0xe3, 0x02, 0xf0, 0x29, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x34, 0xd0, 0x4d, 0xe2, 0x0d, 0x20, 0xa0, 0xe1,
-    0x01, 0xf0, 0x29, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x02, 0xc0, 0xa0, 0xe1,
-    0x01, 0x00, 0xac, 0xe8, 0xf0, 0x6f, 0xac, 0xe8, 0x04, 0xe0, 0x2d, 0xe5,
-    0xdf, 0x30, 0xa0, 0xe3, 0x03, 0xf0, 0x29, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x0d, 0x00, 0xa0, 0xe1, 0x34, 0x00, 0x80, 0xe2, 0x2c, 0x30, 0x82, 0xe2,
-    0x01, 0x40, 0xa3, 0xe8, 0x01, 0xf0, 0x29, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x02, 0x00, 0xa0, 0xe1, 0x12, 0x00, 0x00, 0xeb, 0x00, 0x10, 0x0f, 0xe1,
-    0xdf, 0x30, 0xa0, 0xe3, 0x03, 0xf0, 0x29, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x34, 0xd0, 0x8d, 0xe2, 0x01, 0xf0, 0x29, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x04, 0xf0, 0x9d, 0xe4, 0x20, 0x30, 0x9f, 0xe5, 0xb0, 0x33, 0xd3, 0xe1,
-    0xc2, 0x0f, 0x13, 0xe3, 0x03, 0x00, 0x00, 0x0a, 0xc1, 0x0f, 0x13, 0xe3,
-    0x01, 0x00, 0xa0, 0x03, 0x00, 0x00, 0xa0, 0x13, 0x1e, 0xff, 0x2f, 0xe1,
-    0x01, 0x00, 0xa0, 0xe3, 0x1e, 0xff, 0x2f, 0xe1, 0x00, 0x01, 0x00, 0x04,
-    0xf0, 0x40, 0x2d, 0xe9, 0xfc, 0x70, 0x9f, 0xe5, 0xb0, 0x43, 0xd7, 0xe1,
-    0xc1, 0x0f, 0x14, 0xe3, 0x01, 0x30, 0xa0, 0x03, 0x00, 0x30, 0xa0, 0x13,
-    0xc2, 0x4f, 0x14, 0xe2, 0x01, 0x30, 0x83, 0x03, 0x00, 0x00, 0x53, 0xe3,
-    0x14, 0xd0, 0x4d, 0xe2, 0x2e, 0x00, 0x00, 0x0a, 0x01, 0x33, 0xa0, 0xe3,
-    0xba, 0x2b, 0xd3, 0xe1, 0xb4, 0x20, 0xcd, 0xe1, 0xb6, 0x2c, 0xd3, 0xe1,
-    0xb6, 0x20, 0xcd, 0xe1, 0xb2, 0x2d, 0xd3, 0xe1, 0xb8, 0x20, 0xcd, 0xe1,
-    0xbe, 0x2d, 0xd3, 0xe1, 0xba, 0x20, 0xcd, 0xe1, 0xb0, 0x28, 0xd3, 0xe1,
-    0xbc, 0x20, 0xcd, 0xe1, 0xb4, 0x28, 0xd3, 0xe1, 0xbe, 0x20, 0xcd, 0xe1,
-    0x00, 0x20, 0xa0, 0xe3, 0xa0, 0x50, 0x9f, 0xe5, 0x02, 0x00, 0x54, 0xe1,
-    0xb8, 0x60, 0xd5, 0xe1, 0x00, 0x10, 0xa0, 0xe1, 0xb8, 0x20, 0xc5, 0xe1,
-    0xb4, 0x28, 0xc3, 0xe1, 0xba, 0x2b, 0xc3, 0xe1, 0xb6, 0x2c, 0xc3, 0xe1,
-    0xb2, 0x2d, 0xc3, 0xe1, 0xbe, 0x2d, 0xc3, 0xe1, 0x1b, 0x00, 0x00, 0x1a,
-    0x04, 0x00, 0x8d, 0xe2, 0x2e, 0x00, 0x00, 0xeb, 0x01, 0x33, 0xa0, 0xe3,
-    0xb4, 0x20, 0xdd, 0xe1, 0xba, 0x2b, 0xc3, 0xe1, 0xb6, 0x20, 0xdd, 0xe1,
-    0xb6, 0x2c, 0xc3, 0xe1, 0xb8, 0x20, 0xdd, 0xe1, 0xb2, 0x2d, 0xc3, 0xe1,
-    0xba, 0x20, 0xdd, 0xe1, 0xbe, 0x2d, 0xc3, 0xe1, 0xbe, 0x20, 0xdd, 0xe1,
-    0xb4, 0x28, 0xc3, 0xe1, 0xbc, 0x20, 0xdd, 0xe1, 0x00, 0x00, 0x54, 0xe3,
-    0xb0, 0x28, 0xc3, 0xe1, 0xc1, 0x3f, 0xa0, 0x13, 0xc2, 0x3f, 0xa0, 0x03,
-    0xb8, 0x60, 0xc5, 0xe1, 0xb0, 0x23, 0xd7, 0xe1, 0x03, 0x00, 0x12, 0xe1,
-    0xfc, 0xff, 0xff, 0x0a, 0x3f, 0x33, 0xe0, 0xe3, 0x01, 0x01, 0xa0, 0xe3,
-    0x0b, 0x30, 0x13, 0xe5, 0x14, 0xd0, 0x8d, 0xe2, 0xf0, 0x40, 0xbd, 0xe8,
-    0x13, 0xff, 0x2f, 0xe1, 0x6d, 0x00, 0x00, 0xeb, 0xe3, 0xff, 0xff, 0xea,
-    0x00, 0x01, 0x00, 0x04, 0x00, 0x02, 0x00, 0x04, 0x77, 0x1f, 0x4f, 0xe2,
-    0x00, 0x00, 0xa0, 0xe1, 0xab, 0x2f, 0x4f, 0xe2, 0x00, 0x00, 0xa0, 0xe1,
-    0x3f, 0x33, 0xe0, 0xe3, 0x03, 0x10, 0x03, 0xe5, 0x0e, 0x34, 0xa0, 0xe3,
-    0x7f, 0x10, 0xe0, 0xe3, 0x03, 0x10, 0xc3, 0xe5, 0x01, 0x10, 0xd2, 0xe5,
-    0x00, 0x30, 0xd2, 0xe5, 0x01, 0x34, 0x83, 0xe1, 0x02, 0x10, 0xd2, 0xe5,
-    0x03, 0x00, 0xd2, 0xe5, 0x01, 0x38, 0x83, 0xe1, 0x00, 0x0c, 0x83, 0xe1,
-    0x1e, 0xff, 0x2f, 0xe1, 0x01, 0x33, 0xa0, 0xe3, 0x01, 0x20, 0xa0, 0xe3,
-    0xf0, 0x41, 0x2d, 0xe9, 0x00, 0x60, 0xa0, 0xe1, 0x01, 0x70, 0xa0, 0xe1,
-    0xb2, 0x20, 0xc3, 0xe1, 0x24, 0x30, 0x8f, 0xe2, 0x13, 0x3c, 0x83, 0xe2,
-    0xc2, 0x4f, 0x4f, 0xe2, 0x00, 0x00, 0xa0, 0xe1, 0x3a, 0x8e, 0x8f, 0xe2,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x50, 0xa0, 0xe3, 0x00, 0x20, 0x98, 0xe5,
-    0x00, 0x00, 0x52, 0xe3, 0x2f, 0x00, 0x00, 0x0a, 0x00, 0x10, 0xa0, 0xe3,
-    0x04, 0x30, 0x98, 0xe5, 0x01, 0x00, 0xa0, 0xe1, 0x03, 0x30, 0x84, 0xe0,
-    0x02, 0x20, 0x84, 0xe0, 0xf8, 0x00, 0x00, 0xeb, 0x00, 0x00, 0x50, 0xe3,
-    0x18, 0x80, 0x88, 0x02, 0x01, 0x50, 0x85, 0x02, 0xf2, 0xff, 0xff, 0x0a,
-    0x09, 0x20, 0xd4, 0xe5, 0x08, 0x30, 0xd4, 0xe5, 0x02, 0x34, 0x83, 0xe1,
-    0x0a, 0x20, 0xd4, 0xe5, 0x0b, 0x10, 0xd4, 0xe5, 0x02, 0x38, 0x83, 0xe1,
-    0x01, 0x1c, 0x83, 0xe1, 0x05, 0x00, 0xa0, 0xe1, 0xc0, 0x03, 0x00, 0xeb,
-    0x0d, 0x20, 0xd4, 0xe5, 0x0c, 0x30, 0xd4, 0xe5, 0x02, 0x34, 0x83, 0xe1,
-    0x0e, 0x20, 0xd4, 0xe5, 0x02, 0x38, 0x83, 0xe1, 0x0f, 0x20, 0xd4, 0xe5,
-    0x05, 0x10, 0xa0, 0xe1, 0x02, 0x2c, 0x83, 0xe1, 0x07, 0x00, 0xa0, 0xe3,
-    0xcb, 0x03, 0x00, 0xeb, 0x05, 0x00, 0xa0, 0xe1, 0x03, 0x04, 0x00, 0xeb,
-    0x05, 0x00, 0xa0, 0xe1, 0x33, 0x04, 0x00, 0xeb, 0x05, 0x00, 0xa0, 0xe1,
-    0x19, 0x04, 0x00, 0xeb, 0x07, 0x20, 0xa0, 0xe1, 0x06, 0x10, 0xa0, 0xe1,
-    0x05, 0x00, 0xa0, 0xe1, 0x3a, 0x04, 0x00, 0xeb, 0x0d, 0x20, 0xd4, 0xe5,
-    0x0c, 0x30, 0xd4, 0xe5, 0x02, 0x34, 0x83, 0xe1, 0x0e, 0x20, 0xd4, 0xe5,
-    0x0f, 0x10, 0xd4, 0xe5, 0x02, 0x38, 0x83, 0xe1, 0x07, 0x00, 0xa0, 0xe3,
-    0x01, 0x1c, 0x83, 0xe1, 0xd8, 0x03, 0x00, 0xeb, 0x01, 0x33, 0xa0, 0xe3,
-    0x00, 0x20, 0xa0, 0xe3, 0xf0, 0x41, 0xbd, 0xe8, 0xb2, 0x20, 0xc3, 0xe1,
-    0x1e, 0xff, 0x2f, 0xe1, 0x00, 0x30, 0xa0, 0xe3, 0x09, 0xc4, 0xa0, 0xe3,
-    0x04, 0xe0, 0x2d, 0xe5, 0xb0, 0x30, 0xcc, 0xe1, 0x01, 0xe0, 0xa0, 0xe3,
-    0x0e, 0x34, 0xa0, 0xe3, 0x0e, 0x14, 0x81, 0xe2, 0x01, 0x00, 0x53, 0xe1,
-    0x04, 0x00, 0x00, 0x3a, 0x09, 0x34, 0xa0, 0xe3, 0x00, 0x20, 0xa0, 0xe3,
-    0x04, 0xe0, 0x9d, 0xe4, 0xb0, 0x20, 0xc3, 0xe1, 0x1e, 0xff, 0x2f, 0xe1,
-    0x01, 0x08, 0x13, 0xe3, 0x0e, 0x34, 0xa0, 0x13, 0xb0, 0xe0, 0xcc, 0x11,
-    0x01, 0x20, 0xd0, 0xe4, 0xff, 0x20, 0x02, 0xe2, 0x01, 0x20, 0xc3, 0xe4,
-    0xf1, 0xff, 0xff, 0xea, 0x97, 0x40, 0x2d, 0xe9, 0xc4, 0x03, 0x00, 0xeb,
-    0x00, 0x00, 0x50, 0xe3, 0x82, 0x00, 0x00, 0x0a, 0x01, 0x33, 0xa0, 0xe3,
-    0x01, 0x20, 0xa0, 0xe3, 0xb2, 0x20, 0xc3, 0xe1, 0xb8, 0xc0, 0x8f, 0xe2,
-    0x11, 0xcc, 0x8c, 0xe2, 0x00, 0x20, 0xa0, 0xe3, 0x0c, 0x30, 0xa0, 0xe1,
-    0x02, 0x11, 0x63, 0xe0, 0x02, 0x14, 0x81, 0xe2, 0x01, 0x08, 0x83, 0xe2,
-    0x00, 0xe0, 0x93, 0xe5, 0x03, 0xe0, 0x81, 0xe7, 0x04, 0x30, 0x83, 0xe2,
-    0x00, 0x00, 0x53, 0xe1, 0xfa, 0xff, 0xff, 0x1a, 0x01, 0x29, 0x82, 0xe2,
-    0x01, 0x08, 0x52, 0xe3, 0xf4, 0xff, 0xff, 0x1a, 0x05, 0x38, 0x8c, 0xe2,
-    0x00, 0x30, 0x8d, 0xe5, 0xe0, 0x31, 0x9f, 0xe5, 0x03, 0x10, 0xa0, 0xe1,
-    0xfa, 0x24, 0x8c, 0xe2, 0xd8, 0x01, 0x9f, 0xe5, 0x12, 0x49, 0x82, 0xe2,
-    0x03, 0xe0, 0x94, 0xe7, 0x04, 0xe0, 0x83, 0xe4, 0x00, 0x00, 0x53, 0xe1,
-    0xfb, 0xff, 0xff, 0x1a, 0x06, 0x34, 0xa0, 0xe3, 0x01, 0x27, 0x82, 0xe2,
-    0x03, 0x00, 0x92, 0xe7, 0x04, 0x00, 0x83, 0xe4, 0x01, 0x00, 0x53, 0xe1,
-    0xfb, 0xff, 0xff, 0x1a, 0x05, 0x34, 0xa0, 0xe3, 0xfb, 0x24, 0x8c, 0xe2,
-    0xa4, 0x01, 0x9f, 0xe5, 0x06, 0x18, 0x8c, 0xe2, 0x06, 0x28, 0x82, 0xe2,
-    0x03, 0xe0, 0x92, 0xe7, 0x04, 0xe0, 0x83, 0xe4, 0x00, 0x00, 0x53, 0xe1,
-    0xfb, 0xff, 0xff, 0x1a, 0x07, 0x34, 0xa0, 0xe3, 0xf9, 0x24, 0x8c, 0xe2,
-    0x84, 0x01, 0x9f, 0xe5, 0x1a, 0x29, 0x82, 0xe2, 0x03, 0xe0, 0x92, 0xe7,
-    0x04, 0xe0, 0x83, 0xe4, 0x00, 0x00, 0x53, 0xe1, 0xfb, 0xff, 0xff, 0x1a,
-    0x06, 0x20, 0x4f, 0xe2, 0x05, 0x2c, 0x42, 0xe2, 0xb0, 0x30, 0xd2, 0xe1,
-    0xff, 0x0c, 0x53, 0xe3, 0x4c, 0x00, 0x00, 0x1a, 0x02, 0x39, 0x81, 0xe2,
-    0x40, 0x04, 0xd3, 0xe5, 0x41, 0x24, 0xd3, 0xe5, 0x02, 0x04, 0x80, 0xe1,
-    0x01, 0x23, 0xa0, 0xe3, 0xba, 0x0b, 0xc2, 0xe1, 0x42, 0x04, 0xd3, 0xe5,
-    0x43, 0xe4, 0xd3, 0xe5, 0x0e, 0x04, 0x80, 0xe1, 0xb6, 0x0c, 0xc2, 0xe1,
-    0x44, 0x04, 0xd3, 0xe5, 0x45, 0xe4, 0xd3, 0xe5, 0x0e, 0x04, 0x80, 0xe1,
-    0xb2, 0x0d, 0xc2, 0xe1, 0x46, 0x04, 0xd3, 0xe5, 0x47, 0xe4, 0xd3, 0xe5,
-    0x0e, 0x04, 0x80, 0xe1, 0xbe, 0x0d, 0xc2, 0xe1, 0x48, 0x04, 0xd3, 0xe5,
-    0x49, 0xe4, 0xd3, 0xe5, 0x0e, 0x04, 0x80, 0xe1, 0xb0, 0x08, 0xc2, 0xe1,
-    0x4a, 0x04, 0xd3, 0xe5, 0x4b, 0x34, 0xd3, 0xe5, 0x03, 0x34, 0x80, 0xe1,
-    0xb4, 0x38, 0xc2, 0xe1, 0x09, 0x3a, 0x81, 0xe2, 0x28, 0x00, 0x93, 0xe5,
-    0x28, 0x00, 0x82, 0xe5, 0x2c, 0x00, 0x93, 0xe5, 0x2c, 0x00, 0x82, 0xe5,
-    0x38, 0x00, 0x93, 0xe5, 0x38, 0x00, 0x82, 0xe5, 0x3c, 0x30, 0x93, 0xe5,
-    0x3c, 0x30, 0x82, 0xe5, 0x00, 0x20, 0xa0, 0xe3, 0xcc, 0x30, 0x9f, 0xe5,
-    0x21, 0x1b, 0x81, 0xe2, 0xb2, 0x20, 0xc3, 0xe1, 0x04, 0x10, 0x8d, 0xe5,
-    0x00, 0x00, 0x0f, 0xe1, 0x04, 0x70, 0x9d, 0xe5, 0x00, 0x20, 0x97, 0xe5,
-    0x02, 0xf0, 0x6f, 0xe1, 0xdf, 0x10, 0xa0, 0xe3, 0x01, 0xf0, 0x29, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x2c, 0x70, 0x87, 0xe2, 0x00, 0x60, 0xb7, 0xe8,
-    0x00, 0xf0, 0x29, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x94, 0x10, 0x9f, 0xe5,
-    0x3f, 0xc3, 0x8c, 0xe2, 0x1a, 0x3e, 0x43, 0xe2, 0x69, 0xca, 0x8c, 0xe2,
-    0x03, 0x20, 0xdc, 0xe7, 0xff, 0x20, 0x02, 0xe2, 0x01, 0x20, 0xc3, 0xe4,
-    0x01, 0x00, 0x53, 0xe1, 0xfa, 0xff, 0xff, 0x1a, 0x01, 0x33, 0xa0, 0xe3,
-    0x00, 0x20, 0xa0, 0xe3, 0xb2, 0x20, 0xc3, 0xe1, 0x04, 0xc0, 0x9d, 0xe5,
-    0x00, 0x20, 0x9d, 0xe5, 0x03, 0x34, 0xa0, 0xe3, 0x02, 0x49, 0xa0, 0xe3,
-    0x04, 0x50, 0x92, 0xe4, 0x04, 0x50, 0x83, 0xe4, 0x04, 0x40, 0x54, 0xe2,
-    0xfb, 0xff, 0xff, 0x1a, 0xf8, 0x6f, 0xbc, 0xe8, 0x01, 0x03, 0xa0, 0xe3,
-    0x0c, 0xf0, 0x10, 0xe5, 0x0c, 0xd0, 0x8d, 0xe2, 0x90, 0x40, 0xbd, 0xe8,
-    0x1e, 0xff, 0x2f, 0xe1, 0x09, 0x0a, 0x83, 0xe2, 0xa3, 0x30, 0xa0, 0xe1,
-    0xb0, 0x00, 0x91, 0xe1, 0x83, 0x30, 0xa0, 0xe1, 0x01, 0x33, 0x83, 0xe2,
-    0xb0, 0x00, 0xc3, 0xe1, 0x02, 0x20, 0x82, 0xe2, 0xa7, 0xff, 0xff, 0xea,
-    0x00, 0x00, 0x01, 0x06, 0x00, 0x80, 0x01, 0x06, 0x00, 0x04, 0x00, 0x05,
-    0x00, 0x04, 0x00, 0x07, 0x00, 0x02, 0x00, 0x04, 0x90, 0x00, 0x00, 0x04,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x80, 0x07, 0x00, 0x00,
-    0x30, 0x08, 0x00, 0x00, 0x30, 0x08, 0x00, 0x00, 0xc0, 0x08, 0x00, 0x00,
-    0xc0, 0x08, 0x00, 0x00, 0x10, 0x0a, 0x00, 0x00, 0x10, 0x10, 0x00, 0x00,
-    0xb0, 0x10, 0x00, 0x00, 0xb0, 0x10, 0x00, 0x00, 0x70, 0x11, 0x00, 0x00,
-    0x70, 0x11, 0x00, 0x00, 0x70, 0x12, 0x00, 0x00, 0x10, 0x0a, 0x00, 0x00,
-    0x80, 0x0a, 0x00, 0x00, 0x80, 0x0a, 0x00, 0x00, 0x40, 0x0b, 0x00, 0x00,
-    0x40, 0x0b, 0x00, 0x00, 0x10, 0x0d, 0x00, 0x00, 0x10, 0x0d, 0x00, 0x00,
-    0x80, 0x0d, 0x00, 0x00, 0x80, 0x0d, 0x00, 0x00, 0x40, 0x0e, 0x00, 0x00,
-    0x40, 0x0e, 0x00, 0x00, 0x10, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xf0, 0x40, 0x2d, 0xe9,
-    0x00, 0xc0, 0xa0, 0xe1, 0x01, 0x60, 0xa0, 0xe1, 0x02, 0x70, 0xa0, 0xe1,
-    0x00, 0x00, 0x0f, 0xe1, 0xdf, 0x10, 0xa0, 0xe3, 0x01, 0xf0, 0x29, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x01, 0x40, 0x2d, 0xe9, 0x0d, 0x40, 0xa0, 0xe1,
-    0x04, 0x50, 0x33, 0xe5, 0x04, 0x50, 0x2d, 0xe5, 0x03, 0x00, 0x57, 0xe1,
-    0xfb, 0xff, 0xff, 0x1a, 0x0c, 0x00, 0xa0, 0xe1, 0x06, 0x10, 0xa0, 0xe1,
-    0x0f, 0xe0, 0xa0, 0xe1, 0x0d, 0xf0, 0xa0, 0xe1, 0x00, 0xc0, 0xa0, 0xe1,
-    0x04, 0xd0, 0xa0, 0xe1, 0x02, 0x40, 0xbd, 0xe8, 0x01, 0xf0, 0x29, 0xe1,
-    0x0c, 0x00, 0xa0, 0xe1, 0xf0, 0x40, 0xbd, 0xe8, 0x1e, 0xff, 0x2f, 0xe1,
-    0x02, 0x33, 0xa0, 0xe3, 0xff, 0x20, 0xa0, 0xe3, 0x00, 0x00, 0x93, 0xe5,
-    0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x90, 0x10, 0xa0, 0xe3,
-    0xb0, 0x10, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x10, 0x93, 0xe5,
-    0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x01, 0x00, 0x50, 0xe1,
-    0x01, 0x00, 0x00, 0x1a, 0x00, 0x00, 0xa0, 0xe3, 0x1e, 0xff, 0x2f, 0xe1,
-    0x42, 0x10, 0xa0, 0xe3, 0xb8, 0x15, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x96, 0x00, 0xa0, 0xe3, 0xb2, 0x10, 0xd3, 0xe5, 0xb8, 0x05, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x00, 0x00, 0x51, 0xe1, 0x0c, 0x00, 0x00, 0x0a, 0x00, 0x30, 0xa0, 0xe3,
-    0x08, 0xd0, 0x4d, 0xe2, 0x04, 0x30, 0x8d, 0xe5, 0x04, 0x30, 0x9d, 0xe5,
-    0x01, 0x0b, 0x53, 0xe3, 0x02, 0x00, 0x00, 0xba, 0x00, 0x00, 0xa0, 0xe3,
-    0x08, 0xd0, 0x8d, 0xe2, 0x1e, 0xff, 0x2f, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x04, 0x30, 0x9d, 0xe5, 0x01, 0x30, 0x83, 0xe2, 0xf4, 0xff, 0xff, 0xea,
-    0x01, 0x00, 0xa0, 0xe3, 0x1e, 0xff, 0x2f, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x01, 0x10, 0x80, 0xe0,
-    0xff, 0x24, 0xc1, 0xe3, 0xfe, 0x28, 0xc2, 0xe3, 0x30, 0x40, 0x2d, 0xe9,
-    0x00, 0x00, 0x52, 0xe3, 0x60, 0xe0, 0xa0, 0xe3, 0xff, 0x20, 0xa0, 0xe3,
-    0xd0, 0xc0, 0xa0, 0xe3, 0x20, 0x40, 0xa0, 0xe3, 0xa1, 0x38, 0xa0, 0xe1,
-    0x83, 0x38, 0xa0, 0xe1, 0x02, 0x18, 0x83, 0x12, 0x01, 0x00, 0x50, 0xe1,
-    0x01, 0x00, 0x00, 0x3a, 0x30, 0x40, 0xbd, 0xe8, 0x1e, 0xff, 0x2f, 0xe1,
-    0x01, 0x30, 0xc0, 0xe3, 0x02, 0x33, 0x83, 0xe2, 0xb0, 0x20, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xe0, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xb0, 0xc0, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x40, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xc0, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x50, 0xd3, 0xe1, 0x80, 0x00, 0x55, 0xe3,
-    0xfb, 0xff, 0xff, 0x1a, 0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x02, 0x08, 0x80, 0xe2, 0xe7, 0xff, 0xff, 0xea, 0xf7, 0x4f, 0x2d, 0xe9,
-    0x01, 0x90, 0xa0, 0xe3, 0x09, 0x74, 0xa0, 0xe3, 0x00, 0x30, 0xa0, 0xe3,
-    0x02, 0xa3, 0xa0, 0xe3, 0xff, 0x6e, 0xc1, 0xe3, 0x01, 0x1a, 0xa0, 0xe1,
-    0x21, 0x1a, 0xa0, 0xe1, 0x51, 0xc9, 0xa0, 0xe1, 0x01, 0xc0, 0x4c, 0xe2,
-    0xb0, 0x30, 0xc7, 0xe1, 0x01, 0x20, 0xc0, 0xe3, 0x04, 0xc0, 0x8d, 0xe5,
-    0x0f, 0x60, 0xc6, 0xe3, 0x02, 0x23, 0x82, 0xe2, 0x06, 0x00, 0x53, 0xe1,
-    0x03, 0x40, 0xa0, 0xe1, 0x02, 0x00, 0x00, 0x3a, 0x0c, 0xd0, 0x8d, 0xe2,
-    0xf0, 0x4f, 0xbd, 0xe8, 0x1e, 0xff, 0x2f, 0xe1, 0x01, 0x08, 0x53, 0xe3,
-    0xb0, 0x90, 0xc7, 0x01, 0x00, 0x00, 0x51, 0xe3, 0x00, 0xc0, 0x83, 0xe0,
-    0x28, 0x00, 0x00, 0x0a, 0xe8, 0xe0, 0xa0, 0xe3, 0xb0, 0xe0, 0xc2, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xe0, 0xd2, 0xe1,
-    0x80, 0x00, 0x5e, 0xe3, 0xfb, 0xff, 0xff, 0x1a, 0x04, 0xe0, 0x9d, 0xe5,
-    0xb0, 0xe0, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x50, 0xa0, 0xe3,
-    0x01, 0x08, 0x54, 0xe3, 0xb0, 0x90, 0xc7, 0x01, 0x0e, 0x84, 0x84, 0xe2,
-    0x01, 0xb0, 0xd8, 0xe5, 0x0c, 0xe0, 0x85, 0xe0, 0x00, 0x80, 0xd8, 0xe5,
-    0x01, 0xe0, 0xce, 0xe3, 0x02, 0xe3, 0x8e, 0xe2, 0x0b, 0x84, 0x88, 0xe1,
-    0xb0, 0x80, 0xce, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x02, 0x50, 0x85, 0xe2,
-    0x05, 0x00, 0x51, 0xe1, 0x02, 0x40, 0x84, 0xe2, 0xf0, 0xff, 0xff, 0xca,
-    0xd0, 0xc0, 0xa0, 0xe3, 0xb0, 0xc0, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x70, 0xc0, 0xa0, 0xe3, 0xb0, 0xc0, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x01, 0x30, 0x83, 0xe0, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xc0, 0xd2, 0xe1,
-    0x80, 0x00, 0x5c, 0xe3, 0xfb, 0xff, 0xff, 0x1a, 0xff, 0xc0, 0xa0, 0xe3,
-    0xb0, 0xc0, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xcb, 0xff, 0xff, 0xea,
-    0x70, 0xe0, 0xa0, 0xe3, 0xb0, 0xe0, 0xca, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x10, 0xe0, 0xa0, 0xe3, 0xb0, 0xe0, 0xca, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x0e, 0xe4, 0x83, 0xe2, 0x01, 0x40, 0xde, 0xe5, 0x00, 0xe0, 0xde, 0xe5,
-    0x01, 0xc0, 0xcc, 0xe3, 0x02, 0xc3, 0x8c, 0xe2, 0x04, 0xe4, 0x8e, 0xe1,
-    0xb0, 0xe0, 0xcc, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x02, 0x30, 0x83, 0xe2,
-    0xe7, 0xff, 0xff, 0xea, 0x00, 0x00, 0xa0, 0xe1, 0x02, 0x33, 0xa0, 0xe3,
-    0xf0, 0x20, 0xa0, 0xe3, 0x04, 0xe0, 0x2d, 0xe5, 0x00, 0x00, 0x93, 0xe5,
-    0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xa9, 0xc0, 0xa0, 0xe3,
-    0x3c, 0x10, 0x9f, 0xe5, 0xba, 0xca, 0xc1, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x56, 0xe0, 0xa0, 0xe3, 0x30, 0xc0, 0x9f, 0xe5, 0xb4, 0xe5, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x90, 0xc0, 0xa0, 0xe3, 0xba, 0xca, 0xc1, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x10, 0x93, 0xe5, 0xb0, 0x20, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x01, 0x00, 0x50, 0xe0, 0x01, 0x00, 0xa0, 0x13,
-    0x04, 0xe0, 0x9d, 0xe4, 0x1e, 0xff, 0x2f, 0xe1, 0x00, 0x0a, 0x00, 0x08,
-    0x00, 0x05, 0x00, 0x08, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xf0, 0x43, 0x2d, 0xe9, 0xf0, 0xe0, 0xa0, 0xe3, 0xa9, 0x40, 0xa0, 0xe3,
-    0x56, 0x60, 0xa0, 0xe3, 0x80, 0x70, 0xa0, 0xe3, 0x30, 0x80, 0xa0, 0xe3,
-    0x01, 0x10, 0x80, 0xe0, 0x84, 0xc0, 0x9f, 0xe5, 0x21, 0x38, 0xa0, 0xe1,
-    0x03, 0x38, 0xa0, 0xe1, 0x0c, 0x00, 0x11, 0xe1, 0x78, 0x20, 0x9f, 0xe5,
-    0x78, 0x50, 0x9f, 0xe5, 0x01, 0x18, 0x83, 0x12, 0x01, 0x00, 0x50, 0xe1,
-    0x01, 0x00, 0x00, 0x3a, 0xf0, 0x43, 0xbd, 0xe8, 0x1e, 0xff, 0x2f, 0xe1,
-    0x01, 0x30, 0xc0, 0xe3, 0x02, 0x33, 0x83, 0xe2, 0xb0, 0xe0, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xba, 0x4a, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xb4, 0x65, 0xc5, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xba, 0x7a, 0xc2, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xba, 0x4a, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xb4, 0x65, 0xc5, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x80, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x90, 0xd3, 0xe1,
-    0x0c, 0x00, 0x59, 0xe1, 0xfb, 0xff, 0xff, 0x1a, 0xb0, 0xe0, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x01, 0x08, 0x80, 0xe2, 0xe3, 0xff, 0xff, 0xea,
-    0xff, 0xff, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x08, 0x00, 0x05, 0x00, 0x08,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xf7, 0x4f, 0x2d, 0xe9, 0x00, 0x30, 0xa0, 0xe3, 0x09, 0x74, 0xa0, 0xe3,
-    0xff, 0x6e, 0xc1, 0xe3, 0x01, 0x1a, 0xa0, 0xe1, 0x21, 0x1a, 0xa0, 0xe1,
-    0xc1, 0x20, 0xa0, 0xe1, 0x01, 0x20, 0x42, 0xe2, 0xb0, 0x30, 0xc7, 0xe1,
-    0x01, 0xc0, 0xc0, 0xe3, 0x98, 0x81, 0x9f, 0xe5, 0x98, 0x91, 0x9f, 0xe5,
-    0x04, 0x20, 0x8d, 0xe5, 0x0f, 0x60, 0xc6, 0xe3, 0x02, 0xc3, 0x8c, 0xe2,
-    0x06, 0x00, 0x53, 0xe1, 0x07, 0x00, 0x00, 0x3a, 0xf0, 0x30, 0xa0, 0xe3,
-    0x01, 0x00, 0xc0, 0xe3, 0x02, 0x03, 0x80, 0xe2, 0xb0, 0x30, 0xc0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x0c, 0xd0, 0x8d, 0xe2, 0xf0, 0x4f, 0xbd, 0xe8,
-    0x1e, 0xff, 0x2f, 0xe1, 0x01, 0x08, 0x53, 0xe3, 0x01, 0x20, 0xa0, 0x03,
-    0xb0, 0x20, 0xc7, 0x01, 0x00, 0x00, 0x51, 0xe3, 0x00, 0x20, 0x83, 0xe0,
-    0x36, 0x00, 0x00, 0x0a, 0xa9, 0xe0, 0xa0, 0xe3, 0xba, 0xea, 0xc8, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x56, 0xe0, 0xa0, 0xe3, 0xb4, 0xe5, 0xc9, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x26, 0xe0, 0xa0, 0xe3, 0xb0, 0xe0, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x04, 0xe0, 0x9d, 0xe5, 0xb0, 0xe0, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x40, 0xa0, 0xe3, 0x03, 0x50, 0xa0, 0xe1,
-    0x01, 0x08, 0x55, 0xe3, 0x01, 0xe0, 0xa0, 0x03, 0xb0, 0xe0, 0xc7, 0x01,
-    0x0e, 0xa4, 0x85, 0xe2, 0x01, 0xb0, 0xda, 0xe5, 0x02, 0xe0, 0x84, 0xe0,
-    0x00, 0xa0, 0xda, 0xe5, 0x01, 0xe0, 0xce, 0xe3, 0x02, 0xe3, 0x8e, 0xe2,
-    0x0b, 0xa4, 0x8a, 0xe1, 0xb0, 0xa0, 0xce, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x02, 0x40, 0x84, 0xe2, 0x04, 0x00, 0x51, 0xe1, 0x02, 0x50, 0x85, 0xe2,
-    0xef, 0xff, 0xff, 0xca, 0x2a, 0xe0, 0xa0, 0xe3, 0xb0, 0xe0, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x02, 0xe0, 0x41, 0xe2, 0x01, 0x30, 0x83, 0xe0,
-    0x02, 0x20, 0x8e, 0xe0, 0xdf, 0xe6, 0x83, 0xe2, 0xff, 0xea, 0x8e, 0xe2,
-    0xff, 0x4f, 0xde, 0xe5, 0xfe, 0xef, 0xde, 0xe5, 0x01, 0x20, 0xc2, 0xe3,
-    0x04, 0xe4, 0x8e, 0xe1, 0x02, 0x23, 0x82, 0xe2, 0xb0, 0x40, 0xd2, 0xe1,
-    0x04, 0x50, 0x2e, 0xe0, 0x80, 0x00, 0x15, 0xe3, 0xc0, 0xff, 0xff, 0x0a,
-    0x20, 0x00, 0x14, 0xe3, 0x03, 0x00, 0x00, 0x0a, 0xf0, 0x20, 0xa0, 0xe3,
-    0xb0, 0x20, 0xcc, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xba, 0xff, 0xff, 0xea,
-    0x00, 0x00, 0xa0, 0xe1, 0xf3, 0xff, 0xff, 0xea, 0xa9, 0x40, 0xa0, 0xe3,
-    0x0e, 0xe4, 0x83, 0xe2, 0x01, 0x20, 0xc2, 0xe3, 0x01, 0xe0, 0x8e, 0xe2,
-    0x0e, 0x54, 0x83, 0xe2, 0x02, 0x23, 0x82, 0xe2, 0xba, 0x4a, 0xc8, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x56, 0x40, 0xa0, 0xe3, 0xb4, 0x45, 0xc9, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xa0, 0x40, 0xa0, 0xe3, 0xba, 0x4a, 0xc8, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0xa0, 0xde, 0xe5, 0x00, 0x40, 0xd5, 0xe5,
-    0x0a, 0x44, 0x84, 0xe1, 0xb0, 0x40, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0xb0, 0xde, 0xe5, 0x00, 0x40, 0xd5, 0xe5,
-    0xb0, 0xa0, 0xd2, 0xe1, 0x0b, 0x44, 0x84, 0xe1, 0x04, 0x00, 0x5a, 0xe1,
-    0xf8, 0xff, 0xff, 0x1a, 0x02, 0x30, 0x83, 0xe2, 0x9c, 0xff, 0xff, 0xea,
-    0x00, 0x0a, 0x00, 0x08, 0x00, 0x05, 0x00, 0x08, 0x02, 0x33, 0xa0, 0xe3,
-    0xf0, 0x20, 0xa0, 0xe3, 0x04, 0xe0, 0x2d, 0xe5, 0x00, 0x00, 0x93, 0xe5,
-    0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xaa, 0xc0, 0xa0, 0xe3,
-    0x3c, 0x10, 0x9f, 0xe5, 0xba, 0xca, 0xc1, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x55, 0xe0, 0xa0, 0xe3, 0x30, 0xc0, 0x9f, 0xe5, 0xb4, 0xe5, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x90, 0xc0, 0xa0, 0xe3, 0xba, 0xca, 0xc1, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x10, 0x93, 0xe5, 0xb0, 0x20, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x01, 0x00, 0x50, 0xe0, 0x01, 0x00, 0xa0, 0x13,
-    0x04, 0xe0, 0x9d, 0xe4, 0x1e, 0xff, 0x2f, 0xe1, 0x00, 0x0a, 0x00, 0x08,
-    0x00, 0x05, 0x00, 0x08, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xf0, 0x43, 0x2d, 0xe9, 0xf0, 0xe0, 0xa0, 0xe3, 0xaa, 0x40, 0xa0, 0xe3,
-    0x55, 0x60, 0xa0, 0xe3, 0x80, 0x70, 0xa0, 0xe3, 0x30, 0x80, 0xa0, 0xe3,
-    0x01, 0x10, 0x80, 0xe0, 0x84, 0xc0, 0x9f, 0xe5, 0x21, 0x38, 0xa0, 0xe1,
-    0x03, 0x38, 0xa0, 0xe1, 0x0c, 0x00, 0x11, 0xe1, 0x78, 0x20, 0x9f, 0xe5,
-    0x78, 0x50, 0x9f, 0xe5, 0x01, 0x18, 0x83, 0x12, 0x01, 0x00, 0x50, 0xe1,
-    0x01, 0x00, 0x00, 0x3a, 0xf0, 0x43, 0xbd, 0xe8, 0x1e, 0xff, 0x2f, 0xe1,
-    0x01, 0x30, 0xc0, 0xe3, 0x02, 0x33, 0x83, 0xe2, 0xb0, 0xe0, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xba, 0x4a, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xb4, 0x65, 0xc5, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xba, 0x7a, 0xc2, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xba, 0x4a, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xb4, 0x65, 0xc5, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x80, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x90, 0xd3, 0xe1,
-    0x0c, 0x00, 0x59, 0xe1, 0xfb, 0xff, 0xff, 0x1a, 0xb0, 0xe0, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x01, 0x08, 0x80, 0xe2, 0xe3, 0xff, 0xff, 0xea,
-    0xff, 0xff, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x08, 0x00, 0x05, 0x00, 0x08,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xf7, 0x4f, 0x2d, 0xe9, 0x00, 0x30, 0xa0, 0xe3, 0x09, 0x74, 0xa0, 0xe3,
-    0xff, 0x6e, 0xc1, 0xe3, 0x01, 0x1a, 0xa0, 0xe1, 0x21, 0x1a, 0xa0, 0xe1,
-    0xc1, 0x20, 0xa0, 0xe1, 0x01, 0x20, 0x42, 0xe2, 0xb0, 0x30, 0xc7, 0xe1,
-    0x01, 0xc0, 0xc0, 0xe3, 0x98, 0x81, 0x9f, 0xe5, 0x98, 0x91, 0x9f, 0xe5,
-    0x04, 0x20, 0x8d, 0xe5, 0x0f, 0x60, 0xc6, 0xe3, 0x02, 0xc3, 0x8c, 0xe2,
-    0x06, 0x00, 0x53, 0xe1, 0x07, 0x00, 0x00, 0x3a, 0xf0, 0x30, 0xa0, 0xe3,
-    0x01, 0x00, 0xc0, 0xe3, 0x02, 0x03, 0x80, 0xe2, 0xb0, 0x30, 0xc0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x0c, 0xd0, 0x8d, 0xe2, 0xf0, 0x4f, 0xbd, 0xe8,
-    0x1e, 0xff, 0x2f, 0xe1, 0x01, 0x08, 0x53, 0xe3, 0x01, 0x20, 0xa0, 0x03,
-    0xb0, 0x20, 0xc7, 0x01, 0x00, 0x00, 0x51, 0xe3, 0x00, 0x20, 0x83, 0xe0,
-    0x36, 0x00, 0x00, 0x0a, 0xaa, 0xe0, 0xa0, 0xe3, 0xba, 0xea, 0xc8, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x55, 0xe0, 0xa0, 0xe3, 0xb4, 0xe5, 0xc9, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x25, 0xe0, 0xa0, 0xe3, 0xb0, 0xe0, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x04, 0xe0, 0x9d, 0xe5, 0xb0, 0xe0, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x40, 0xa0, 0xe3, 0x03, 0x50, 0xa0, 0xe1,
-    0x01, 0x08, 0x55, 0xe3, 0x01, 0xe0, 0xa0, 0x03, 0xb0, 0xe0, 0xc7, 0x01,
-    0x0e, 0xa4, 0x85, 0xe2, 0x01, 0xb0, 0xda, 0xe5, 0x02, 0xe0, 0x84, 0xe0,
-    0x00, 0xa0, 0xda, 0xe5, 0x01, 0xe0, 0xce, 0xe3, 0x02, 0xe3, 0x8e, 0xe2,
-    0x0b, 0xa4, 0x8a, 0xe1, 0xb0, 0xa0, 0xce, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x02, 0x40, 0x84, 0xe2, 0x04, 0x00, 0x51, 0xe1, 0x02, 0x50, 0x85, 0xe2,
-    0xef, 0xff, 0xff, 0xca, 0x29, 0xe0, 0xa0, 0xe3, 0xb0, 0xe0, 0xcc, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x02, 0xe0, 0x41, 0xe2, 0x01, 0x30, 0x83, 0xe0,
-    0x02, 0x20, 0x8e, 0xe0, 0xdf, 0xe6, 0x83, 0xe2, 0xff, 0xea, 0x8e, 0xe2,
-    0xff, 0x4f, 0xde, 0xe5, 0xfe, 0xef, 0xde, 0xe5, 0x01, 0x20, 0xc2, 0xe3,
-    0x04, 0xe4, 0x8e, 0xe1, 0x02, 0x23, 0x82, 0xe2, 0xb0, 0x40, 0xd2, 0xe1,
-    0x04, 0x50, 0x2e, 0xe0, 0x80, 0x00, 0x15, 0xe3, 0xc0, 0xff, 0xff, 0x0a,
-    0x20, 0x00, 0x14, 0xe3, 0x03, 0x00, 0x00, 0x0a, 0xf0, 0x20, 0xa0, 0xe3,
-    0xb0, 0x20, 0xcc, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xba, 0xff, 0xff, 0xea,
-    0x00, 0x00, 0xa0, 0xe1, 0xf3, 0xff, 0xff, 0xea, 0xaa, 0x40, 0xa0, 0xe3,
-    0x0e, 0xe4, 0x83, 0xe2, 0x01, 0x20, 0xc2, 0xe3, 0x01, 0xe0, 0x8e, 0xe2,
-    0x0e, 0x54, 0x83, 0xe2, 0x02, 0x23, 0x82, 0xe2, 0xba, 0x4a, 0xc8, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x55, 0x40, 0xa0, 0xe3, 0xb4, 0x45, 0xc9, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xa0, 0x40, 0xa0, 0xe3, 0xba, 0x4a, 0xc8, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0xa0, 0xde, 0xe5, 0x00, 0x40, 0xd5, 0xe5,
-    0x0a, 0x44, 0x84, 0xe1, 0xb0, 0x40, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0xb0, 0xde, 0xe5, 0x00, 0x40, 0xd5, 0xe5,
-    0xb0, 0xa0, 0xd2, 0xe1, 0x0b, 0x44, 0x84, 0xe1, 0x04, 0x00, 0x5a, 0xe1,
-    0xf8, 0xff, 0xff, 0x1a, 0x02, 0x30, 0x83, 0xe2, 0x9c, 0xff, 0xff, 0xea,
-    0x00, 0x0a, 0x00, 0x08, 0x00, 0x05, 0x00, 0x08, 0x02, 0x33, 0xa0, 0xe3,
-    0xff, 0x20, 0xa0, 0xe3, 0x00, 0x00, 0x93, 0xe5, 0xb0, 0x20, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x90, 0x10, 0xa0, 0xe3, 0xb0, 0x10, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x10, 0x93, 0xe5, 0xb0, 0x20, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x01, 0x00, 0x50, 0xe1, 0x01, 0x00, 0x00, 0x1a,
-    0x00, 0x00, 0xa0, 0xe3, 0x1e, 0xff, 0x2f, 0xe1, 0x42, 0x10, 0xa0, 0xe3,
-    0xb8, 0x15, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x96, 0x00, 0xa0, 0xe3,
-    0xb2, 0x10, 0xd3, 0xe5, 0xb8, 0x05, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0x51, 0xe1,
-    0xf2, 0xff, 0xff, 0x0a, 0x00, 0x30, 0xa0, 0xe3, 0x08, 0xd0, 0x4d, 0xe2,
-    0x04, 0x30, 0x8d, 0xe5, 0x04, 0x30, 0x9d, 0xe5, 0x01, 0x0b, 0x53, 0xe3,
-    0x02, 0x00, 0x00, 0xba, 0x01, 0x00, 0xa0, 0xe3, 0x08, 0xd0, 0x8d, 0xe2,
-    0x1e, 0xff, 0x2f, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0x04, 0x30, 0x9d, 0xe5,
-    0x01, 0x30, 0x83, 0xe2, 0xf4, 0xff, 0xff, 0xea, 0x00, 0x00, 0xa0, 0xe1,
-    0x73, 0x40, 0x2d, 0xe9, 0x01, 0x10, 0x80, 0xe0, 0x01, 0x28, 0xa0, 0xe1,
-    0x22, 0x28, 0xa0, 0xe1, 0x00, 0x00, 0x52, 0xe3, 0x60, 0xe0, 0xa0, 0xe3,
-    0xff, 0x20, 0xa0, 0xe3, 0xd0, 0xc0, 0xa0, 0xe3, 0x20, 0x40, 0xa0, 0xe3,
-    0x00, 0x50, 0xa0, 0xe3, 0x21, 0x38, 0xa0, 0xe1, 0x03, 0x38, 0xa0, 0xe1,
-    0x01, 0x18, 0x83, 0x12, 0x01, 0x00, 0x50, 0xe1, 0x02, 0x00, 0x00, 0x3a,
-    0x08, 0xd0, 0x8d, 0xe2, 0x70, 0x40, 0xbd, 0xe8, 0x1e, 0xff, 0x2f, 0xe1,
-    0x01, 0x30, 0xc0, 0xe3, 0x02, 0x33, 0x83, 0xe2, 0xb0, 0x20, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xe0, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xb0, 0xc0, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x40, 0xc3, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xc0, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0x60, 0xd3, 0xe1, 0x80, 0x00, 0x16, 0xe3,
-    0xfb, 0xff, 0xff, 0x0a, 0xb0, 0x20, 0xc3, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x04, 0x50, 0x8d, 0xe5, 0x04, 0x30, 0x9d, 0xe5, 0x01, 0x0b, 0x53, 0xe3,
-    0x01, 0x08, 0x80, 0xa2, 0xe3, 0xff, 0xff, 0xaa, 0x00, 0x00, 0xa0, 0xe1,
-    0x04, 0x30, 0x9d, 0xe5, 0x01, 0x30, 0x83, 0xe2, 0x04, 0x30, 0x8d, 0xe5,
-    0xf6, 0xff, 0xff, 0xea, 0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0xf7, 0x4f, 0x2d, 0xe9, 0x00, 0x30, 0xa0, 0xe3, 0x09, 0x64, 0xa0, 0xe3,
-    0xfe, 0x8c, 0xe0, 0xe3, 0xd0, 0x90, 0xa0, 0xe3, 0xff, 0xa0, 0xa0, 0xe3,
-    0xff, 0x1e, 0xc1, 0xe3, 0xb0, 0x30, 0xc6, 0xe1, 0x0f, 0x10, 0xc1, 0xe3,
-    0x03, 0x00, 0x51, 0xe1, 0x07, 0x00, 0x00, 0x8a, 0x00, 0x30, 0xa0, 0xe3,
-    0x04, 0x30, 0x8d, 0xe5, 0x04, 0x30, 0x9d, 0xe5, 0x01, 0x0b, 0x53, 0xe3,
-    0x2a, 0x00, 0x00, 0xba, 0x0c, 0xd0, 0x8d, 0xe2, 0xf0, 0x4f, 0xbd, 0xe8,
-    0x1e, 0xff, 0x2f, 0xe1, 0x01, 0x08, 0x53, 0xe3, 0x01, 0x20, 0xa0, 0x03,
-    0xea, 0xc0, 0xa0, 0xe3, 0x03, 0x70, 0x80, 0xe0, 0xb0, 0x20, 0xc6, 0x01,
-    0x01, 0x20, 0xc7, 0xe3, 0x02, 0x23, 0x82, 0xe2, 0xb0, 0xc0, 0xc2, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xc0, 0xd2, 0xe1,
-    0x80, 0x00, 0x1c, 0xe3, 0xfb, 0xff, 0xff, 0x0a, 0xb0, 0x80, 0xc2, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x40, 0xa0, 0xe3, 0x0e, 0xc4, 0x83, 0xe2,
-    0x01, 0xc0, 0x8c, 0xe2, 0x00, 0xb0, 0xdc, 0xe5, 0x01, 0x50, 0x5c, 0xe5,
-    0x07, 0xe0, 0x84, 0xe0, 0x01, 0xe0, 0xce, 0xe3, 0x02, 0xe3, 0x8e, 0xe2,
-    0x0b, 0x54, 0x85, 0xe1, 0xb0, 0x50, 0xce, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x02, 0x40, 0x84, 0xe2, 0x01, 0x0b, 0x54, 0xe3, 0x02, 0xc0, 0x8c, 0xe2,
-    0xf3, 0xff, 0xff, 0x1a, 0xb0, 0x90, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x00, 0x00, 0xa0, 0xe1, 0xb0, 0xc0, 0xd2, 0xe1, 0x80, 0x00, 0x1c, 0xe3,
-    0xfb, 0xff, 0xff, 0x0a, 0xb0, 0xa0, 0xc2, 0xe1, 0x00, 0x00, 0xa0, 0xe1,
-    0x01, 0x3b, 0x83, 0xe2, 0xcd, 0xff, 0xff, 0xea, 0x00, 0x00, 0xa0, 0xe1,
-    0x04, 0x30, 0x9d, 0xe5, 0x01, 0x30, 0x83, 0xe2, 0xcc, 0xff, 0xff, 0xea,
-    0x00, 0x00, 0xa0, 0xe1, 0x04, 0xe0, 0x2d, 0xe5, 0xea, 0xef, 0x8f, 0xe2,
-    0x00, 0x00, 0xa0, 0xe1, 0x84, 0x20, 0x4f, 0xe2, 0x12, 0x2c, 0x42, 0xe2,
-    0xdc, 0xc0, 0x4f, 0xe2, 0x0b, 0xcc, 0x4c, 0xe2, 0x18, 0x30, 0xa0, 0xe3,
-    0x93, 0xc0, 0x2c, 0xe0, 0x08, 0x00, 0x8c, 0xe2, 0x09, 0x00, 0x90, 0xe8,
-    0x03, 0x30, 0x82, 0xe0, 0x00, 0x20, 0x82, 0xe0, 0x3e, 0x03, 0x8e, 0xe2,
-    0x04, 0xe0, 0x9d, 0xe4, 0x1a, 0xfd, 0xff, 0xea, 0xdb, 0x3f, 0x8f, 0xe2,
-    0x00, 0x00, 0xa0, 0xe1, 0x00, 0x08, 0x83, 0xe0, 0x3e, 0x03, 0x80, 0xe2,
-    0x1e, 0xff, 0x2f, 0xe1, 0xf0, 0x41, 0x2d, 0xe9, 0x02, 0x40, 0xa0, 0xe1,
-    0xd4, 0x30, 0x4f, 0xe2, 0x12, 0x3c, 0x43, 0xe2, 0xdc, 0x70, 0x4f, 0xe2,
-    0x12, 0x7c, 0x47, 0xe2, 0x34, 0x20, 0x4f, 0xe2, 0x0c, 0x2c, 0x42, 0xe2,
-    0x18, 0xc0, 0xa0, 0xe3, 0x9c, 0x21, 0x21, 0xe0, 0x10, 0x50, 0x91, 0xe5,
-    0x14, 0x20, 0x91, 0xe5, 0x05, 0x50, 0x83, 0xe0, 0x02, 0x60, 0x83, 0xe0,
-    0xeb, 0xff, 0xff, 0xeb, 0x00, 0x00, 0x54, 0xe3, 0x01, 0x48, 0xa0, 0x03,
-    0x01, 0x00, 0x00, 0x0a, 0x02, 0x08, 0x54, 0xe3, 0x02, 0x48, 0xa0, 0x23,
-    0x11, 0x30, 0xd7, 0xe5, 0x10, 0x10, 0xd7, 0xe5, 0x03, 0x14, 0x81, 0xe1,
-    0x12, 0x30, 0xd7, 0xe5, 0x03, 0x18, 0x81, 0xe1, 0x13, 0x30, 0xd7, 0xe5,
-    0x03, 0x1c, 0x81, 0xe1, 0x05, 0x20, 0xa0, 0xe1, 0x06, 0x30, 0xa0, 0xe1,
-    0x04, 0x10, 0x81, 0xe1, 0xf0, 0x41, 0xbd, 0xe8, 0xf5, 0xfc, 0xff, 0xea,
-    0x07, 0x00, 0x50, 0xe3, 0x1e, 0xff, 0x2f, 0xc1, 0x2d, 0x3e, 0x8f, 0xe2,
-    0x00, 0x00, 0xa0, 0xe1, 0x02, 0x08, 0x51, 0xe3, 0x02, 0x18, 0xa0, 0x23,
-    0x00, 0x08, 0x83, 0xe0, 0x23, 0xfc, 0xff, 0xea, 0xae, 0x2f, 0x8f, 0xe2,
-    0x00, 0x00, 0xa0, 0xe1, 0x6f, 0x2a, 0x82, 0xe2, 0xff, 0x2e, 0x82, 0xe2,
-    0x64, 0x10, 0x4f, 0xe2, 0x13, 0x1c, 0x41, 0xe2, 0x00, 0x30, 0xa0, 0xe3,
-    0x03, 0x00, 0xd2, 0xe7, 0x03, 0xc0, 0xd1, 0xe7, 0x00, 0x00, 0x5c, 0xe1,
-    0x04, 0x00, 0x00, 0x1a, 0x01, 0x30, 0x83, 0xe2, 0x10, 0x00, 0x53, 0xe3,
-    0xf8, 0xff, 0xff, 0x1a, 0x01, 0x00, 0xa0, 0xe3, 0x1e, 0xff, 0x2f, 0xe1,
-    0x00, 0x00, 0xa0, 0xe3, 0x1e, 0xff, 0x2f, 0xe1, 0x70, 0x40, 0x2d, 0xe9,
-    0x00, 0x50, 0xa0, 0xe1, 0x00, 0x40, 0xa0, 0xe3, 0x48, 0x60, 0x9f, 0xe5,
-    0x48, 0x30, 0x9f, 0xe5, 0x04, 0x08, 0x86, 0xe0, 0x03, 0x10, 0x40, 0xe0,
-    0x00, 0x10, 0xd1, 0xe5, 0x3c, 0x20, 0x9f, 0xe5, 0xff, 0x10, 0x01, 0xe2,
-    0x03, 0x20, 0x42, 0xe0, 0x01, 0x30, 0x53, 0xe2, 0x00, 0x10, 0xc2, 0xe5,
-    0xf7, 0xff, 0xff, 0x2a, 0x04, 0x00, 0xa0, 0xe1, 0x00, 0x20, 0xa0, 0xe3,
-    0x05, 0x10, 0xa0, 0xe1, 0x01, 0x40, 0x84, 0xe2, 0xb2, 0xff, 0xff, 0xeb,
-    0x04, 0x00, 0x54, 0xe3, 0xee, 0xff, 0xff, 0x1a, 0x70, 0x40, 0xbd, 0xe8,
-    0x1e, 0xff, 0x2f, 0xe1, 0xff, 0xff, 0x00, 0x02, 0xff, 0xff, 0x00, 0x00,
-    0xff, 0xff, 0x00, 0x0e, 0x03, 0x34, 0xa0, 0xe3, 0x00, 0x10, 0xa0, 0xe1,
-    0x44, 0x00, 0x9f, 0xe5, 0x0b, 0xc4, 0x83, 0xe2, 0x01, 0x20, 0xd3, 0xe4,
-    0xff, 0x20, 0x02, 0xe2, 0x00, 0x00, 0x53, 0xe1, 0x00, 0x20, 0xcc, 0xe5,
-    0xf9, 0xff, 0xff, 0x1a, 0x2c, 0x30, 0x9f, 0xe5, 0x2c, 0x00, 0x9f, 0xe5,
-    0x7f, 0x26, 0x83, 0xe2, 0x01, 0xc0, 0xd3, 0xe4, 0x3e, 0x29, 0x82, 0xe2,
-    0xff, 0xc0, 0x0c, 0xe2, 0x00, 0x00, 0x53, 0xe1, 0x00, 0xc0, 0xc2, 0xe5,
-    0xf8, 0xff, 0xff, 0x1a, 0x00, 0x20, 0xa0, 0xe3, 0x05, 0x00, 0xa0, 0xe3,
-    0x96, 0xff, 0xff, 0xea, 0x00, 0x80, 0x00, 0x03, 0x00, 0x00, 0x01, 0x06,
-    0x00, 0x80, 0x01, 0x06, 0x06, 0x34, 0xa0, 0xe3, 0x00, 0x10, 0xa0, 0xe1,
-    0x20, 0x00, 0x9f, 0xe5, 0x02, 0xc3, 0x83, 0xe2, 0x01, 0x20, 0xd3, 0xe4,
-    0xff, 0x20, 0x02, 0xe2, 0x00, 0x00, 0x53, 0xe1, 0x00, 0x20, 0xcc, 0xe5,
-    0xf9, 0xff, 0xff, 0x1a, 0x00, 0x20, 0xa0, 0xe3, 0x04, 0x00, 0xa0, 0xe3,
-    0x87, 0xff, 0xff, 0xea, 0x00, 0x00, 0x01, 0x06, 0x05, 0x34, 0xa0, 0xe3,
-    0x10, 0x40, 0x2d, 0xe9, 0x38, 0xe1, 0x9f, 0xe5, 0x09, 0x44, 0x83, 0xe2,
-    0x01, 0xc0, 0xd3, 0xe4, 0xff, 0xc0, 0x0c, 0xe2, 0x0e, 0x00, 0x53, 0xe1,
-    0x00, 0xc0, 0xc4, 0xe5, 0xf9, 0xff, 0xff, 0x1a, 0x07, 0x34, 0xa0, 0xe3,
-    0x1c, 0x41, 0x9f, 0xe5, 0x07, 0xc4, 0x83, 0xe2, 0x01, 0xe0, 0xd3, 0xe4,
-    0x02, 0xc9, 0x8c, 0xe2, 0xff, 0xe0, 0x0e, 0xe2, 0x04, 0x00, 0x53, 0xe1,
-    0x00, 0xe0, 0xcc, 0xe5, 0xf8, 0xff, 0xff, 0x1a, 0x00, 0x30, 0xa0, 0xe3,
-    0x03, 0xe0, 0xd2, 0xe7, 0x0e, 0xc4, 0x83, 0xe2, 0x01, 0x30, 0x83, 0xe2,
-    0x21, 0xcb, 0x8c, 0xe2, 0xff, 0xe0, 0x0e, 0xe2, 0x34, 0x00, 0x53, 0xe3,
-    0x00, 0xe0, 0xcc, 0xe5, 0xf7, 0xff, 0xff, 0x1a, 0xdc, 0x30, 0x9f, 0xe5,
-    0xdc, 0xc0, 0x9f, 0xe5, 0x01, 0x20, 0x41, 0xe2, 0x01, 0xe0, 0xf2, 0xe5,
-    0x01, 0xe0, 0xc3, 0xe4, 0x0c, 0x00, 0x53, 0xe1, 0xfb, 0xff, 0xff, 0x1a,
-    0x01, 0x33, 0xa0, 0xe3, 0xc4, 0xe0, 0x9f, 0xe5, 0x0a, 0x24, 0x83, 0xe2,
-    0x01, 0xc0, 0xd3, 0xe4, 0x09, 0x2a, 0x82, 0xe2, 0xff, 0xc0, 0x0c, 0xe2,
-    0x0e, 0x00, 0x53, 0xe1, 0x00, 0xc0, 0xc2, 0xe5, 0xf8, 0xff, 0xff, 0x1a,
-    0xa8, 0xe0, 0x9f, 0xe5, 0x0a, 0x24, 0x83, 0xe2, 0x01, 0xc0, 0xd3, 0xe4,
-    0x09, 0x2a, 0x82, 0xe2, 0xff, 0xc0, 0x0c, 0xe2, 0x0e, 0x00, 0x53, 0xe1,
-    0x00, 0xc0, 0xc2, 0xe5, 0xf8, 0xff, 0xff, 0x1a, 0x09, 0xc0, 0xd1, 0xe5,
-    0x08, 0x20, 0xd1, 0xe5, 0x0c, 0x24, 0x82, 0xe1, 0x80, 0xc0, 0x9f, 0xe5,
-    0xb0, 0x28, 0xcc, 0xe1, 0x0a, 0x20, 0xd1, 0xe5, 0x0b, 0x10, 0xd1, 0xe5,
-    0x01, 0x24, 0x82, 0xe1, 0xb4, 0x28, 0xcc, 0xe1, 0x6c, 0xc0, 0x9f, 0xe5,
-    0x0a, 0x24, 0x83, 0xe2, 0x01, 0x10, 0xd3, 0xe4, 0x09, 0x2a, 0x82, 0xe2,
-    0xff, 0x10, 0x01, 0xe2, 0x0c, 0x00, 0x53, 0xe1, 0x00, 0x10, 0xc2, 0xe5,
-    0xf8, 0xff, 0xff, 0x1a, 0xa8, 0xc0, 0x4f, 0xe2, 0x15, 0xcc, 0x4c, 0xe2,
-    0x00, 0x30, 0xa0, 0xe3, 0x44, 0x20, 0x9f, 0xe5, 0x03, 0x10, 0xdc, 0xe7,
-    0x02, 0x10, 0xc3, 0xe7, 0x01, 0x30, 0x83, 0xe2, 0x10, 0x00, 0x53, 0xe3,
-    0xfa, 0xff, 0xff, 0x1a, 0x00, 0x10, 0xa0, 0xe1, 0x00, 0x20, 0xa0, 0xe3,
-    0x06, 0x00, 0xa0, 0xe3, 0x10, 0x40, 0xbd, 0xe8, 0x34, 0xff, 0xff, 0xea,
-    0x00, 0x04, 0x00, 0x05, 0x00, 0x04, 0x00, 0x07, 0x40, 0x84, 0x00, 0x0e,
-    0x4c, 0x84, 0x00, 0x0e, 0x60, 0x00, 0x00, 0x04, 0x90, 0x00, 0x00, 0x04,
-    0x00, 0x90, 0x00, 0x0e, 0x00, 0x04, 0x00, 0x04, 0xf0, 0xff, 0x00, 0x0e,
-    0x3c, 0x33, 0x20, 0x66, 0x72, 0x6f, 0x6d, 0x20, 0x4d, 0x61, 0x6e, 0x69,
-    0x61, 0x63, 0x24, 0x16
-])
+import hashlib
+from importlib import resources
+
+PAYLOAD_FILE = "payload.bin"
+PAYLOAD_SHA256 = "d3ad93a0bc717abae2358ceb118974ac131f85bf6b598565938eca63fb116c29"
+
+
+def load_payload() -> bytes:
+    data = resources.files(__package__).joinpath(PAYLOAD_FILE).read_bytes()
+    if hashlib.sha256(data).hexdigest() != PAYLOAD_SHA256:
+        raise ImportError(f"{__package__}/{PAYLOAD_FILE} is damaged, hash mismatch.")
+    return data
+
+
+payload_bin = load_payload()
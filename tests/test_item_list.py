@@ -0,0 +1,91 @@
+# coding=utf-8
+# Round trip of the item list codec. Run from the repository root: python -m pytest tests
+import struct
+
+from rom_builder import item_list
+
+
+def make_game(title: str, keys: list[str], save_slot: int = 0) -> dict:
+    return {
+        "title": title,
+        "title_font": 1,
+        "block_offset": len(title),
+        "block_count": 2,
+        "save_type": 2 if save_slot else 0,
+        "save_slot": save_slot,
+        "keys": item_list.encode_keys(keys),
+    }
+
+
+GAMES = [
+    make_game("Visible 1", [], 1),
+    make_game("Hidden L+R", ["l", "R"], 2),
+    make_game("Hidden START", ["START"]),
+    make_game("Visible 2", []),
+    make_game("Hidden L+R 2", ["R", "L"], 3),
+    make_game("A long title which doesn't fit in the menu, so it gets cut", ["A", "B", "UP"]),
+    make_game("日本語のタイトル", ["START"], 4),
+]
+
+
+def legacy_record(game: dict) -> bytes:
+    # How the builder packed a record field by field before the codec.
+    title = game["title"]
+    if len(title) > 0x30:
+        title = title[:0x2F] + "…"
+    return (
+        struct.pack("BB", game["title_font"], len(game["title"]))
+        + struct.pack("<HH", game["block_offset"], game["block_count"])
+        + struct.pack("BB", game["save_type"], game["save_slot"])
+        + struct.pack("<H", game["keys"])
+        + bytes(6)
+        + title.ljust(0x30, "\0").encode("UTF-16LE")
+    )
+
+
+def test_group_by_key():
+    groups = item_list.group_by_key(GAMES)
+    # Visible games first, then one group per key combination in ascending key order, each in list order.
+    assert [[game["title"] for game in group] for group in groups] == [
+        ["Visible 1", "Visible 2"],
+        ["Hidden START", "日本語のタイトル"],
+        ["A long title which doesn't fit in the menu, so it gets cut"],
+        ["Hidden L+R", "Hidden L+R 2"],
+    ]
+    assert [group[0]["keys"] for group in groups] == sorted(group[0]["keys"] for group in groups)
+
+
+def test_group_by_key_without_visible_games():
+    groups = item_list.group_by_key([make_game("Hidden", ["SELECT"])])
+    assert [[game["title"] for game in group] for group in groups] == [[], ["Hidden"]]
+
+
+def test_encode_matches_legacy_records():
+    games = [game for group in item_list.group_by_key(GAMES) for game in group]
+    assert item_list.encode(games) == b"".join(legacy_record(game) for game in games)
+
+
+def test_round_trip():
+    games = [game for group in item_list.group_by_key(GAMES) for game in group]
+    # The menu reads up to the erased flash after the list.
+    data = item_list.encode(games) + b"\xff" * item_list.ITEM_RECORD.size
+    items = item_list.decode(data)
+    assert len(items) == len(games)
+    for item, game in zip(items, games):
+        assert item.title_font == game["title_font"]
+        assert item.title_length == len(game["title"])
+        assert item.block_offset == game["block_offset"]
+        assert item.block_count == game["block_count"]
+        assert item.save_type == game["save_type"]
+        assert item.save_slot == game["save_slot"]
+        assert item.keys == game["keys"]
+        assert item.title == item_list.display_title(game["title"])
+    assert items[-1].key_names == ["R", "L"]
+    assert items[4].key_names == ["A", "B", "UP"]
+    assert items[4].title.endswith("…") and len(items[4].title) == item_list.TITLE_LENGTH
+
+
+def test_decode_stops_at_the_end_of_data():
+    games = GAMES[:2]
+    assert len(item_list.decode(item_list.encode(games))) == 2
+    assert item_list.decode(b"") == []
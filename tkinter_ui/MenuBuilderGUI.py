@@ -3,7 +3,9 @@
 import datetime
 import json
 import os.path
+import queue
 import subprocess
+import threading
 import tkinter
 import tkinter.messagebox
 import tkinter.filedialog
@@ -16,13 +18,13 @@ from PIL import ImageTk, Image
 import ctypes
 import base64
 import platform
-from utils import MenuBuilder
 from resources_src import Resource, I18n, Config
 
 import sv_ttk
 import tkinterdnd2
 
 from rom_builder.cartridge_config import cartridge_types
+from utils import RomImport
 
 # These code are really poor quality.
 # Maybe it would be rebuilt one day.
@@ -364,8 +366,57 @@ class MenuBuilderGUI(tkinterdnd2.TkinterDnD.Tk):
 
         table_game_list.bind("<Double-1>", table_game_list_edit)
 
+        def import_games(paths):
+            # Walked in a thread, tkinter isn't thread safe so the batches are polled and added by the UI.
+            batches = queue.Queue()
+            exclude = [
+                table_game_list.item(item)["values"][1]
+                for item in table_game_list.get_children()
+            ]
+
+            def find_roms():
+                for batch in RomImport.batches(RomImport.find_roms(paths, exclude)):
+                    batches.put(batch)
+                batches.put(None)
+
+            def add_batches():
+                global max_slot
+                while True:
+                    try:
+                        batch = batches.get_nowait()
+                    except queue.Empty:
+                        self.after(50, add_batches)
+                        return
+                    if batch is None:
+                        return
+                    # Imports running at the same time, e.g. the same folder dropped twice, may find the same
+                    # games, and the games they add after the drop aren't excluded, so the list is checked again.
+                    listed = {
+                        RomImport.path_key(table_game_list.item(item)["values"][1])
+                        for item in table_game_list.get_children()
+                    }
+                    # Every game gets a save slot of its own, like the add window suggests.
+                    for rom in batch:
+                        if RomImport.path_key(rom.path) in listed:
+                            continue
+                        listed.add(RomImport.path_key(rom.path))
+                        table_game_list.insert(
+                            "", tkinter.END, values=[rom.name, rom.path, max_slot]
+                        )
+                        max_slot += 1
+                    # One batch at a time, the window handles its events in between.
+                    self.after_idle(add_batches)
+                    return
+
+            threading.Thread(target=find_roms, daemon=True).start()
+            self.after(50, add_batches)
+
         def table_game_list_dnd_add(event):
-            path = event.data
+            paths = self.tk.splitlist(event.data)
+            if RomImport.is_bulk(paths):
+                import_games(paths)
+                return
+            path = paths[0] if paths else ""
 
             def finish_add_rom(window_handler: tkinter.Toplevel, rom_info: GbaStruct):
                 add_game(rom_info)
@@ -599,6 +650,26 @@ class MenuBuilderGUI(tkinterdnd2.TkinterDnD.Tk):
         )
         check_sram_bank.grid(row=5, column=1, padx=5, pady=5, sticky=tkinter.W)
 
+        label_bundle_emulator = tkinter.ttk.Label(
+            frame_settings, text=app_lang.text_bundle_emulator
+        )
+        label_bundle_emulator.grid(row=6, column=0, padx=5, pady=5)
+        check_bundle_emulator_stat = tkinter.BooleanVar(value=False)
+        check_bundle_emulator = tkinter.ttk.Checkbutton(
+            frame_settings, variable=check_bundle_emulator_stat
+        )
+        check_bundle_emulator.grid(row=6, column=1, padx=5, pady=5, sticky=tkinter.W)
+
+        label_tight_rom_size = tkinter.ttk.Label(
+            frame_settings, text=app_lang.text_tight_rom_size
+        )
+        label_tight_rom_size.grid(row=7, column=0, padx=5, pady=5)
+        check_tight_rom_size_stat = tkinter.BooleanVar(value=False)
+        check_tight_rom_size = tkinter.ttk.Checkbutton(
+            frame_settings, variable=check_tight_rom_size_stat
+        )
+        check_tight_rom_size.grid(row=7, column=1, padx=5, pady=5, sticky=tkinter.W)
+
         frame_settings.pack(padx=5, pady=5)
 
         ## label for background image
@@ -664,12 +735,14 @@ class MenuBuilderGUI(tkinterdnd2.TkinterDnD.Tk):
                         combo_cartridge_min_rom_size.current()
                     ]
                 ],
+                "size_policy": "tight" if check_tight_rom_size_stat.get() else "legacy",
             }
             argoptions = {}
             argoptions["split"] = check_cartridge_split_stat.get()
             argoptions["sram_bank_type"] = 1 if check_sram_bank_stat.get() else 0
             argoptions["use_rts"] = check_use_rts_stat.get()
             argoptions["batteryless_autosave"] = check_batteryless_autosave_stat.get()
+            argoptions["bundle_emulator"] = check_bundle_emulator_stat.get()
             if bg_path != "":
                 argoptions["bg"] = bg_path
             path_save = tkinter.filedialog.asksaveasfilename(
@@ -679,6 +752,9 @@ class MenuBuilderGUI(tkinterdnd2.TkinterDnD.Tk):
                 if not path_save.endswith(".gba"):
                     path_save = path_save + ".gba"
                 argoptions["output"] = path_save
+                # Deferred so the patchers and their payloads are only loaded on first build.
+                from utils import MenuBuilder
+
                 msg, err = [], []
                 for result in MenuBuilder.build_start(options, argoptions, game_list):
                     if result.success:
@@ -694,6 +770,8 @@ class MenuBuilderGUI(tkinterdnd2.TkinterDnD.Tk):
                         error_list.append(
                             {"game": error.path, "type": error.type, "msg": error.msg}
                         )
+                        if error.log:
+                            error_list[-1]["log"] = error.log.splitlines()
                     error_log = {
                         "options": options,
                         "argoptions": argoptions,
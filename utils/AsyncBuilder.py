@@ -0,0 +1,82 @@
+# coding=utf-8
+# asyncio interface of the build pipeline. Every step of a build (patching a game, laying out and writing the
+# image) runs in an executor, so the event loop is never blocked, and a semaphore limits how many builds run at
+# the same time. Builds in the same workspace write the same files, so they run one after another, give every build
+# its own Workspace to run them at the same time.
+import asyncio
+import concurrent.futures
+import contextlib
+import os
+import typing
+
+from . import MenuBuilder
+from .MenuBuilder import BuildInfo, BuildTarget
+from .Workspace import Workspace, DEFAULT_WORKSPACE
+from rom_builder import rom_builder
+
+_DONE = object()
+
+
+async def _iterate(generator: typing.Iterator, executor) -> typing.AsyncIterator:
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            item = await loop.run_in_executor(executor, next, generator, _DONE)
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        try:
+            generator.close()
+        except ValueError:
+            pass  # cancelled while a step is still running in the executor, it finishes on its own
+
+
+class AsyncBuilder:
+    def __init__(
+        self,
+        max_builds: int = 2,
+        executor: concurrent.futures.Executor | None = None,
+    ):
+        self._builds = asyncio.Semaphore(max_builds)
+        self._executor = executor
+        self._workspaces: dict[str, asyncio.Lock] = dict()
+
+    @contextlib.asynccontextmanager
+    async def _slot(self, workspace: Workspace):
+        # The workspace first, a build waiting for its workspace doesn't hold a slot another build could use.
+        lock = self._workspaces.setdefault(os.path.realpath(workspace.root), asyncio.Lock())
+        async with lock, self._builds:
+            yield
+
+    async def build_start(
+        self,
+        options: dict,
+        argoptions: dict,
+        gamelist: list,
+        workspace: Workspace = DEFAULT_WORKSPACE,
+    ) -> typing.AsyncIterator[BuildInfo]:
+        async with self._slot(workspace):
+            generator = MenuBuilder.build_start(options, argoptions, gamelist, workspace)
+            async for result in _iterate(generator, self._executor):
+                yield result
+
+    async def build_targets(
+        self,
+        targets: list[BuildTarget],
+        argoptions: dict,
+        gamelist: list,
+        workspace: Workspace = DEFAULT_WORKSPACE,
+    ) -> typing.AsyncIterator[BuildInfo]:
+        async with self._slot(workspace):
+            generator = MenuBuilder.build_targets(targets, argoptions, gamelist, workspace)
+            async for result in _iterate(generator, self._executor):
+                yield result
+
+    async def build(self, args_set: dict) -> rom_builder.FuncModeRet | int:
+        """rom_builder.build of an existing config, set no_wait in args_set. Its relative paths are in the working
+        directory, so it runs one at a time with the builds in DEFAULT_WORKSPACE."""
+        async with self._slot(DEFAULT_WORKSPACE):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, rom_builder.build, args_set)
+
@@ -0,0 +1,251 @@
+# coding=utf-8
+# Batch patcher, applies one patch to every ROM of a directory or glob with a pool of worker processes.
+# A manifest in the output directory records the hashes of every source and output, so ROMs already patched
+# with the same options are skipped on the next run.
+#
+# python -m utils.BatchPatch batteryless roms/ -o patched/
+import argparse
+import concurrent.futures
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import typing
+
+from . import PatchBackend
+
+PATCHES = ("batteryless", "rts", "sram")
+MANIFEST_FILE = ".batch_patch.json"
+
+
+class PatchJob(typing.NamedTuple):
+    rom_path: str
+    out_path: str
+    patch: str
+    options: dict
+    backend: str | None = None  # None: the fastest available
+
+
+class PatchResult(typing.NamedTuple):
+    rom: str
+    output: str
+    status: str  # "patched", "skipped" or "failed"
+    message: str
+    source_sha1: str
+    output_sha1: str | None
+    backend: str | None = None
+
+
+def file_sha1(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
+def find_roms(source: str) -> list[str]:
+    if os.path.isdir(source):
+        source = os.path.join(glob.escape(source), "*.gba")
+    return sorted(
+        (path for path in glob.glob(source) if os.path.isfile(path)), key=str.casefold
+    )
+
+
+def _apply(job: PatchJob, patcher: typing.Callable) -> int:
+    if job.patch == "batteryless":
+        # 0: Done 1: Failed but ok 2: Failed and broken
+        ret = patcher(job.rom_path, job.out_path, job.options["auto_mode"])
+        return 1 if ret == 2 else 0
+    if job.patch == "rts":
+        return patcher(
+            job.rom_path,
+            job.out_path,
+            job.options["wbuf_size"],
+            job.options["sector_size"],
+        )
+    return patcher(job.rom_path, job.out_path, job.options["sram_bank_type"])
+
+
+def run_job(job: PatchJob, source_sha1: str) -> PatchResult:
+    # The patchers talk a lot, keep their output for the report instead of interleaving it.
+    # Only the Python patchers can be captured, the native ones write to the terminal directly.
+    output = io.StringIO()
+    backend = None
+    try:
+        backend, patcher = PatchBackend.resolve(job.patch, job.backend)
+        with contextlib.redirect_stdout(output):
+            ret = _apply(job, patcher)
+    except Exception as e:
+        ret, output = 1, io.StringIO(str(e))
+    lines = [line for line in output.getvalue().splitlines() if line.strip()]
+    message = lines[-1] if lines else ""
+    if ret != 0 or not os.path.exists(job.out_path):
+        return PatchResult(
+            job.rom_path, job.out_path, "failed", message, source_sha1, None, backend
+        )
+    return PatchResult(
+        job.rom_path,
+        job.out_path,
+        "patched",
+        message,
+        source_sha1,
+        file_sha1(job.out_path),
+        backend,
+    )
+
+
+def _load_manifest(out_dir: str) -> dict:
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILE), "r", encoding="UTF-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return dict()
+
+
+def _save_manifest(out_dir: str, manifest: dict) -> None:
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="UTF-8") as f:
+        f.write(json.dumps(obj=manifest, indent=4, ensure_ascii=False))
+
+
+def _is_done(entry: dict | None, job: PatchJob, source_sha1: str) -> bool:
+    return (
+        entry is not None
+        and entry["source_sha1"] == source_sha1
+        and entry["patch"] == job.patch
+        and entry["options"] == job.options
+        and os.path.exists(job.out_path)
+        and file_sha1(job.out_path) == entry["output_sha1"]
+    )
+
+
+def batch_patch(
+    roms: list[str],
+    out_dir: str,
+    patch: str,
+    options: dict,
+    workers: int | None = None,
+    force: bool = False,
+    backend: str | None = None,
+) -> list[PatchResult]:
+    if patch not in PATCHES:
+        raise ValueError(f"Unknown patch “{patch}”.")
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = _load_manifest(out_dir)
+    results: list[PatchResult] = list()
+    pending: dict[concurrent.futures.Future, PatchJob] = dict()
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        for rom_path in roms:
+            out_path = os.path.join(out_dir, os.path.basename(rom_path))
+            job = PatchJob(rom_path, out_path, patch, options, backend)
+            source_sha1 = file_sha1(rom_path)
+            entry = manifest.get(os.path.basename(rom_path))
+            if not force and _is_done(entry, job, source_sha1):
+                results.append(
+                    PatchResult(
+                        rom_path,
+                        job.out_path,
+                        "skipped",
+                        "Already patched.",
+                        source_sha1,
+                        entry["output_sha1"],
+                    )
+                )
+                continue
+            pending[executor.submit(run_job, job, source_sha1)] = job
+        for future in concurrent.futures.as_completed(pending):
+            result = future.result()
+            results.append(result)
+            if result.status == "patched":
+                manifest[os.path.basename(result.rom)] = {
+                    "patch": patch,
+                    "options": options,
+                    "source_sha1": result.source_sha1,
+                    "output_sha1": result.output_sha1,
+                }
+    _save_manifest(out_dir, manifest)
+    return sorted(results, key=lambda r: r.rom.casefold())
+
+
+def print_report(results: list[PatchResult]) -> None:
+    width = max([len(os.path.basename(r.rom)) for r in results] + [3])
+    print(f"{'ROM':<{width}s} | Status  | Backend | Message")
+    print(f"{'-' * width}-+---------+---------+{'-' * 40}")
+    for r in results:
+        print(
+            f"{os.path.basename(r.rom):<{width}s} | {r.status:<7s} | {r.backend or '':<7s} | {r.message}"
+        )
+    counts = {
+        status: sum(r.status == status for r in results)
+        for status in ("patched", "skipped", "failed")
+    }
+    print(
+        f"\n{counts['patched']} patched, {counts['skipped']} skipped, {counts['failed']} failed"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Applies a patch to every GBA ROM of a directory or glob"
+    )
+    parser.add_argument("patch", choices=PATCHES, help="the patch to apply")
+    parser.add_argument("source", help="a directory of .gba files or a glob pattern")
+    parser.add_argument("--output", "-o", required=True, help="the output directory")
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="patches ROMs even if their output is up to date",
+    )
+    parser.add_argument("--json", action="store_true", help="prints the report as JSON")
+    parser.add_argument(
+        "--backend",
+        choices=PatchBackend.BACKENDS,
+        default=None,
+        help="the patcher implementation, the fastest available by default",
+    )
+    parser.add_argument(
+        "--no-autosave",
+        action="store_true",
+        help="batteryless: saves only from the in-game menu instead of automatically",
+    )
+    parser.add_argument(
+        "--wbuf", type=int, default=0, help="rts: write buffer size (0-4095)"
+    )
+    parser.add_argument(
+        "--sector-size",
+        type=lambda x: int(x, 0),
+        default=0x10000,
+        help="rts: flash sector size (0x10000-0x40000)",
+    )
+    parser.add_argument(
+        "--sram-bank-type", type=int, default=0, help="sram: SRAM bank type"
+    )
+    args = parser.parse_args()
+
+    patch_options = {
+        "batteryless": {"auto_mode": not args.no_autosave},
+        "rts": {"wbuf_size": args.wbuf, "sector_size": args.sector_size},
+        "sram": {"sram_bank_type": args.sram_bank_type},
+    }[args.patch]
+    roms = find_roms(args.source)
+    if not roms:
+        print(f"Error: No ROMs found at {args.source}")
+        sys.exit(1)
+    results = batch_patch(
+        roms,
+        args.output,
+        args.patch,
+        patch_options,
+        args.workers,
+        args.force,
+        args.backend,
+    )
+    if args.json:
+        print(json.dumps([r._asdict() for r in results], indent=4, ensure_ascii=False))
+    else:
+        print_report(results)
+    sys.exit(1 if any(r.status == "failed" for r in results) else 0)
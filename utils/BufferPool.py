@@ -0,0 +1,89 @@
+# coding=utf-8
+# Reusable ROM buffers for the patchers. Every worker keeps its 32 MiB arenas and reads ROMs into them with
+# readinto, so patching a whole library doesn't allocate and free two or three ROM sized buffers per ROM.
+# The ROM is the first `size` bytes of the arena, everything after it is stale data of earlier ROMs.
+import contextlib
+import os
+import threading
+
+ARENA_SIZE = 0x2000000  # The whole GBA ROM address space.
+FILL_BLOCK_SIZE = 0x40000
+
+
+class RomBuffer:
+    def __init__(self, capacity: int = ARENA_SIZE):
+        self.arena = bytearray(capacity)
+        self.size = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.arena)
+
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self.arena)[: self.size]
+
+    def read(self, path: str) -> int:
+        file_size = os.path.getsize(path)
+        if file_size > self.capacity:
+            raise ValueError(f"{path} is larger than 0x{self.capacity:X} bytes.")
+        with open(path, "rb") as f, memoryview(self.arena) as view:
+            self.size = f.readinto(view[:file_size])
+        return self.size
+
+    def resize(self, size: int, fill: int = 0xFF) -> None:
+        """Grows the ROM, the new bytes are set to fill (erased flash by default)."""
+        if size > self.capacity:
+            raise ValueError(f"0x{size:X} bytes don't fit in the buffer.")
+        block = bytes([fill]) * min(FILL_BLOCK_SIZE, max(size - self.size, 0))
+        with memoryview(self.arena) as view:
+            for pos in range(self.size, size, FILL_BLOCK_SIZE):
+                length = min(FILL_BLOCK_SIZE, size - pos)
+                view[pos : pos + length] = block[:length]
+        self.size = size
+
+    def write(self, path: str) -> None:
+        with open(path, "wb") as f, self.view as view:
+            f.write(view)
+
+
+class BufferPool:
+    def __init__(self, capacity: int = ARENA_SIZE):
+        self.capacity = capacity
+        self.allocations = 0  # arenas created, for the benchmark
+        self._free: list[RomBuffer] = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def acquire(self):
+        with self._lock:
+            if self._free:
+                buffer = self._free.pop()
+            else:
+                buffer = None
+                self.allocations += 1
+        if buffer is None:
+            buffer = RomBuffer(self.capacity)
+        buffer.size = 0
+        try:
+            yield buffer
+        finally:
+            with self._lock:
+                self._free.append(buffer)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._free.clear()
+
+
+# One pool per process, so every worker of a process pool has its own arenas.
+pool = BufferPool()
+
+
+def find_aligned(data, needle: bytes, stride: int, start: int, end: int) -> int:
+    """First match at start + n * stride, like scanning with a stride but using bytearray.find. -1 if none."""
+    pos = data.find(needle, start, end)
+    while pos != -1 and (pos - start) % stride:
+        pos = data.find(needle, pos + 1, end)
+    return pos
+
@@ -4,6 +4,8 @@ import os
 import struct
 import zlib
 
+from . import PocketNESDB
+
 
 def build_goomba(
     rom_path: str | list[str], out_path: str, goomba_path="./emulator/jagoombacolor.gba"
@@ -34,9 +36,8 @@ def build_pocketnes(
     build_rom += b"\0" * (
         (256 - ((len(build_rom) + size_emu_header + size_nes_header) % 256)) % 256
     )
-    romdata_db_file = open(romdata_db, "r")
     for rom_path in rom_path_list:
-        title = ""
+        title = b""
         flag = 0
         deffollow = 0
         with open(rom_path, "rb") as rom:
@@ -44,22 +45,12 @@ def build_pocketnes(
             romdata_no_header = (
                 romdata[size_nes_header:] if romdata[0:4] == b"NES\x1a" else romdata
             )  # some rom dump doesn't contain a header
-            rom_crc = str(hex(zlib.crc32(romdata_no_header)))[2:]
-            in_db = False
-            for line in romdata_db_file.readline():
-                if "|" in line:
-                    record = line.split("|")
-                    if rom_crc == record[0]:
-                        in_db = True
-                        title = record[1]
-                        if len(record) > 2:
-                            if record[2] != "\n":
-                                flag = int(record[2].split(" ")[0])
-                            if len(record) > 3:
-                                if record[3] != "\n":
-                                    deffollow = int(record[3].split(" ")[0])
-                    break
-            if not in_db:
+            record = PocketNESDB.lookup(romdata_db, zlib.crc32(romdata_no_header))
+            if record is not None:
+                title = record.title
+                flag = record.flags
+                deffollow = record.follow
+            else:
                 title_text = os.path.splitext(os.path.basename(rom_path))[0]
                 title = title_text.encode()
                 if (
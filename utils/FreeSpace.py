@@ -0,0 +1,87 @@
+# coding=utf-8
+# Free space of a ROM: the runs of 0x00 and 0xFF bytes, found once per ROM with bytes.find, the end of every run is
+# found with startswith (a memcmp) against blocks of the fill byte. Payload placement then bisects the runs instead
+# of counting the bytes of every candidate.
+import bisect
+import typing
+
+MIN_RUN = 0x1000  # shorter runs aren't indexed, no payload fits in them
+FILLS = (0x00, 0xFF)
+_BLOCKS = {fill: [bytes([fill]) * (1 << bits) for bits in range(18, -1, -1)] for fill in FILLS}  # 256 KiB to 1 byte
+
+
+class Extent(typing.NamedTuple):
+    start: int
+    end: int
+    fill: int
+
+
+class FreeSpaceIndex:
+    def __init__(self, data, size: int | None = None, min_run: int = MIN_RUN):
+        """Indexes data[:size], data can be any bytes-like object."""
+        self.size = len(data) if size is None else size
+        self.min_run = min_run
+        extents = []
+        for fill in FILLS:
+            block = bytes([fill]) * min_run
+            pos = data.find(block, 0, self.size)
+            while pos != -1:
+                end = self._run_end(data, pos + min_run, fill)
+                extents.append(Extent(pos, end, fill))
+                pos = data.find(block, end, self.size)
+        # Runs of different fills never overlap, so the starts are sorted as well as the ends.
+        self.extents = sorted(extents)
+        self._starts = [extent.start for extent in self.extents]
+
+    @classmethod
+    def from_extents(cls, extents, size: int, min_run: int = MIN_RUN) -> "FreeSpaceIndex":
+        """The index of earlier extents (sorted, e.g. FreeSpaceIndex.extents), without the data."""
+        index = cls.__new__(cls)
+        index.size = size
+        index.min_run = min_run
+        index.extents = list(extents)
+        index._starts = [extent.start for extent in index.extents]
+        return index
+
+    def _run_end(self, data, pos: int, fill: int) -> int:
+        blocks = _BLOCKS[fill]
+        while data.startswith(blocks[0], pos, self.size):
+            pos += len(blocks[0])
+        for block in blocks[1:]:
+            if data.startswith(block, pos, self.size):
+                pos += len(block)
+        return pos
+
+    def extent_at(self, offset: int) -> Extent | None:
+        """The run containing offset, None if the byte isn't in a run of at least min_run bytes."""
+        i = bisect.bisect_right(self._starts, offset) - 1
+        if i >= 0 and offset < self.extents[i].end:
+            return self.extents[i]
+        return None
+
+    def is_blank(self, start: int, end: int) -> bool:
+        """True if data[start:end] is all 0x00 or all 0xFF. Ranges shorter than min_run must not be queried."""
+        if end - start < self.min_run:
+            raise ValueError(f"Ranges shorter than 0x{self.min_run:X} bytes aren't indexed.")
+        extent = self.extent_at(start)
+        return extent is not None and end <= extent.end
+
+    def find_last_blank(self, length: int, step: int, top: int) -> int:
+        """The highest base in top, top - step, top - 2 * step, ... 0 with data[base:base + length] blank, -1 if none.
+
+        The same as testing every base from the top, but only the runs are visited."""
+        if length < self.min_run:
+            raise ValueError(f"Ranges shorter than 0x{self.min_run:X} bytes aren't indexed.")
+        if top < 0:
+            return -1
+        i = bisect.bisect_right(self._starts, top) - 1
+        while i >= 0:
+            extent = self.extents[i]
+            highest = min(top, extent.end - length)
+            if highest >= extent.start:
+                base = top - (top - highest + step - 1) // step * step
+                if base >= extent.start:
+                    return base
+            i -= 1
+        return -1
+
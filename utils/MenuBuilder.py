@@ -1,15 +1,17 @@
 # coding=utf-8
+import concurrent.futures
 import dataclasses
 import json
 import os
 import shutil
 import typing
 
-from .Patcher import sram_patcher_bank, ips_patcher, batteryless_patcher
-from .Patcher_py import rts_patcher
 from . import HeaderReader
+from . import PatchBackend
+from . import RomAnalysis
 from . import EmulatorBuilder
-from rom_builder import rom_builder, cartridge_config
+from .Workspace import Workspace, DEFAULT_WORKSPACE
+from rom_builder import rom_builder, build_log, cartridge_config, save_import
 from .CheckSaveType import check_save_type
 
 
@@ -18,47 +20,201 @@ class BuildInfo(typing.NamedTuple):
     type: str
     msg: str
     success: bool
+    backend: str | None = None  # the patcher backend which ran a patch step
+    log: str | None = None  # the log of a multimenu build, its latest records
 
 
-def build_start(options: dict, argoptions: dict, gamelist: list):
-    rom_out_dir = "game_patched"
-    if os.path.isdir("./sram_ips"):
-        ips_game_list = os.listdir("./sram_ips")
+class EmulatorBundle(typing.NamedTuple):
+    file: str
+    emulator: str  # "goomba" or "pocketnes"
+    batteryless: bool
+    games: list[int]  # indexes in the game list
+    save_slot: int | None
+
+
+EMULATOR_BUNDLE_MAX_SIZE = 0x2000000  # The whole GBA ROM address space.
+TARGET_WORKERS = 2  # every image being laid out holds a whole flash image, up to 512 MiB
+EMULATOR_FILES = {
+    ("goomba", False): "jagoombacolor.gba",
+    ("goomba", True): "jagoombacolor_batteryless.gba",
+    ("pocketnes", False): "pocketnes.gba",
+    ("pocketnes", True): "pocketnes_batteryless.gba",
+}
+
+
+def plan_emulator_bundles(
+    gamelist: list, battery_present: bool, workspace: Workspace = DEFAULT_WORKSPACE
+) -> list[EmulatorBundle]:
+    # Group gb/gbc and nes games by emulator and save mode, then split every group into images fitting in 32MiB.
+    # All games with save in a bundle share the lowest save slot of them, the emulator keeps the saves apart itself.
+    groups: dict[tuple[str, bool], list[int]] = dict()
+    for i, game in enumerate(gamelist):
+        match os.path.splitext(game["path"])[1].lower():
+            case ".gb" | ".gbc":
+                emulator = "goomba"
+            case ".nes":
+                emulator = "pocketnes"
+            case _:
+                continue
+        groups.setdefault((emulator, game["save_slot"] is not None), []).append(i)
+
+    bundles: list[EmulatorBundle] = list()
+    for (emulator, has_save), game_indexes in groups.items():
+        batteryless = has_save and not battery_present
+        emulator_size = os.path.getsize(
+            workspace.emulator(EMULATOR_FILES[(emulator, batteryless)])
+        )
+        chunks: list[list[int]] = [[]]
+        chunk_size = emulator_size
+        for i in game_indexes:
+            # Room for the PocketNES rom header and the 256B alignment of each rom.
+            rom_size = os.path.getsize(gamelist[i]["path"]) + 0x30 + 0x100
+            if chunks[-1] and chunk_size + rom_size > EMULATOR_BUNDLE_MAX_SIZE:
+                chunks.append([])
+                chunk_size = emulator_size
+            chunks[-1].append(i)
+            chunk_size += rom_size
+        for chunk in chunks:
+            bundles.append(
+                EmulatorBundle(
+                    file=f"__{emulator}_bundle_{len(bundles)}.gba",
+                    emulator=emulator,
+                    batteryless=batteryless,
+                    games=chunk,
+                    save_slot=(
+                        min(gamelist[i]["save_slot"] for i in chunk)
+                        if has_save
+                        else None
+                    ),
+                )
+            )
+    return bundles
+
+
+class BuildTarget(typing.NamedTuple):
+    options: dict  # the cartridge options, like the options of build_start
+    output: str
+
+
+def patch_config(options: dict, argoptions: dict) -> tuple:
+    # Everything the patched games depend on, targets with the same patch config share their patched games.
+    return (
+        options["battery_present"],
+        argoptions["sram_bank_type"],
+        argoptions["batteryless_autosave"],
+        argoptions["use_rts"],
+        (
+            cartridge_config.cartridge_types[options["type"] - 1]["sector_size"]
+            if argoptions["use_rts"]
+            else None
+        ),
+        argoptions.get("bundle_emulator", False),
+        argoptions.get("patch_backend"),
+    )
+
+
+def patch_games(
+    options: dict,
+    argoptions: dict,
+    gamelist: list,
+    workspace: Workspace = DEFAULT_WORKSPACE,
+    rom_out_dir: str = "game_patched",
+):
+    """Patches all games into rom_out_dir of the workspace, yields BuildInfo for every step and returns the games
+    of the config."""
+    rom_out_path = workspace.path(rom_out_dir)
+    patch_backend = argoptions.get("patch_backend")  # None: the fastest available
+    if os.path.isdir(workspace.sram_ips_dir):
+        ips_game_list = os.listdir(workspace.sram_ips_dir)
         for i in range(0, len(ips_game_list)):
             ips_game_list[i] = os.path.splitext(ips_game_list[i])[0]
     else:
         ips_game_list = list()
     emu_game_list = ["GMBC", "PNES"]
     game_json_file = list()
-    if os.path.exists(f"./{rom_out_dir}"):
-        shutil.rmtree(f"./{rom_out_dir}")
-    os.makedirs(f"./{rom_out_dir}")
-    for game in gamelist:
+    if os.path.exists(rom_out_path):
+        shutil.rmtree(rom_out_path)
+    os.makedirs(rom_out_path)
+    bundled_games: dict[int, EmulatorBundle] = dict()
+    if argoptions.get("bundle_emulator", False):
+        for bundle in plan_emulator_bundles(
+            gamelist, options["battery_present"], workspace
+        ):
+            bundle_paths = [gamelist[i]["path"] for i in bundle.games]
+            emulator_path = workspace.emulator(
+                EMULATOR_FILES[(bundle.emulator, bundle.batteryless)]
+            )
+            if bundle.emulator == "goomba":
+                EmulatorBuilder.build_goomba(
+                    bundle_paths,
+                    os.path.join(rom_out_path, bundle.file),
+                    goomba_path=emulator_path,
+                )
+            else:
+                EmulatorBuilder.build_pocketnes(
+                    bundle_paths,
+                    os.path.join(rom_out_path, bundle.file),
+                    pocketnes_path=emulator_path,
+                    romdata_db=workspace.emulator("pnesmmw.mdb"),
+                )
+            for i in bundle.games:
+                bundled_games[i] = bundle
+            yield BuildInfo(
+                bundle.file,
+                f"{bundle.emulator} bundle",
+                f"Games bundled: {len(bundle.games)}",
+                True,
+            )
+    for game_index, game in enumerate(gamelist):
         file_name_full: str = os.path.basename(game["path"])
         file_name: str = os.path.splitext(file_name_full)[0]
         file_type: str = os.path.splitext(file_name_full)[1]
         game_json_elem: dict = dict()
-        out_file = f"./{rom_out_dir}/" + file_name + ".gba"
+        out_file = os.path.join(rom_out_path, file_name + ".gba")
+        if game_index in bundled_games:
+            # All games in a bundle point to the same image, the emulator menu selects the game.
+            game_json_file.append(
+                {
+                    "enabled": True,
+                    "file": bundled_games[game_index].file,
+                    "title": str(game["name"]),
+                    "title_font": 1,
+                    "save_slot": bundled_games[game_index].save_slot,
+                }
+            )
+            continue
         match file_type.lower():
             case ".gba":
                 if (
                     HeaderReader.get_id(game["path"]) in ips_game_list
                 ):  # Some games can't be patched with the normal SRAM patch so use special ips patches for them.
+                    backend, ips_patcher = PatchBackend.resolve("ips", patch_backend)
                     if (
                         ips_patcher(
                             game["path"],
-                            "./sram_ips/" + HeaderReader.get_id(game["path"]) + ".ips",
+                            os.path.join(
+                                workspace.sram_ips_dir,
+                                HeaderReader.get_id(game["path"]) + ".ips",
+                            ),
                             out_file,
                         )
                         == 1
                     ):
                         yield BuildInfo(
-                            file_name_full, "IPS patch", "IPS patch failed.", False
+                            file_name_full,
+                            "IPS patch",
+                            "IPS patch failed.",
+                            False,
+                            backend,
                         )
                         continue
                     else:
                         yield BuildInfo(
-                            file_name_full, "IPS patch", "IPS patch succeed.", True
+                            file_name_full,
+                            "IPS patch",
+                            "IPS patch succeed.",
+                            True,
+                            backend,
                         )
 
                 elif (
@@ -66,7 +222,16 @@ def build_start(options: dict, argoptions: dict, gamelist: list):
                 ):  # Skip game patch if it's emulator.
                     shutil.copy(game["path"], out_file)
                 else:
-                    save_type = check_save_type(game["path"])
+                    # Analysed when the game was added in the GUI, scanned now otherwise.
+                    analysis = RomAnalysis.cache.lookup(game["path"])
+                    save_type = (
+                        analysis.save_type
+                        if analysis is not None
+                        else check_save_type(game["path"])
+                    )
+                    backend, sram_patcher_bank = PatchBackend.resolve(
+                        "sram", patch_backend
+                    )
                     if save_type in ["none", "sram"]:
                         shutil.copy(game["path"], out_file)
                     elif (
@@ -76,18 +241,29 @@ def build_start(options: dict, argoptions: dict, gamelist: list):
                         == 1
                     ):
                         yield BuildInfo(
-                            file_name_full, "SRAM patch", "SRAM patch failed.", False
+                            file_name_full,
+                            "SRAM patch",
+                            "SRAM patch failed.",
+                            False,
+                            backend,
                         )
                         continue
                     else:
                         yield BuildInfo(
-                            file_name_full, "SRAM patch", "SRAM patch succeed.", True
+                            file_name_full,
+                            "SRAM patch",
+                            "SRAM patch succeed.",
+                            True,
+                            backend,
                         )
                 if (
                     not options["battery_present"]
                     and game["save_slot"] is not None
                     and HeaderReader.get_id(game["path"]) not in emu_game_list
                 ):
+                    backend, batteryless_patcher = PatchBackend.resolve(
+                        "batteryless", patch_backend
+                    )
                     if (
                         batteryless_patcher(
                             out_file, out_file, argoptions["batteryless_autosave"]
@@ -99,6 +275,7 @@ def build_start(options: dict, argoptions: dict, gamelist: list):
                             "batteryless patch",
                             "Batteryless patch failed.",
                             False,
+                            backend,
                         )
                         continue
                     else:
@@ -107,8 +284,10 @@ def build_start(options: dict, argoptions: dict, gamelist: list):
                             "batteryless patch",
                             "Batteryless patch succeed.",
                             True,
+                            backend,
                         )
                 elif argoptions["use_rts"]:
+                    backend, rts_patcher = PatchBackend.resolve("rts", patch_backend)
                     if (
                         rts_patcher(
                             out_file,
@@ -123,16 +302,21 @@ def build_start(options: dict, argoptions: dict, gamelist: list):
                             "rts patch",
                             "RTS patch failed.",
                             False,
+                            backend,
                         )
             case ".gb" | ".gbc":
                 if not options["battery_present"] and game["save_slot"] is not None:
                     EmulatorBuilder.build_goomba(
                         game["path"],
                         out_file,
-                        goomba_path="./emulator/jagoombacolor_batteryless.gba",
+                        goomba_path=workspace.emulator("jagoombacolor_batteryless.gba"),
                     )
                 else:
-                    EmulatorBuilder.build_goomba(game["path"], out_file)
+                    EmulatorBuilder.build_goomba(
+                        game["path"],
+                        out_file,
+                        goomba_path=workspace.emulator("jagoombacolor.gba"),
+                    )
                 yield BuildInfo(
                     file_name_full, "goomba build", "Goomba build succeed.", True
                 )
@@ -141,10 +325,16 @@ def build_start(options: dict, argoptions: dict, gamelist: list):
                     EmulatorBuilder.build_pocketnes(
                         game["path"],
                         out_file,
-                        pocketnes_path="./emulator/pocketnes_batteryless.gba",
+                        pocketnes_path=workspace.emulator("pocketnes_batteryless.gba"),
+                        romdata_db=workspace.emulator("pnesmmw.mdb"),
                     )
                 else:
-                    EmulatorBuilder.build_pocketnes(game["path"], out_file)
+                    EmulatorBuilder.build_pocketnes(
+                        game["path"],
+                        out_file,
+                        pocketnes_path=workspace.emulator("pocketnes.gba"),
+                        romdata_db=workspace.emulator("pnesmmw.mdb"),
+                    )
                 yield BuildInfo(
                     file_name_full, "pocketnes build", "PocketNES build succeed.", True
                 )
@@ -162,43 +352,140 @@ def build_start(options: dict, argoptions: dict, gamelist: list):
             "title_font": 1,
             "save_slot": game["save_slot"],
         }
+        save_file = save_import.find_save_file(game["path"])
+        if game["save_slot"] is not None and save_file is not None:
+            # The patched ROMs are in another folder, so tell the builder where the save is.
+            game_json_elem["save_file"] = os.path.abspath(save_file)
         game_json_file.append(game_json_elem)
-    fin_json = {"cartridge": options, "games": game_json_file}
-    json_file = open("./builder.json", "w", encoding="UTF-8-SIG")
+    return game_json_file
+
+
+def build_image(
+    options: dict,
+    argoptions: dict,
+    games: list,
+    workspace: Workspace = DEFAULT_WORKSPACE,
+    rom_out_dir: str = "game_patched",
+    config_file: str = "builder.json",
+    log_file: str = "log.txt",
+) -> BuildInfo:
+    fin_json = {"cartridge": options, "games": games}
+    json_file = open(workspace.path(config_file), "w", encoding="UTF-8-SIG")
     json_file.write(json.dumps(obj=fin_json, indent=4, ensure_ascii=False))
     json_file.close()
 
     build_config: rom_builder.Args = rom_builder.Args()
     build_config.cli_mode = False
     build_config.no_wait = True
-    build_config.no_log = True
-    build_config.config = "builder.json"
-    build_config.rom_base_path = rom_out_dir
+    build_config.config = workspace.path(config_file)
+    build_config.rom_base_path = workspace.path(rom_out_dir)
+    build_config.menu_rom = workspace.menu_rom
+    build_config.log_file = workspace.path(log_file)
+    build_config.log_level = argoptions.get("log_level", build_config.log_level)
+    # Re-reads the image and every source, off unless asked for.
+    build_config.verify = argoptions.get("verify", False)
     if "bg" in argoptions.keys():
         build_config.bg = argoptions["bg"]
+    elif os.path.isfile(workspace.background):
+        build_config.bg = workspace.background
     if "split" in argoptions.keys():
         build_config.split = argoptions["split"]
     if "output" in argoptions.keys():
         build_config.output = argoptions["output"]
-    build_result: rom_builder.FuncModeRet = rom_builder.build(
-        dataclasses.asdict(build_config)
-    )
+    build_config.output = workspace.output(build_config.output)
+    with build_log.BuildLog(
+        path=build_config.log_file, level=build_config.log_level
+    ) as log:
+        build_result: rom_builder.FuncModeRet = rom_builder.build(
+            dataclasses.asdict(build_config), log
+        )
     if build_result.success:
         if not build_result.data:
-            yield BuildInfo(
-                build_config.output, "multimenu build", "Multimenu build success.", True
+            return BuildInfo(
+                build_config.output,
+                "multimenu build",
+                "Multimenu build success.",
+                True,
+                log=log.text(),
             )
         else:
-            yield BuildInfo(
+            return BuildInfo(
                 build_config.output,
                 "multimenu build",
                 f"Multimenu build success but the following games are not included because not enough space on the cartridge: {', '.join(map(lambda g:g["title"],build_result.data))}.",
                 False,
+                log=log.text(),
             )
     else:
-        yield BuildInfo(
+        return BuildInfo(
             build_config.output,
             "multimenu build",
             f"Multimenu build failure, reason: {build_result.msg}.",
             False,
+            log=log.text(),
         )
+
+
+def build_start(
+    options: dict,
+    argoptions: dict,
+    gamelist: list,
+    workspace: Workspace = DEFAULT_WORKSPACE,
+):
+    games = yield from patch_games(options, argoptions, gamelist, workspace)
+    yield build_image(options, argoptions, games, workspace)
+
+
+def build_targets(
+    targets: list[BuildTarget],
+    argoptions: dict,
+    gamelist: list,
+    workspace: Workspace = DEFAULT_WORKSPACE,
+    max_workers: int = TARGET_WORKERS,
+):
+    """Builds one game list for several cartridges. Games are patched once per patch config, then the images are
+    laid out and written concurrently. Yields BuildInfo of the patch steps, then one BuildInfo per target, also for
+    targets whose build raised."""
+    outputs = [target.output for target in targets]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Every target needs its own output file.")
+    groups: dict[tuple, list[int]] = dict()
+    for i, target in enumerate(targets):
+        groups.setdefault(patch_config(target.options, argoptions), []).append(i)
+
+    jobs: list[tuple[int, str, list]] = list()
+    for n, target_indexes in enumerate(groups.values()):
+        rom_out_dir = "game_patched" if len(groups) == 1 else f"game_patched_{n}"
+        games = yield from patch_games(
+            targets[target_indexes[0]].options,
+            argoptions,
+            gamelist,
+            workspace,
+            rom_out_dir,
+        )
+        jobs.extend((i, rom_out_dir, games) for i in target_indexes)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = {
+            executor.submit(
+                build_image,
+                targets[i].options,
+                {**argoptions, "output": targets[i].output},
+                games,
+                workspace,
+                rom_out_dir,
+                f"builder_{i}.json",
+                f"log_{i}.txt",
+            ): i
+            for i, rom_out_dir, games in jobs
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield BuildInfo(
+                    workspace.output(targets[futures[future]].output),
+                    "multimenu build",
+                    f"Multimenu build failure, reason: {e}.",
+                    False,
+                )
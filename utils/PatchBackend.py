@@ -0,0 +1,127 @@
+# coding=utf-8
+# Patcher backends. A patch operation has up to three implementations: the C++ extensions (Patcher), the Rust
+# extension (Patcher_rs) and pure Python (Patcher_py). The extensions are probed at import time without loading
+# them, and every operation runs on the fastest backend available. Another backend can be chosen per call, with
+# set_backend, or with the LK_PATCH_BACKEND environment variable, e.g. "py" or "sram=py,batteryless=rs".
+import importlib
+import importlib.util
+import os
+import threading
+import typing
+
+BACKENDS = ("cpp", "rs", "py")  # fastest first
+BACKEND_ENV = "LK_PATCH_BACKEND"
+
+
+class Implementation(typing.NamedTuple):
+    backend: str
+    module: str  # the wrapper module
+    function: str
+    native_module: str | None  # the extension the wrapper calls, None for pure Python
+
+
+IMPLEMENTATIONS: dict[str, list[Implementation]] = {
+    "batteryless": [
+        Implementation("cpp", "utils.Patcher", "batteryless_patcher", "lib.batteryless_patch"),
+        Implementation("rs", "utils.Patcher_rs", "batteryless_patcher", "lib.batteryless_patch_rs"),
+        Implementation("py", "utils.Patcher_py", "batteryless_patcher", None),
+    ],
+    "sram": [
+        Implementation("cpp", "utils.Patcher", "sram_patcher_bank", "lib.gba_patch"),
+        Implementation("py", "utils.Patcher_py", "sram_patcher_bank", None),
+    ],
+    "ips": [
+        Implementation("cpp", "utils.Patcher", "ips_patcher", "lib.gba_patch"),
+        Implementation("py", "utils.Patcher_py", "ips_patcher", None),
+    ],
+    "rts": [
+        Implementation("py", "utils.Patcher_py", "rts_patcher", None),
+    ],
+    "detect": [
+        Implementation("cpp", "utils.Patcher", "detect_save_types", "lib.gba_patch"),
+        Implementation("py", "utils.Patcher_py", "detect_save_types", None),
+    ],
+}
+
+
+def _probe(native_module: str | None) -> bool:
+    if native_module is None:
+        return True
+    try:
+        return importlib.util.find_spec(native_module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _parse_overrides(value: str) -> dict[str | None, str]:
+    """{operation: backend}, the key None is the backend of all operations."""
+    overrides: dict[str | None, str] = dict()
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        operation, _, backend = item.rpartition("=")
+        overrides[operation or None] = backend
+    return overrides
+
+
+_available = {
+    impl: _probe(impl.native_module)
+    for implementations in IMPLEMENTATIONS.values()
+    for impl in implementations
+}
+_overrides = _parse_overrides(os.environ.get(BACKEND_ENV, ""))
+_resolved: dict[tuple[str, str | None], tuple[str, typing.Callable]] = dict()
+_lock = threading.Lock()
+
+
+def available(operation: str) -> list[str]:
+    """The backends of the operation found at import time, fastest first."""
+    return [impl.backend for impl in IMPLEMENTATIONS[operation] if _available[impl]]
+
+
+def set_backend(backend: str | None, operation: str | None = None) -> None:
+    """Runs the operation (all operations if None) on the backend, None restores the automatic choice."""
+    if backend is not None and backend not in BACKENDS:
+        raise ValueError(f"Unknown patcher backend “{backend}”.")
+    with _lock:
+        if backend is None:
+            _overrides.pop(operation, None)
+        else:
+            _overrides[operation] = backend
+        _resolved.clear()
+
+
+def _load(impl: Implementation) -> typing.Callable:
+    if impl.native_module is not None:
+        importlib.import_module(impl.native_module)  # the wrappers tolerate a missing extension, this doesn't
+    return getattr(importlib.import_module(impl.module), impl.function)
+
+
+def resolve(operation: str, backend: str | None = None) -> tuple[str, typing.Callable]:
+    """(backend name, patcher function) for the operation.
+
+    An explicitly chosen backend must load if it implements the operation, otherwise the fastest backend which
+    loads is used."""
+    if operation not in IMPLEMENTATIONS:
+        raise ValueError(f"Unknown patch operation “{operation}”.")
+    with _lock:
+        backend = backend or _overrides.get(operation) or _overrides.get(None)
+        if backend is not None and backend not in BACKENDS:
+            raise ValueError(f"Unknown patcher backend “{backend}”.")
+        key = (operation, backend)
+        if key in _resolved:
+            return _resolved[key]
+        for impl in IMPLEMENTATIONS[operation]:
+            if impl.backend == backend:
+                # Explicit choice, let it fail loudly instead of silently running on another backend.
+                _resolved[key] = (impl.backend, _load(impl))
+                return _resolved[key]
+        for impl in IMPLEMENTATIONS[operation]:
+            if not _available[impl]:
+                continue
+            try:
+                function = _load(impl)
+            except ImportError:
+                _available[impl] = False  # found but can't be loaded, e.g. built for another Python
+                continue
+            _resolved[key] = (impl.backend, function)
+            return _resolved[key]
+    raise ImportError(f"No patcher backend available for “{operation}”.")
@@ -0,0 +1,113 @@
+# coding=utf-8
+# Two-phase batteryless and RTS patching. Analysing a ROM finds everything the patchers search for once: the
+# signature of an earlier patch, the IRQ handler references, the write functions and the free space. The patchers
+# then write a patched ROM for any options (auto save, sector size, write buffer, RTS file) from the plan without
+# searching the ROM again. Plans are small and picklable, and are cached by the content of the ROM, so patching the
+# same ROM again with other options, e.g. when rebuilding with another setting, skips the analysis.
+import collections
+import hashlib
+import threading
+import typing
+
+from utils import BufferPool, FreeSpace
+
+PATCHED_SIGNATURE = b"<3 from Maniac"
+IRQ_HANDLER_REFERENCE = bytes([0xFC, 0x7F, 0x00, 0x03])
+ALIGNMENT = 0x40000  # trimmed ROMs are padded to 256 KiB
+CACHE_SIZE = 64
+
+
+class PatchPlan(typing.NamedTuple):
+    size: int  # of the ROM file
+    digest: str  # sha256 of the ROM file
+    patched: bool  # the signature of an earlier batteryless or RTS patch was found
+    irq_references: tuple[int, ...]
+    write_functions: dict[bytes, tuple[int, ...]]  # every halfword aligned match of every signature
+    free_space: tuple[FreeSpace.Extent, ...]  # of the padded ROM
+
+    @property
+    def padded_size(self) -> int:
+        return padded_size(self.size)
+
+    def free_space_index(self) -> FreeSpace.FreeSpaceIndex:
+        return FreeSpace.FreeSpaceIndex.from_extents(self.free_space, self.padded_size)
+
+    def write_function_offsets(self, signature: bytes, stride: int) -> list[int]:
+        return [offset for offset in self.write_functions[signature] if offset % stride == 0]
+
+
+def padded_size(size: int) -> int:
+    return (size & ~(ALIGNMENT - 1)) + ALIGNMENT if size & (ALIGNMENT - 1) else size
+
+
+def _find_all(data, needle: bytes, stride: int, end: int) -> tuple[int, ...]:
+    offsets = []
+    pos = BufferPool.find_aligned(data, needle, stride, 0, end)
+    while pos != -1:
+        offsets.append(pos)
+        pos = BufferPool.find_aligned(data, needle, stride, pos + stride, end)
+    return tuple(offsets)
+
+
+def analyse(rom, size: int, digest: str, signatures: typing.Iterable[bytes]) -> PatchPlan:
+    """The plan of rom, which holds the ROM file of size bytes padded to 256 KiB with 0xFF."""
+    end = padded_size(size)
+    return PatchPlan(
+        size,
+        digest,
+        BufferPool.find_aligned(rom, PATCHED_SIGNATURE, 4, 0, end) != -1,
+        _find_all(rom, IRQ_HANDLER_REFERENCE, 4, end),
+        {signature: _find_all(rom, signature, 2, end) for signature in signatures},
+        tuple(FreeSpace.FreeSpaceIndex(rom, end).extents),
+    )
+
+
+class PlanCache:
+    """The latest plans, by ROM digest and signatures."""
+
+    def __init__(self, capacity: int = CACHE_SIZE):
+        self.capacity = capacity
+        self._plans: collections.OrderedDict[tuple, PatchPlan] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> PatchPlan | None:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+            return plan
+
+    def put(self, key: tuple, plan: PatchPlan) -> None:
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.capacity:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+
+# One cache per process, like the buffer pool.
+cache = PlanCache()
+
+
+def read(buffer: BufferPool.RomBuffer, rom_path: str) -> tuple[int, str]:
+    """Reads the ROM into the buffer and pads it to 256 KiB, returns the size and the digest of the file."""
+    size = buffer.read(rom_path)
+    with buffer.view as view:
+        digest = hashlib.sha256(view).hexdigest()
+    buffer.resize(padded_size(size))
+    return size, digest
+
+
+def load(buffer: BufferPool.RomBuffer, rom_path: str, signatures: typing.Sequence[bytes]) -> PatchPlan:
+    """Reads the ROM into the buffer like read, and returns its cached plan or analyses it."""
+    size, digest = read(buffer, rom_path)
+    key = (digest, tuple(signatures))
+    plan = cache.get(key)
+    if plan is None:
+        plan = analyse(buffer.arena, size, digest, signatures)
+        cache.put(key, plan)
+    return plan
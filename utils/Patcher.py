@@ -1,10 +1,17 @@
 # coding=utf-8
 
-from lib import batteryless_patch
-from lib import gba_patch
-
 import locale
 
+# The C++ patchers. An extension which isn't built stays None, PatchBackend picks another backend for it then.
+try:
+    from lib import batteryless_patch
+except ImportError:
+    batteryless_patch = None
+try:
+    from lib import gba_patch
+except ImportError:
+    gba_patch = None
+
 
 def batteryless_patcher(
     rom_path: str, out_path: str, auto_mode: bool
@@ -45,3 +52,8 @@ def ips_patcher(
         ips_path.encode(locale.getpreferredencoding()),
         out_path.encode(locale.getpreferredencoding()),
     )
+
+
+def detect_save_types(rom_path: str) -> list[tuple[str, int]]:
+    # Save library strings (e.g. "FLASH1M_V103") found in the ROM, with their offsets.
+    return gba_patch.detect_save_types(rom_path.encode(locale.getpreferredencoding()))
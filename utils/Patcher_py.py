@@ -1,6 +1,11 @@
 # coding=utf-8
 
-from gba_patch_py.patch import apply_ips_patch, patch_complement_check
+from gba_patch_py.patch import (
+    apply_ips_patch,
+    detect_save_libraries,
+    patch_complement_check,
+    patch_sram,
+)
 from batteryless_patch_py.batteryless_patch import patch as batteryless_patch
 from rts_patch_py.patcher import apply_patch as rts_patch
 
@@ -57,6 +62,57 @@ def ips_patcher(
     return 0
 
 
+def sram_patcher_bank(
+    rom_path: str, out_path: str, sram_bank_type: int = 0
+) -> int:  # 0: Done 1: Failed
+    print("Reading ROM file: " + rom_path)
+    try:
+        with open(rom_path, "rb") as rom_file:
+            rom_data = bytearray(rom_file.read())
+    except Exception as e:
+        print("Error reading ROM file.")
+        print(e)
+        return 1
+    if not rom_data:
+        return 1
+
+    print("Patching save type to SRAM.")
+    try:
+        patch_sram(rom_data, sram_bank_type)
+    except Exception as e:
+        print("Error during SRAM patching.")
+        print(e)
+        return 1
+
+    print("Correcting complement checksum.")
+    try:
+        rom_data = patch_complement_check(rom_data)
+    except Exception as e:
+        print("Error during complement check patch.")
+        print(e)
+        return 1
+
+    print("Writing output file: " + out_path)
+    try:
+        with open(out_path, "wb") as out_file:
+            out_file.write(rom_data)
+    except Exception as e:
+        print("Failed to write file.")
+        print(e)
+        return 1
+    return 0
+
+
+def detect_save_types(rom_path: str) -> list[tuple[str, int]]:
+    # Save library strings (e.g. "FLASH1M_V103") found in the ROM, with their offsets.
+    with open(rom_path, "rb") as f:
+        rom_data = f.read()
+    return [
+        (save_type.value.decode("ascii"), offset)
+        for save_type, offset in detect_save_libraries(rom_data)
+    ]
+
+
 def rts_patcher(rom_path: str, out_path: str, wbuf_size: int = 0, sector_size=0x10000):
     return (
         0
@@ -0,0 +1,112 @@
+# coding=utf-8
+# CRC32 index of the PocketNES rom database (pnesmmw.mdb).
+# The text database is parsed once per process and persisted as a binary sidecar
+# (<mdb>.idx) keyed by the mtime and size of the mdb file.
+
+import os
+import struct
+import threading
+import typing
+
+
+class DBRecord(typing.NamedTuple):
+    title: bytes
+    flags: int
+    follow: int
+
+
+INDEX_MAGIC = b"PNDB"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sIQQI")  # magic, version, mtime_ns, size, count
+INDEX_RECORD = struct.Struct("<III31s")  # crc32, flags, follow, title
+
+_indexes: dict[str, tuple[int, int, dict[int, DBRecord]]] = {}
+_indexes_lock = threading.Lock()
+
+
+def _parse_int(field: str) -> int:
+    # Values are often followed by comments, like "12 (sprite follow (Titney)".
+    digits = field.strip().split(" ")[0]
+    return int(digits) if digits.isdigit() else 0
+
+
+def parse_mdb(mdb_path: str) -> dict[int, DBRecord]:
+    index: dict[int, DBRecord] = dict()
+    with open(mdb_path, "r", encoding="latin-1") as mdb:
+        for line in mdb:
+            record = line.rstrip("\r\n").split("|")
+            if len(record) < 2:
+                continue
+            try:
+                crc = int(record[0], 16)
+            except ValueError:
+                continue
+            if crc in index:
+                continue
+            index[crc] = DBRecord(
+                title=record[1].encode("latin-1")[:31],
+                flags=_parse_int(record[2]) if len(record) > 2 else 0,
+                follow=_parse_int(record[3]) if len(record) > 3 else 0,
+            )
+    return index
+
+
+def _read_sidecar(idx_path: str, mtime_ns: int, size: int) -> dict[int, DBRecord] | None:
+    try:
+        with open(idx_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < INDEX_HEADER.size:
+        return None
+    magic, version, idx_mtime_ns, idx_size, count = INDEX_HEADER.unpack_from(data)
+    if (
+        magic != INDEX_MAGIC
+        or version != INDEX_VERSION
+        or idx_mtime_ns != mtime_ns
+        or idx_size != size
+        or len(data) != INDEX_HEADER.size + count * INDEX_RECORD.size
+    ):
+        return None
+    return {
+        crc: DBRecord(title.rstrip(b"\0"), flags, follow)
+        for crc, flags, follow, title in INDEX_RECORD.iter_unpack(
+            memoryview(data)[INDEX_HEADER.size :]
+        )
+    }
+
+
+def _write_sidecar(
+    idx_path: str, mtime_ns: int, size: int, index: dict[int, DBRecord]
+) -> None:
+    data = bytearray(INDEX_HEADER.size + len(index) * INDEX_RECORD.size)
+    INDEX_HEADER.pack_into(data, 0, INDEX_MAGIC, INDEX_VERSION, mtime_ns, size, len(index))
+    pos = INDEX_HEADER.size
+    for crc, record in index.items():
+        INDEX_RECORD.pack_into(data, pos, crc, record.flags, record.follow, record.title)
+        pos += INDEX_RECORD.size
+    try:
+        with open(idx_path, "wb") as f:
+            f.write(data)
+    except OSError:
+        pass  # A read only emulator folder only costs a reparse next time.
+
+
+def load_index(mdb_path: str) -> dict[int, DBRecord]:
+    mdb_path = os.path.abspath(mdb_path)
+    stat = os.stat(mdb_path)
+    with _indexes_lock:
+        cached = _indexes.get(mdb_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        idx_path = mdb_path + ".idx"
+        index = _read_sidecar(idx_path, stat.st_mtime_ns, stat.st_size)
+        if index is None:
+            index = parse_mdb(mdb_path)
+            _write_sidecar(idx_path, stat.st_mtime_ns, stat.st_size, index)
+        _indexes[mdb_path] = (stat.st_mtime_ns, stat.st_size, index)
+        return index
+
+
+def lookup(mdb_path: str, crc: int) -> DBRecord | None:
+    return load_index(mdb_path).get(crc)
@@ -0,0 +1,194 @@
+# coding=utf-8
+# What a build finds out about a game, found out as soon as it's added: the save type, the size, whether a special
+# SRAM IPS patch exists and whether the batteryless and RTS patches can be applied. Analyses are cached by the content
+# of the file and found again by path, size and modification time, so the build reuses them without reading the ROM.
+# The patch plan of the batteryless and RTS patchers is made on the way and cached by PatchPlan as well.
+import collections
+import hashlib
+import os
+import threading
+import typing
+
+from batteryless_patch_py import batteryless_patch
+from rom_builder import rom_sizing
+from . import BufferPool, PatchPlan
+from .CheckSaveType import save_type_of
+from .Workspace import Workspace, DEFAULT_WORKSPACE
+
+MAX_ROM_SIZE = 0x2000000
+HEADER_END = 0xB0  # up to the end of the game code
+BATTERYLESS_EXPANSION = 0x80000  # the batteryless patch appends its payload if the ROM has no room for it
+EMULATOR_GAME_IDS = ("GMBC", "PNES")  # Goomba and PocketNES images, the build doesn't patch them
+CACHE_SIZE = 1024
+
+# Warnings, the GUIs translate them.
+UNREADABLE = "unreadable"
+TRUNCATED = "truncated"  # not even the header is there
+TOO_LARGE = "too_large"
+ALREADY_PATCHED = "already_patched"  # by the batteryless or RTS patch
+NO_IRQ_REFERENCE = "no_irq_reference"  # the batteryless and RTS patches can't hook the game
+NO_PAYLOAD_ROOM = "no_payload_room"  # the batteryless payload neither fits in the ROM nor can be appended
+
+
+class RomAnalysis(typing.NamedTuple):
+    path: str
+    digest: str | None  # sha256 of the file, None if it can't be read
+    size: int
+    game_id: str | None  # GBA games only
+    save_type: str  # like check_save_type, "none" for other systems
+    batteryless_mod: bool
+    sram_ips: bool  # the game has a special SRAM IPS patch
+    warnings: tuple[str, ...]
+    batteryless_size: int | None = None  # of the batteryless patched ROM, None if the patch can't be applied
+
+    @property
+    def is_gba(self) -> bool:
+        return self.game_id is not None
+
+    def mapped_size(
+        self,
+        policy: str,
+        sector_size: int,
+        block_size: int,
+        min_rom_size: int = 0x400000,
+        batteryless: bool = False,
+    ) -> int | None:
+        """The size the game is mapped with in the menu, None if it isn't a readable GBA ROM. batteryless: whether the
+        build batteryless patches the game, which pads it and may expand it."""
+        if not self.is_gba or self.digest is None or TOO_LARGE in self.warnings:
+            return None
+        data_size = self.size
+        if batteryless and self.batteryless_size is not None and self.game_id not in EMULATOR_GAME_IDS:
+            data_size = self.batteryless_size
+        return rom_sizing.rom_size(
+            self.path,
+            policy,
+            sector_size,
+            block_size,
+            min_rom_size,
+            data_size=data_size,
+            batteryless_mod=self.batteryless_mod,
+        ).size
+
+
+class AnalysisCache:
+    """Analyses by digest, and the digest of every file by path, size and modification time."""
+
+    def __init__(self, capacity: int = CACHE_SIZE):
+        self.capacity = capacity
+        self._analyses: collections.OrderedDict[str, RomAnalysis] = collections.OrderedDict()
+        self._digests: dict[tuple, str] = dict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> RomAnalysis | None:
+        with self._lock:
+            return self._analyses.get(digest)
+
+    def lookup(self, path: str) -> RomAnalysis | None:
+        """The analysis of the file if it hasn't changed since, without reading it."""
+        try:
+            key = _file_key(path)
+        except OSError:
+            return None
+        with self._lock:
+            digest = self._digests.get(key)
+            analysis = None if digest is None else self._analyses.get(digest)
+        if analysis is None:
+            return None
+        return analysis if analysis.path == path else analysis._replace(path=path)
+
+    def put(self, key: tuple, analysis: RomAnalysis) -> None:
+        with self._lock:
+            self._analyses[analysis.digest] = analysis
+            self._analyses.move_to_end(analysis.digest)
+            self._digests[key] = analysis.digest
+            while len(self._analyses) > self.capacity:
+                digest, _ = self._analyses.popitem(last=False)
+                self._digests = {k: v for k, v in self._digests.items() if v != digest}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._analyses.clear()
+            self._digests.clear()
+
+
+# One cache per process, shared by the GUI and the builds it starts.
+cache = AnalysisCache()
+
+
+def _file_key(path: str) -> tuple:
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+def _has_sram_ips(game_id: str | None, workspace: Workspace) -> bool:
+    return game_id is not None and os.path.isfile(
+        os.path.join(workspace.sram_ips_dir, game_id + ".ips")
+    )
+
+
+def _analyse_gba(path: str, size: int) -> RomAnalysis:
+    if size < HEADER_END:
+        # The pooled buffer would still hold the header of the ROM read before.
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        return RomAnalysis(path, digest, size, None, "none", False, False, (TRUNCATED,))
+    if size > MAX_ROM_SIZE:
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+            f.seek(0xAC)
+            game_id = f.read(4).decode(errors="replace")
+        return RomAnalysis(path, digest, size, game_id, "none", False, False, (TOO_LARGE,))
+    with BufferPool.pool.acquire() as buffer:
+        plan = PatchPlan.load(buffer, path, batteryless_patch.write_signatures)
+        rom = buffer.arena
+        warnings = []
+        if plan.patched:
+            warnings.append(ALREADY_PATCHED)
+        if not plan.irq_references:
+            warnings.append(NO_IRQ_REFERENCE)
+        payload_size = len(batteryless_patch.payload_bin)
+        payload_base = plan.free_space_index().find_last_blank(
+            0x40000 + payload_size, 0x40000, plan.padded_size - 0x40000 - payload_size
+        )
+        # Like the patch: the payload goes in the free space, or the ROM is expanded if there is none.
+        batteryless_size = plan.padded_size
+        if payload_base == -1:
+            batteryless_size += BATTERYLESS_EXPANSION
+        if batteryless_size > MAX_ROM_SIZE:
+            warnings.append(NO_PAYLOAD_ROOM)
+        return RomAnalysis(
+            path,
+            plan.digest,
+            size,
+            bytes(rom[0xAC:0xB0]).decode(errors="replace"),
+            save_type_of(rom, size),
+            rom.find(rom_sizing.BATTERYLESS_MOD_SIGNATURE, 0, size) != -1,
+            False,
+            tuple(warnings),
+            None if plan.patched or not plan.irq_references or NO_PAYLOAD_ROOM in warnings else batteryless_size,
+        )
+
+
+def analyse(path: str, workspace: Workspace = DEFAULT_WORKSPACE) -> RomAnalysis:
+    """The analysis of a game file, from the cache if the file was analysed before."""
+    try:
+        key = _file_key(path)
+    except OSError:
+        return RomAnalysis(path, None, 0, None, "none", False, False, (UNREADABLE,))
+    analysis = cache.lookup(path)
+    if analysis is None:
+        try:
+            if os.path.splitext(path)[1].lower() == ".gba":
+                analysis = _analyse_gba(path, key[1])
+            else:
+                with open(path, "rb") as f:
+                    digest = hashlib.file_digest(f, "sha256").hexdigest()
+                analysis = cache.get(digest) or RomAnalysis(
+                    path, digest, key[1], None, "none", False, False, ()
+                )
+        except (OSError, ValueError):
+            return RomAnalysis(path, None, key[1], None, "none", False, False, (UNREADABLE,))
+        cache.put(key, analysis)
+    # Not cached, the IPS patches belong to the workspace.
+    return analysis._replace(path=path, sram_ips=_has_sram_ips(analysis.game_id, workspace))
@@ -0,0 +1,66 @@
+# coding=utf-8
+# Bulk import of games dropped on the game list: files and folders are walked for ROMs, off the UI thread, and handed
+# out in batches, so the GUIs insert hundreds of rows a batch at a time instead of opening a dialog per game.
+import os
+import typing
+
+EXTENSIONS = (".gba", ".gbc", ".gb", ".nes")
+BATCH_SIZE = 64
+
+
+class ImportedRom(typing.NamedTuple):
+    path: str
+    name: str  # the file name without the extension, like the add dialog suggests
+
+
+def is_rom(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in EXTENSIONS
+
+
+def path_key(path: str) -> str:
+    """The same for every spelling of a path, to find games already in the list."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def title_of(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _walk(folder: str) -> typing.Iterator[str]:
+    # Sorted by name, case insensitive, the order of the games in the menu follows.
+    for root, dirs, files in os.walk(folder):
+        dirs.sort(key=str.lower)
+        for file in sorted(files, key=str.lower):
+            yield os.path.join(root, file)
+
+
+def find_roms(
+    paths: typing.Iterable[str], exclude: typing.Iterable[str] = ()
+) -> typing.Iterator[ImportedRom]:
+    """The ROMs among paths and in the folders among them, every file once and none of exclude."""
+    seen = {path_key(path) for path in exclude}
+    for path in paths:
+        for file in _walk(path) if os.path.isdir(path) else (path,):
+            key = path_key(file)
+            if key in seen or not is_rom(file) or not os.path.isfile(file):
+                continue
+            seen.add(key)
+            yield ImportedRom(file, title_of(file))
+
+
+def batches(
+    roms: typing.Iterable[ImportedRom], size: int = BATCH_SIZE
+) -> typing.Iterator[list[ImportedRom]]:
+    batch = []
+    for rom in roms:
+        batch.append(rom)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def is_bulk(paths: typing.Sequence[str]) -> bool:
+    """Whether a drop is imported in bulk, a single ROM file is still added with the dialog."""
+    return len(paths) > 1 or any(os.path.isdir(path) for path in paths)
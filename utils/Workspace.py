@@ -0,0 +1,54 @@
+# coding=utf-8
+# Paths of a build. The workspace holds everything a build writes (patched games, builder config, log, output),
+# the resource root the assets it reads (menu ROM, emulators, SRAM IPS patches). Builds in different workspaces
+# don't share any file, so they can run at the same time without changing the working directory.
+import contextlib
+import dataclasses
+import os
+import shutil
+import tempfile
+
+
+@dataclasses.dataclass(frozen=True)
+class Workspace:
+    root: str = "."
+    resource_root: str = "."
+
+    def path(self, *names: str) -> str:
+        return os.path.normpath(os.path.join(self.root, *names))
+
+    def resource(self, *names: str) -> str:
+        return os.path.normpath(os.path.join(self.resource_root, *names))
+
+    def output(self, output: str) -> str:
+        # Relative output names are placed in the workspace, absolute paths are kept.
+        return output if os.path.isabs(output) else self.path(output)
+
+    @property
+    def menu_rom(self) -> str:
+        return self.resource("lk_multimenu.gba")
+
+    @property
+    def background(self) -> str:
+        # The default background, used if it exists and no other is chosen.
+        return self.resource("bg.png")
+
+    @property
+    def sram_ips_dir(self) -> str:
+        return self.resource("sram_ips")
+
+    def emulator(self, file_name: str) -> str:
+        return self.resource("emulator", file_name)
+
+    @classmethod
+    @contextlib.contextmanager
+    def temporary(cls, resource_root: str = "."):
+        """A workspace in a new temporary directory, removed with everything in it on exit."""
+        root = tempfile.mkdtemp(prefix="lk_multimenu_")
+        try:
+            yield cls(root, os.path.abspath(resource_root))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+DEFAULT_WORKSPACE = Workspace()